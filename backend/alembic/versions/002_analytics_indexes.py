@@ -0,0 +1,40 @@
+"""Analytics hot path indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sales by day / growth rate range scans. On PostgreSQL the INCLUDE column
+    # lets SUM(total_amount) run as an index-only scan.
+    op.create_index('idx_sales_created_at', 'sales', ['created_at'], unique=False,
+                    postgresql_include=['total_amount'])
+
+    # Top products: join on sale_id, group by product_name
+    op.create_index('idx_sale_items_sale_product', 'sale_items', ['sale_id', 'product_name'], unique=False,
+                    postgresql_include=['quantity', 'total_price'])
+
+    # Expense breakdown and monthly trends: filter on date, group by category
+    op.create_index('idx_expenses_date_category', 'expenses', ['date', 'category'], unique=False,
+                    postgresql_include=['amount'])
+
+    # Weekly schedules and payroll: filter on date, group by employee
+    op.create_index('idx_schedules_date_employee', 'schedules', ['date', 'employee_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_schedules_date_employee', table_name='schedules')
+    op.drop_index('idx_expenses_date_category', table_name='expenses')
+    op.drop_index('idx_sale_items_sale_product', table_name='sale_items')
+    op.drop_index('idx_sales_created_at', table_name='sales')
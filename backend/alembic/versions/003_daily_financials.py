@@ -0,0 +1,52 @@
+"""Daily financial rollup
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_financials',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.Column('expenses', sa.Float(), nullable=False),
+        sa.Column('sales_count', sa.Integer(), nullable=False),
+        sa.Column('expense_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('day', 'category', name='uq_daily_financials_day_category')
+    )
+    op.create_index(op.f('ix_daily_financials_id'), 'daily_financials', ['id'], unique=False)
+
+    # Backfill from existing history. Expense categories are stored as enum
+    # names (RENT, ...) and booked under their lower-case values.
+    op.execute("""
+        INSERT INTO daily_financials (day, category, revenue, expenses, sales_count, expense_count)
+        SELECT DATE(created_at), 'sales', SUM(total_amount), 0, COUNT(id), 0
+        FROM sales
+        WHERE created_at IS NOT NULL
+        GROUP BY DATE(created_at)
+    """)
+    op.execute("""
+        INSERT INTO daily_financials (day, category, revenue, expenses, sales_count, expense_count)
+        SELECT DATE(date), LOWER(CAST(category AS VARCHAR(50))), 0, SUM(amount), 0, COUNT(id)
+        FROM expenses
+        GROUP BY DATE(date), LOWER(CAST(category AS VARCHAR(50)))
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_daily_financials_id'), table_name='daily_financials')
+    op.drop_table('daily_financials')
@@ -0,0 +1,26 @@
+"""Client receipt id on sales for idempotent bulk uploads
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('sales', sa.Column('receipt_id', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_sales_receipt_id'), 'sales', ['receipt_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_sales_receipt_id'), table_name='sales')
+    with op.batch_alter_table('sales') as batch_op:
+        batch_op.drop_column('receipt_id')
@@ -0,0 +1,39 @@
+"""Keyset pagination indexes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Listings page on (sort key, id) row comparisons, which need both
+    # columns in one index to seek straight to the cursor position.
+    op.drop_index('idx_sales_created_at', table_name='sales')
+    op.create_index('idx_sales_created_at', 'sales', ['created_at', 'id'], unique=False,
+                    postgresql_include=['total_amount'])
+
+    op.create_index('idx_expenses_date_id', 'expenses', ['date', 'id'], unique=False)
+    op.create_index('idx_inventory_items_name_id', 'inventory_items', ['name', 'id'], unique=False)
+    op.create_index('idx_employees_full_name_id', 'employees', ['full_name', 'id'], unique=False)
+    op.create_index('idx_chat_messages_created_at_id', 'chat_messages', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_chat_messages_created_at_id', table_name='chat_messages')
+    op.drop_index('idx_employees_full_name_id', table_name='employees')
+    op.drop_index('idx_inventory_items_name_id', table_name='inventory_items')
+    op.drop_index('idx_expenses_date_id', table_name='expenses')
+
+    op.drop_index('idx_sales_created_at', table_name='sales')
+    op.create_index('idx_sales_created_at', 'sales', ['created_at'], unique=False,
+                    postgresql_include=['total_amount'])
@@ -0,0 +1,44 @@
+"""Daily product sales counters
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_product_sales',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('product_name', sa.String(length=100), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.Column('error', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('day', 'product_name', name='uq_daily_product_sales_day_product')
+    )
+    op.create_index(op.f('ix_daily_product_sales_id'), 'daily_product_sales', ['id'], unique=False)
+
+    # Backfill exact counters from existing history
+    op.execute("""
+        INSERT INTO daily_product_sales (day, product_name, quantity, revenue, error)
+        SELECT DATE(s.created_at), si.product_name, SUM(si.quantity), SUM(si.total_price), 0
+        FROM sale_items si
+        JOIN sales s ON s.id = si.sale_id
+        WHERE s.created_at IS NOT NULL
+        GROUP BY DATE(s.created_at), si.product_name
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_daily_product_sales_id'), table_name='daily_product_sales')
+    op.drop_table('daily_product_sales')
@@ -0,0 +1,45 @@
+"""Sale item product foreign key
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batch mode so SQLite can add the foreign key
+    with op.batch_alter_table('sale_items') as batch_op:
+        batch_op.add_column(sa.Column('product_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_sale_items_product_id', 'inventory_items', ['product_id'], ['id'], ondelete='SET NULL'
+        )
+
+    # Backfill by name; duplicate names resolve to the oldest item and
+    # names with no inventory item stay NULL
+    op.execute("""
+        UPDATE sale_items
+        SET product_id = (
+            SELECT MIN(inventory_items.id) FROM inventory_items
+            WHERE inventory_items.name = sale_items.product_name
+        )
+        WHERE product_id IS NULL
+    """)
+
+    op.create_index('idx_sale_items_product_sale', 'sale_items', ['product_id', 'sale_id'],
+                    postgresql_include=['quantity'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sale_items_product_sale', table_name='sale_items')
+    with op.batch_alter_table('sale_items') as batch_op:
+        batch_op.drop_constraint('fk_sale_items_product_id', type_='foreignkey')
+        batch_op.drop_column('product_id')
@@ -0,0 +1,81 @@
+"""Inventory search index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.search import normalize_search_text
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+SEARCH_FIELDS = ('name', 'sku', 'barcode', 'supplier', 'description')
+BACKFILL_CHUNK = 5000
+
+
+def upgrade() -> None:
+    op.add_column('inventory_items', sa.Column('search_text', sa.Text(), nullable=True))
+
+    # Backfill the folded text in Python, Greek accent folding has no portable SQL
+    bind = op.get_bind()
+    items = sa.table('inventory_items', sa.column('id'), sa.column('search_text'),
+                     *[sa.column(field) for field in SEARCH_FIELDS])
+    rows = bind.execute(sa.select(items.c.id, *[items.c[field] for field in SEARCH_FIELDS])).all()
+    update = items.update().where(items.c.id == sa.bindparam('item_id')).values(
+        search_text=sa.bindparam('folded')
+    )
+    for start in range(0, len(rows), BACKFILL_CHUNK):
+        bind.execute(update, [
+            {
+                'item_id': row.id,
+                'folded': ' '.join(filter(None, (normalize_search_text(getattr(row, field)) for field in SEARCH_FIELDS)))
+            }
+            for row in rows[start:start + BACKFILL_CHUNK]
+        ])
+
+    if bind.dialect.name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE inventory_items_fts USING fts5("
+            "search_text, content='inventory_items', content_rowid='id', prefix='1 2 3')"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_items_fts_ai AFTER INSERT ON inventory_items BEGIN "
+            "INSERT INTO inventory_items_fts(rowid, search_text) VALUES (new.id, new.search_text); END"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_items_fts_ad AFTER DELETE ON inventory_items BEGIN "
+            "INSERT INTO inventory_items_fts(inventory_items_fts, rowid, search_text) "
+            "VALUES ('delete', old.id, old.search_text); END"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_items_fts_au AFTER UPDATE OF search_text ON inventory_items BEGIN "
+            "INSERT INTO inventory_items_fts(inventory_items_fts, rowid, search_text) "
+            "VALUES ('delete', old.id, old.search_text); "
+            "INSERT INTO inventory_items_fts(rowid, search_text) VALUES (new.id, new.search_text); END"
+        )
+        op.execute("INSERT INTO inventory_items_fts(inventory_items_fts) VALUES ('rebuild')")
+    elif bind.dialect.name == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX idx_inventory_items_search_trgm ON inventory_items "
+            "USING gin (search_text gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for trigger in ('inventory_items_fts_ai', 'inventory_items_fts_ad', 'inventory_items_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS inventory_items_fts")
+    elif bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_inventory_items_search_trgm")
+    with op.batch_alter_table('inventory_items') as batch_op:
+        batch_op.drop_column('search_text')
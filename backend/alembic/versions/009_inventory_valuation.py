@@ -0,0 +1,94 @@
+"""Inventory valuation per category
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+VALUATION_COLUMNS = 'current_stock, unit_cost, selling_price, category'
+
+
+def _valuation_upsert(row: str, sign: str) -> str:
+    stock = f"COALESCE({row}.current_stock, 0)"
+    return (
+        "INSERT INTO inventory_valuation (category, item_count, total_quantity, cost_value, retail_value) "
+        f"VALUES (COALESCE({row}.category, ''), {sign}1, {sign}{stock}, "
+        f"{sign}{stock} * COALESCE({row}.unit_cost, 0), {sign}{stock} * COALESCE({row}.selling_price, 0)) "
+        "ON CONFLICT (category) DO UPDATE SET "
+        "item_count = inventory_valuation.item_count + excluded.item_count, "
+        "total_quantity = inventory_valuation.total_quantity + excluded.total_quantity, "
+        "cost_value = inventory_valuation.cost_value + excluded.cost_value, "
+        "retail_value = inventory_valuation.retail_value + excluded.retail_value"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        'inventory_valuation',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False),
+        sa.Column('total_quantity', sa.Integer(), nullable=False),
+        sa.Column('cost_value', sa.Float(), nullable=False),
+        sa.Column('retail_value', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('category', name='uq_inventory_valuation_category')
+    )
+    op.create_index(op.f('ix_inventory_valuation_id'), 'inventory_valuation', ['id'], unique=False)
+
+    # Backfill from the current items
+    op.execute(
+        "INSERT INTO inventory_valuation (category, item_count, total_quantity, cost_value, retail_value) "
+        "SELECT COALESCE(category, ''), COUNT(id), SUM(COALESCE(current_stock, 0)), "
+        "SUM(COALESCE(current_stock, 0) * COALESCE(unit_cost, 0)), "
+        "SUM(COALESCE(current_stock, 0) * COALESCE(selling_price, 0)) "
+        "FROM inventory_items GROUP BY COALESCE(category, '')"
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        op.execute(
+            "CREATE TRIGGER inventory_valuation_ai AFTER INSERT ON inventory_items BEGIN "
+            f"{_valuation_upsert('new', '')}; END"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_valuation_ad AFTER DELETE ON inventory_items BEGIN "
+            f"{_valuation_upsert('old', '-')}; END"
+        )
+        op.execute(
+            f"CREATE TRIGGER inventory_valuation_au AFTER UPDATE OF {VALUATION_COLUMNS} ON inventory_items BEGIN "
+            f"{_valuation_upsert('old', '-')}; {_valuation_upsert('new', '')}; END"
+        )
+    elif bind.dialect.name == 'postgresql':
+        op.execute(
+            "CREATE OR REPLACE FUNCTION inventory_valuation_sync() RETURNS trigger AS $$ BEGIN "
+            f"IF TG_OP IN ('UPDATE', 'DELETE') THEN {_valuation_upsert('OLD', '-')}; END IF; "
+            f"IF TG_OP IN ('INSERT', 'UPDATE') THEN {_valuation_upsert('NEW', '')}; END IF; "
+            "RETURN NULL; END $$ LANGUAGE plpgsql"
+        )
+        op.execute(
+            f"CREATE TRIGGER inventory_valuation_sync AFTER INSERT OR DELETE OR UPDATE OF {VALUATION_COLUMNS} "
+            "ON inventory_items FOR EACH ROW EXECUTE FUNCTION inventory_valuation_sync()"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        for trigger in ('inventory_valuation_ai', 'inventory_valuation_ad', 'inventory_valuation_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    elif bind.dialect.name == 'postgresql':
+        op.execute("DROP TRIGGER IF EXISTS inventory_valuation_sync ON inventory_items")
+        op.execute("DROP FUNCTION IF EXISTS inventory_valuation_sync()")
+    op.drop_index(op.f('ix_inventory_valuation_id'), table_name='inventory_valuation')
+    op.drop_table('inventory_valuation')
@@ -0,0 +1,56 @@
+"""Persistent stock alerts
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('stock_alerts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.String(length=100), nullable=False),
+        sa.Column('product_name', sa.String(length=200), nullable=False),
+        sa.Column('alert_type', sa.String(length=30), nullable=False),
+        sa.Column('urgency', sa.String(length=20), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('current_stock', sa.Integer(), nullable=False),
+        sa.Column('threshold', sa.Integer(), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('occurrences', sa.Integer(), nullable=False),
+        sa.Column('predicted_stockout_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('recommended_order_quantity', sa.Integer(), nullable=True),
+        sa.Column('cost_impact', sa.Float(), nullable=True),
+        sa.Column('acknowledged_by', sa.String(length=100), nullable=True),
+        sa.Column('acknowledged_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('dismissed_by', sa.String(length=100), nullable=True),
+        sa.Column('dismissed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('resolved_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_stock_alerts_id'), 'stock_alerts', ['id'], unique=False)
+    op.create_index('idx_stock_alerts_status_urgency_product', 'stock_alerts',
+                    ['status', 'urgency', 'product_id'], unique=False)
+    op.create_index('idx_stock_alerts_created_at', 'stock_alerts', ['created_at'], unique=False)
+    open_alerts = sa.text("status IN ('active', 'acknowledged')")
+    op.create_index('uq_stock_alerts_open_product_type', 'stock_alerts', ['product_id', 'alert_type'],
+                    unique=True, sqlite_where=open_alerts, postgresql_where=open_alerts)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_stock_alerts_open_product_type', table_name='stock_alerts')
+    op.drop_index('idx_stock_alerts_created_at', table_name='stock_alerts')
+    op.drop_index('idx_stock_alerts_status_urgency_product', table_name='stock_alerts')
+    op.drop_index(op.f('ix_stock_alerts_id'), table_name='stock_alerts')
+    op.drop_table('stock_alerts')
@@ -0,0 +1,46 @@
+"""Daily stock alert history partitions
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('stock_alerts', sa.Column('day', sa.Date(), nullable=True))
+    op.execute("UPDATE stock_alerts SET day = DATE(created_at)")
+    with op.batch_alter_table('stock_alerts') as batch_op:
+        batch_op.alter_column('day', existing_type=sa.Date(), nullable=False)
+
+    op.drop_index('idx_stock_alerts_created_at', table_name='stock_alerts')
+    op.create_index('idx_stock_alerts_day_created_at', 'stock_alerts', ['day', 'created_at'], unique=False)
+
+    op.create_table('stock_alert_daily_summary',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('alert_type', sa.String(length=30), nullable=False),
+        sa.Column('urgency', sa.String(length=20), nullable=False),
+        sa.Column('alert_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('day', 'alert_type', 'urgency', name='uq_stock_alert_daily_summary_day_type_urgency')
+    )
+    op.create_index(op.f('ix_stock_alert_daily_summary_id'), 'stock_alert_daily_summary', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_stock_alert_daily_summary_id'), table_name='stock_alert_daily_summary')
+    op.drop_table('stock_alert_daily_summary')
+
+    op.drop_index('idx_stock_alerts_day_created_at', table_name='stock_alerts')
+    op.create_index('idx_stock_alerts_created_at', 'stock_alerts', ['created_at'], unique=False)
+    with op.batch_alter_table('stock_alerts') as batch_op:
+        batch_op.drop_column('day')
@@ -0,0 +1,31 @@
+"""Normalize SQLite sale and chat timestamps
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+PAGINATED_TABLES = ('sales', 'chat_messages')
+
+
+def upgrade() -> None:
+    # CURRENT_TIMESTAMP rows have no fraction while app-written rows do; as
+    # text those of the same second compare unequal, which stalls keyset
+    # cursors on (created_at, id). Other dialects store real timestamps.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table in PAGINATED_TABLES:
+        op.execute(f"UPDATE {table} SET created_at = created_at || '.000000' WHERE length(created_at) = 19")
+
+
+def downgrade() -> None:
+    # The fraction is harmless to older revisions
+    pass
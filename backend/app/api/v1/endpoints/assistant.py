@@ -1,34 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.core.database import get_db
+from app.core.pagination import set_next_cursor
 from app.schemas.assistant import ChatRequest, ChatResponse
-from app.services.assistant_service import AssistantService
+from app.services.assistant_service import AssistantService, CHAT_PAGE_KEYS
 
 router = APIRouter()
 
 @router.post("/chat")
-async def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db)):
+def chat_with_assistant(request: ChatRequest, db: Session = Depends(get_db)):
     assistant_service = AssistantService(db)
     return assistant_service.create_chat_message(request)
 
 @router.get("/suggestions")
-async def get_suggestions(db: Session = Depends(get_db)):
+def get_suggestions(db: Session = Depends(get_db)):
     assistant_service = AssistantService(db)
     return assistant_service.get_suggested_questions()
 
 @router.get("/business-summary")
-async def get_business_summary(db: Session = Depends(get_db)):
+def get_business_summary(db: Session = Depends(get_db)):
     assistant_service = AssistantService(db)
     return assistant_service.get_business_summary()
 
 @router.get("/chat/history")
-async def get_chat_history(skip: int = 0, limit: int = 50, db: Session = Depends(get_db)):
+def get_chat_history(response: Response, skip: int = 0, limit: int = 50,
+                     cursor: Optional[str] = None, db: Session = Depends(get_db)):
     assistant_service = AssistantService(db)
-    return assistant_service.get_chat_history(skip, limit)
+    try:
+        messages = assistant_service.get_chat_history(skip, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor(response, messages, limit, CHAT_PAGE_KEYS)
+    return messages
 
 @router.delete("/chat/history")
-async def clear_chat_history(db: Session = Depends(get_db)):
+def clear_chat_history(db: Session = Depends(get_db)):
     assistant_service = AssistantService(db)
     # Clear all chat messages
     messages = assistant_service.get_chat_history(0, 1000)
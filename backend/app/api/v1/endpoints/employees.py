@@ -1,24 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.core.database import get_db
+from app.core.pagination import set_next_cursor
 from app.schemas.employee import EmployeeCreate, EmployeeResponse, ScheduleCreate, ScheduleResponse
-from app.services.employee_service import EmployeeService
+from app.services.employee_service import EmployeeService, EMPLOYEE_PAGE_KEYS
 
 router = APIRouter()
 
 @router.post("/", response_model=EmployeeResponse)
-async def create_employee(employee: EmployeeCreate, db: Session = Depends(get_db)):
+def create_employee(employee: EmployeeCreate, db: Session = Depends(get_db)):
     employee_service = EmployeeService(db)
     return employee_service.create_employee(employee)
 
 @router.get("/", response_model=List[EmployeeResponse])
-async def get_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_employees(response: Response, skip: int = 0, limit: int = 100,
+                  cursor: Optional[str] = None, db: Session = Depends(get_db)):
     employee_service = EmployeeService(db)
-    return employee_service.get_employees(skip, limit)
+    try:
+        employees = employee_service.get_employees(skip, limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor(response, employees, limit, EMPLOYEE_PAGE_KEYS)
+    return employees
 
 @router.get("/{employee_id}", response_model=EmployeeResponse)
-async def get_employee(employee_id: int, db: Session = Depends(get_db)):
+def get_employee(employee_id: int, db: Session = Depends(get_db)):
     employee_service = EmployeeService(db)
     employee = employee_service.get_employee(employee_id)
     if not employee:
@@ -26,16 +33,16 @@ async def get_employee(employee_id: int, db: Session = Depends(get_db)):
     return employee
 
 @router.post("/schedule", response_model=ScheduleResponse)
-async def create_schedule(schedule: ScheduleCreate, db: Session = Depends(get_db)):
+def create_schedule(schedule: ScheduleCreate, db: Session = Depends(get_db)):
     employee_service = EmployeeService(db)
     return employee_service.create_schedule(schedule)
 
 @router.get("/schedule/generate")
-async def generate_schedule(week_start: str, db: Session = Depends(get_db)):
+def generate_schedule(week_start: str, db: Session = Depends(get_db)):
     employee_service = EmployeeService(db)
     return employee_service.generate_smart_schedule(week_start)
 
 @router.get("/schedule/{week_start}")
-async def get_schedule(week_start: str, db: Session = Depends(get_db)):
+def get_schedule(week_start: str, db: Session = Depends(get_db)):
     employee_service = EmployeeService(db)
     return employee_service.get_schedule(week_start)
\ No newline at end of file
@@ -1,82 +1,104 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
+from app.core.pagination import set_next_cursor
 from app.schemas.finance import ExpenseCreate, ExpenseResponse, FinancialReport
-from app.services.finance_service import FinanceService
+from app.services.finance_service import FinanceService, AsyncFinanceService, CASH_FLOW_GRANULARITIES, EXPENSE_PAGE_KEYS
+from app.services.financial_rollup_service import FinancialRollupService
 
 router = APIRouter()
 
 @router.post("/expenses", response_model=ExpenseResponse)
-async def create_expense(expense: ExpenseCreate, db: Session = Depends(get_db)):
-    finance_service = FinanceService(db)
-    return finance_service.create_expense(expense)
+async def create_expense(expense: ExpenseCreate, db: AsyncSession = Depends(get_async_db)):
+    finance_service = AsyncFinanceService(db)
+    return await finance_service.create_expense(expense)
 
 @router.get("/expenses", response_model=List[ExpenseResponse])
 async def get_expenses(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     category: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    finance_service = FinanceService(db)
-    return finance_service.get_expenses(skip, limit, start_date, end_date, category)
+    finance_service = AsyncFinanceService(db)
+    try:
+        expenses = await finance_service.get_expenses(skip, limit, start_date, end_date, category, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor(response, expenses, limit, EXPENSE_PAGE_KEYS)
+    return expenses
 
 @router.get("/categories")
-async def get_expense_categories(db: Session = Depends(get_db)):
-    finance_service = FinanceService(db)
-    return finance_service.get_expense_categories()
+async def get_expense_categories(db: AsyncSession = Depends(get_async_db)):
+    finance_service = AsyncFinanceService(db)
+    return await finance_service.get_expense_categories()
 
 @router.get("/summary")
 async def get_financial_summary(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    finance_service = FinanceService(db)
+    finance_service = AsyncFinanceService(db)
     if not start_date or not end_date:
         from datetime import datetime, timedelta
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
     
-    return finance_service.get_financial_summary(start_date, end_date)
+    return await finance_service.get_financial_summary(start_date, end_date)
 
 @router.get("/cash-flow")
 async def get_cash_flow_analysis(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    granularity: str = "daily",
+    db: AsyncSession = Depends(get_async_db)
 ):
-    finance_service = FinanceService(db)
+    finance_service = AsyncFinanceService(db)
+    if granularity not in CASH_FLOW_GRANULARITIES:
+        raise HTTPException(status_code=400, detail="Granularity must be 'daily', 'weekly' or 'monthly'")
+    
     if not start_date or not end_date:
         from datetime import datetime, timedelta
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
     
-    return finance_service.get_cash_flow_analysis(start_date, end_date)
+    return await finance_service.get_cash_flow_analysis(start_date, end_date, granularity)
 
 @router.get("/insights")
 async def get_financial_insights(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    finance_service = FinanceService(db)
+    finance_service = AsyncFinanceService(db)
     if not start_date or not end_date:
         from datetime import datetime, timedelta
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
     
-    return finance_service.get_financial_insights(start_date, end_date)
+    return await finance_service.get_financial_insights(start_date, end_date)
+
+@router.post("/rollup/rebuild")
+def rebuild_financial_rollup(db: Session = Depends(get_db)):
+    rollup_service = FinancialRollupService(db)
+    return rollup_service.rebuild()
 
+# Report rendering is CPU bound, so this stays a sync endpoint and the body is
+# generated in the threadpool while it streams
 @router.get("/export")
-async def export_financial_report(
+def export_financial_report(
     format: str,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    include_ledger: bool = False,
     db: Session = Depends(get_db)
 ):
     finance_service = FinanceService(db)
@@ -88,19 +110,19 @@ async def export_financial_report(
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
     
-    from fastapi.responses import Response
+    from fastapi.responses import StreamingResponse
     
-    report_data = finance_service.export_financial_report(format, start_date, end_date)
+    report_stream = finance_service.stream_financial_report(format, start_date, end_date, include_ledger)
     
     if format == "pdf":
-        return Response(
-            content=report_data,
+        return StreamingResponse(
+            report_stream,
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename=financial-report.pdf"}
         )
     else:
-        return Response(
-            content=report_data,
+        return StreamingResponse(
+            report_stream,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": f"attachment; filename=financial-report.xlsx"}
-        )
\ No newline at end of file
+        )
@@ -1,82 +1,150 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.database import get_db
-from app.schemas.inventory import InventoryCreate, InventoryResponse, InventoryUpdate
-from app.services.inventory_service import InventoryService
+from app.core.database import get_db, get_async_db
+from app.core.pagination import set_next_cursor
+from app.schemas.inventory import InventoryCreate, InventoryResponse, InventoryUpdate, StockBatchUpdate, StockBatchResult
+from app.services.inventory_service import InventoryService, AsyncInventoryService, ITEM_PAGE_KEYS
+from app.services.inventory_valuation_service import InventoryValuationService
+from app.services.item_lookup_cache import item_lookup_cache
+from app.services.forecasting import FORECAST_ENGINES
 
 router = APIRouter()
 
 @router.post("/", response_model=InventoryResponse)
-async def create_inventory_item(item: InventoryCreate, db: Session = Depends(get_db)):
-    inventory_service = InventoryService(db)
-    return inventory_service.create_item(item)
+async def create_inventory_item(item: InventoryCreate, db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    return await inventory_service.create_item(item)
 
 @router.get("/", response_model=List[InventoryResponse])
 async def get_inventory(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     category: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    inventory_service = InventoryService(db)
-    return inventory_service.get_items(skip, limit, category, search)
+    inventory_service = AsyncInventoryService(db)
+    try:
+        items = await inventory_service.get_items(skip, limit, category, search, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Search results are ranked, so they page by skip instead of a cursor
+    if not search:
+        set_next_cursor(response, items, limit, ITEM_PAGE_KEYS)
+    return items
 
 @router.get("/categories")
-async def get_categories(db: Session = Depends(get_db)):
-    inventory_service = InventoryService(db)
-    return inventory_service.get_categories()
+async def get_categories(db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    return await inventory_service.get_categories()
 
 @router.get("/low-stock")
-async def get_low_stock_items(db: Session = Depends(get_db)):
-    inventory_service = InventoryService(db)
-    return inventory_service.get_low_stock_items()
+async def get_low_stock_items(db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    return await inventory_service.get_low_stock_items()
 
 @router.get("/value")
-async def get_inventory_value(db: Session = Depends(get_db)):
-    inventory_service = InventoryService(db)
-    return inventory_service.get_inventory_value()
+async def get_inventory_value(db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    return await inventory_service.get_inventory_value()
+
+@router.post("/value/reconcile")
+def reconcile_inventory_value(fix: bool = True, db: Session = Depends(get_db)):
+    valuation_service = InventoryValuationService(db)
+    return valuation_service.reconcile(fix=fix)
+
+@router.get("/sku/{sku}", response_model=InventoryResponse)
+async def get_item_by_sku(sku: str, db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    item = await inventory_service.get_item_by_sku(sku)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
+
+@router.get("/barcode/{barcode}", response_model=InventoryResponse)
+async def get_item_by_barcode(barcode: str, db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    item = await inventory_service.get_item_by_barcode(barcode)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
 
+@router.get("/lookup-cache/stats")
+async def get_lookup_cache_stats():
+    return item_lookup_cache.stats()
+
+@router.get("/slow-moving")
+async def get_slow_moving_items(
+    days: List[int] = Query([30, 60, 90]),
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_async_db)
+):
+    inventory_service = AsyncInventoryService(db)
+    try:
+        return await inventory_service.get_slow_moving_items(days, skip, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+# Forecasting endpoints are CPU bound, so they stay sync and run in the threadpool
 @router.get("/reorder-suggestions")
-async def get_reorder_suggestions(db: Session = Depends(get_db)):
+def get_reorder_suggestions(engine: Optional[str] = None, db: Session = Depends(get_db)):
     inventory_service = InventoryService(db)
-    return inventory_service.get_reorder_suggestions()
+    if engine and engine not in FORECAST_ENGINES:
+        raise HTTPException(status_code=400, detail=f"Engine must be one of: {', '.join(FORECAST_ENGINES)}")
+    return inventory_service.get_reorder_suggestions(engine=engine)
 
 @router.get("/forecast/{item_id}")
-async def get_demand_forecast(item_id: int, days: int = 30, db: Session = Depends(get_db)):
+def get_demand_forecast(item_id: int, days: int = 30, engine: Optional[str] = None,
+                        db: Session = Depends(get_db)):
     inventory_service = InventoryService(db)
-    return inventory_service.forecast_demand(item_id, days)
+    if engine and engine not in FORECAST_ENGINES:
+        raise HTTPException(status_code=400, detail=f"Engine must be one of: {', '.join(FORECAST_ENGINES)}")
+    return inventory_service.forecast_demand(item_id, days, engine=engine)
 
 @router.post("/{item_id}/stock")
 async def update_stock(
     item_id: int,
     quantity_change: int,
     operation: str = "add",
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    inventory_service = InventoryService(db)
-    updated_item = inventory_service.update_stock(item_id, quantity_change, operation)
+    inventory_service = AsyncInventoryService(db)
+    try:
+        updated_item = await inventory_service.update_stock(item_id, quantity_change, operation)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not updated_item:
         raise HTTPException(status_code=404, detail="Item not found")
     return updated_item
 
+@router.post("/stock/batch", response_model=StockBatchResult)
+async def update_stock_batch(batch: StockBatchUpdate, db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    return await inventory_service.update_stock_batch(
+        (adjustment.sku, adjustment.quantity_change) for adjustment in batch.items
+    )
+
 @router.put("/{item_id}", response_model=InventoryResponse)
 async def update_inventory_item(
     item_id: int,
     item: InventoryUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    inventory_service = InventoryService(db)
-    updated_item = inventory_service.update_item(item_id, item)
+    inventory_service = AsyncInventoryService(db)
+    updated_item = await inventory_service.update_item(item_id, item)
     if not updated_item:
         raise HTTPException(status_code=404, detail="Item not found")
     return updated_item
 
 @router.delete("/{item_id}")
-async def delete_inventory_item(item_id: int, db: Session = Depends(get_db)):
-    inventory_service = InventoryService(db)
-    deleted = inventory_service.delete_item(item_id)
+async def delete_inventory_item(item_id: int, db: AsyncSession = Depends(get_async_db)):
+    inventory_service = AsyncInventoryService(db)
+    deleted = await inventory_service.delete_item(item_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Item not found")
-    return {"message": "Item deleted successfully"}
\ No newline at end of file
+    return {"message": "Item deleted successfully"}
@@ -1,50 +1,93 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, timedelta
-from app.core.database import get_db
-from app.schemas.sales import SaleCreate, SaleResponse, SalesAnalytics
-from app.services.sales_service import SalesService
+from app.core.database import get_db, get_async_db
+from app.core.pagination import set_next_cursor
+from app.schemas.sales import SaleCreate, SaleResponse, SalesAnalytics, SaleBulkResult
+from app.services.sales_service import SalesService, AsyncSalesService, SALE_PAGE_KEYS
+from app.services.forecasting import FORECAST_ENGINES
+from app.services.sales_import import BULK_CONTENT_TYPES, BULK_FORMATS
+from app.services.product_rollup_service import ProductSalesRollupService
 
 router = APIRouter()
 
 @router.post("/", response_model=SaleResponse)
-async def create_sale(sale: SaleCreate, db: Session = Depends(get_db)):
-    sales_service = SalesService(db)
-    return sales_service.create_sale(sale)
+async def create_sale(sale: SaleCreate, db: AsyncSession = Depends(get_async_db)):
+    sales_service = AsyncSalesService(db)
+    return await sales_service.create_sale(sale)
+
+@router.post("/bulk", response_model=SaleBulkResult)
+async def bulk_create_sales(
+    request: Request,
+    format: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Upload POS receipts as JSON Lines or CSV, one receipt_id per sale.
+
+    The format comes from ``format`` or the Content-Type header
+    (application/x-ndjson or text/csv). Re-sent receipts are skipped.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    format = format or BULK_CONTENT_TYPES.get(content_type, "jsonl")
+    if format not in BULK_FORMATS:
+        raise HTTPException(status_code=400, detail="Format must be 'jsonl' or 'csv'")
+    
+    sales_service = AsyncSalesService(db)
+    try:
+        return await sales_service.bulk_create_sales(request.stream(), format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/", response_model=List[SaleResponse])
 async def get_sales(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
 ):
-    sales_service = SalesService(db)
-    return sales_service.get_sales(skip, limit, start_date, end_date)
+    sales_service = AsyncSalesService(db)
+    try:
+        sales = await sales_service.get_sales(skip, limit, start_date, end_date, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor(response, sales, limit, SALE_PAGE_KEYS)
+    return sales
 
 @router.get("/analytics")
 async def get_sales_analytics(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    sales_service = SalesService(db)
-    return sales_service.get_sales_analytics(start_date, end_date)
+    sales_service = AsyncSalesService(db)
+    return await sales_service.get_sales_analytics(start_date, end_date)
 
+# Model fitting is CPU bound, so this stays a sync endpoint and runs in the threadpool
 @router.get("/forecast")
-async def get_sales_forecast(
+def get_sales_forecast(
     days: int = 7,
+    engine: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     sales_service = SalesService(db)
-    return sales_service.forecast_sales(days)
+    if engine and engine not in FORECAST_ENGINES:
+        raise HTTPException(status_code=400, detail=f"Engine must be one of: {', '.join(FORECAST_ENGINES)}")
+    return sales_service.forecast_sales(days, engine=engine)
+
+@router.post("/top-products/rebuild")
+def rebuild_top_products(db: Session = Depends(get_db)):
+    rollup_service = ProductSalesRollupService(db)
+    return rollup_service.rebuild()
 
 @router.get("/{sale_id}", response_model=SaleResponse)
-async def get_sale(sale_id: int, db: Session = Depends(get_db)):
-    sales_service = SalesService(db)
-    sale = sales_service.get_sale(sale_id)
+async def get_sale(sale_id: int, db: AsyncSession = Depends(get_async_db)):
+    sales_service = AsyncSalesService(db)
+    sale = await sales_service.get_sale(sale_id)
     if not sale:
         raise HTTPException(status_code=404, detail="Sale not found")
-    return sale
\ No newline at end of file
+    return sale
@@ -3,8 +3,11 @@ Stock Alerts API Endpoints for BusinessPilot AI
 Real-time inventory monitoring and intelligent stock predictions
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from typing import List, Optional, Dict, Any
+import asyncio
+import json
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 from enum import Enum
@@ -13,6 +16,11 @@ from app.services.stock_alerts_service import stock_alerts_service, AlertUrgency
 
 router = APIRouter()
 
+# Endpoints that read or write the alert store are sync, so they run in the threadpool
+
+# Seconds between SSE keep-alive comments when no alert is pushed
+STREAM_KEEPALIVE_SECONDS = 15
+
 class AlertUrgencyEnum(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -38,15 +46,19 @@ class UpdateStockRequest(BaseModel):
     current_stock: int = Field(..., description="Current stock level")
     location: Optional[str] = Field(None, description="Storage location")
 
+class BatchStockUpdateRequest(BaseModel):
+    updates: List[UpdateStockRequest] = Field(..., min_length=1, description="Stock updates")
+
 class AlertSettingsRequest(BaseModel):
     enable_low_stock: bool = Field(default=True, description="Enable low stock alerts")
     enable_overstock: bool = Field(default=True, description="Enable overstock alerts")
     enable_expiry: bool = Field(default=True, description="Enable expiry warnings")
     alert_frequency: str = Field(default="immediate", description="Alert frequency")
     notification_channels: List[str] = Field(default=["email"], description="Notification channels")
+    business_hours_only: bool = Field(default=False, description="Only run scheduled checks in business hours")
 
 @router.get("/alerts")
-async def get_stock_alerts(
+def get_stock_alerts(
     urgency: Optional[AlertUrgencyEnum] = None,
     alert_type: Optional[AlertTypeEnum] = None,
     limit: int = 50
@@ -70,8 +82,50 @@ async def get_stock_alerts(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/alerts/stream")
+async def stream_stock_alerts(request: Request) -> StreamingResponse:
+    """
+    Server-sent events stream of opened and escalated stock alerts
+    """
+    async def events():
+        async with stock_alerts_service.broadcaster.subscribe() as queue:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['event']}\ndata: {json.dumps(event['alert'])}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.websocket("/alerts/ws")
+async def stock_alerts_websocket(websocket: WebSocket):
+    """
+    WebSocket push of opened and escalated stock alerts
+    """
+    await websocket.accept()
+    async with stock_alerts_service.broadcaster.subscribe() as queue:
+        async def send_events():
+            while True:
+                await websocket.send_json(await queue.get())
+        
+        sender = asyncio.create_task(send_events())
+        try:
+            # Incoming messages are ignored, reading only detects the disconnect
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            sender.cancel()
+
 @router.get("/alerts/critical")
-async def get_critical_alerts() -> Dict[str, Any]:
+def get_critical_alerts() -> Dict[str, Any]:
     """
     Get critical stock alerts that require immediate attention
     """
@@ -102,7 +156,7 @@ async def get_stock_predictions(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/alerts/configure")
-async def configure_stock_alert(
+def configure_stock_alert(
     request: StockAlertRequest
 ) -> Dict[str, Any]:
     """
@@ -130,7 +184,7 @@ async def configure_stock_alert(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/stock/update")
-async def update_stock_level(
+def update_stock_level(
     request: UpdateStockRequest,
     background_tasks: BackgroundTasks
 ) -> Dict[str, Any]:
@@ -164,6 +218,27 @@ async def update_stock_level(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/stock/update/batch")
+def update_stock_levels(
+    request: BatchStockUpdateRequest
+) -> Dict[str, Any]:
+    """
+    Update many stock levels, only products that change stock band are re-checked
+    """
+    result = stock_alerts_service.update_stock_levels(
+        [update.dict() for update in request.updates]
+    )
+    
+    if not result["success"]:
+        raise HTTPException(status_code=500, detail=result["error"])
+    
+    return {
+        "success": True,
+        "message": "Stock levels updated successfully",
+        "data": result,
+        "alerts_triggered": result["alerts_triggered"]
+    }
+
 @router.post("/alerts/bulk-check")
 async def bulk_check_stock_alerts(
     background_tasks: BackgroundTasks
@@ -210,7 +285,8 @@ async def update_alert_settings(
             enable_overstock=request.enable_overstock,
             enable_expiry=request.enable_expiry,
             alert_frequency=request.alert_frequency,
-            notification_channels=request.notification_channels
+            notification_channels=request.notification_channels,
+            business_hours_only=request.business_hours_only
         )
         
         if not result["success"]:
@@ -226,7 +302,7 @@ async def update_alert_settings(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/analytics")
-async def get_stock_analytics(
+def get_stock_analytics(
     days_back: int = 30
 ) -> Dict[str, Any]:
     """
@@ -261,7 +337,7 @@ async def get_reorder_suggestions(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/alerts/{alert_id}/acknowledge")
-async def acknowledge_alert(
+def acknowledge_alert(
     alert_id: str,
     acknowledged_by: str = "system"
 ) -> Dict[str, Any]:
@@ -275,7 +351,7 @@ async def acknowledge_alert(
         )
         
         if not result["success"]:
-            raise HTTPException(status_code=404, detail=result["error"])
+            raise HTTPException(status_code=409 if result.get("conflict") else 404, detail=result["error"])
         
         return {
             "success": True,
@@ -283,11 +359,13 @@ async def acknowledge_alert(
             "data": result
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/alerts/{alert_id}")
-async def dismiss_alert(
+def dismiss_alert(
     alert_id: str,
     dismissed_by: str = "system"
 ) -> Dict[str, Any]:
@@ -301,18 +379,20 @@ async def dismiss_alert(
         )
         
         if not result["success"]:
-            raise HTTPException(status_code=404, detail=result["error"])
+            raise HTTPException(status_code=409 if result.get("conflict") else 404, detail=result["error"])
         
         return {
             "success": True,
             "message": "Alert dismissed successfully"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/alerts/history")
-async def get_alert_history(
+def get_alert_history(
     days_back: int = 30,
     limit: int = 100
 ) -> Dict[str, Any]:
@@ -331,7 +411,7 @@ async def get_alert_history(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/health")
-async def get_system_health() -> Dict[str, Any]:
+def get_system_health() -> Dict[str, Any]:
     """
     Get stock alerts system health status
     """
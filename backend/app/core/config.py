@@ -7,7 +7,67 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./businesspilot.db"
-    
+    # Derived from DATABASE_URL (aiosqlite / asyncpg) when not set
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # PostgreSQL statement_timeout in milliseconds, 0 disables it
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+
+    # SQLite tuning
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # Forecasting: prophet, holt_winters or seasonal_naive
+    FORECAST_ENGINE: str = "prophet"
+    # Process pool for batch fits (reorder suggestions), 1 fits in-process
+    FORECAST_WORKERS: int = 4
+    # Reorder suggestions wait this long for missing fits, then fall back to min stock
+    FORECAST_BATCH_TIMEOUT_SECONDS: int = 20
+
+    # Forecast cache
+    FORECAST_CACHE_DIR: str = "./forecast_cache"
+    FORECAST_CACHE_MAX_AGE_SECONDS: int = 6 * 3600
+    # Refit once this many new daily observations arrived since the last fit
+    FORECAST_REFIT_MIN_NEW_POINTS: int = 1
+
+    # Top products: keep at most this many products per day (Space-Saving
+    # sketch) for very large catalogs, 0 keeps exact counters
+    TOP_PRODUCTS_SKETCH_CAPACITY: int = 0
+
+    # Inventory search ranks at most this many matches per query, so short
+    # prefixes stay fast on large catalogs; fewer matches are ranked exactly
+    INVENTORY_SEARCH_RANK_WINDOW: int = 1000
+
+    # Recompute the per-category inventory valuation from scratch this often
+    # and report any drift from the trigger-maintained counters, 0 disables
+    INVENTORY_VALUATION_RECONCILE_INTERVAL_SECONDS: int = 24 * 3600
+
+    # In-process SKU/barcode lookup cache for scanning, sized in entries (one
+    # per SKU and one per barcode), 0 disables it.
+    # The TTL bounds staleness from writes made by other workers
+    ITEM_LOOKUP_CACHE_SIZE: int = 5000
+    ITEM_LOOKUP_CACHE_TTL_SECONDS: int = 300
+    # Best sellers loaded into the cache at startup, 0 disables warming
+    ITEM_LOOKUP_CACHE_WARM_SIZE: int = 500
+
+    # Background stock alert checks, 0 disables the scheduler. Each wait is
+    # jittered by up to the jitter either way
+    STOCK_ALERT_CHECK_INTERVAL_SECONDS: int = 300
+    STOCK_ALERT_CHECK_JITTER_SECONDS: int = 30
+    # Local hours [start, end) used by the business_hours_only alert setting
+    STOCK_ALERT_BUSINESS_HOURS_START: int = 9
+    STOCK_ALERT_BUSINESS_HOURS_END: int = 18
+    # Days of detailed alert history; older closed alerts are compacted into
+    # daily counts, 0 keeps everything
+    STOCK_ALERT_HISTORY_RETENTION_DAYS: int = 90
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
     
@@ -1,13 +1,109 @@
-from sqlalchemy import create_engine
+from datetime import datetime, timezone
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url, URL
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+# Async drivers used when ASYNC_DATABASE_URL is not set explicitly
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def get_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    url = make_url(settings.DATABASE_URL)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.database in (None, "", ":memory:")
+
+def get_engine_options(database_url: str) -> dict:
+    """Pool and driver options for the given URL, tuned per dialect."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    is_async = url.get_dialect().is_async
+
+    if backend == "sqlite":
+        connect_args = {} if is_async else {"check_same_thread": False}
+        if _is_memory_sqlite(url):
+            # A single shared connection, otherwise every checkout sees an empty database
+            return {"poolclass": StaticPool, "connect_args": connect_args}
+        # WAL allows concurrent readers but a single writer, so a large pool only adds lock contention
+        return {
+            "poolclass": AsyncAdaptedQueuePool if is_async else QueuePool,
+            "pool_size": min(settings.DB_POOL_SIZE, 5),
+            "max_overflow": 0,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "connect_args": connect_args,
+        }
+
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if backend == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if is_async:
+            options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+def configure_sqlite_pragmas(sync_engine: Engine) -> None:
+    """Apply journal, sync and busy-timeout pragmas on every new SQLite connection."""
+    url = sync_engine.url
+    use_wal = not _is_memory_sqlite(url)
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if use_wal:
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.close()
+
+engine = create_engine(settings.DATABASE_URL, **get_engine_options(settings.DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+ASYNC_DATABASE_URL = get_async_database_url()
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **get_engine_options(ASYNC_DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+if engine.dialect.name == "sqlite":
+    configure_sqlite_pragmas(engine)
+if async_engine.dialect.name == "sqlite":
+    configure_sqlite_pragmas(async_engine.sync_engine)
+
 Base = declarative_base()
 
+def utcnow() -> datetime:
+    """Current UTC time, the clock CURRENT_TIMESTAMP uses.
+
+    Keyset-paginated timestamps are written by the app rather than the server
+    default: SQLite stores CURRENT_TIMESTAMP without a fraction while bound
+    datetimes always have one, and as text ``'...SS'`` sorts below
+    ``'...SS.000000'``, so a cursor would never get past rows sharing a second.
+    """
+    return datetime.now(timezone.utc)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -15,5 +111,9 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def create_tables():
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
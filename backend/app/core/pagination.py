@@ -0,0 +1,80 @@
+"""
+Keyset pagination helpers.
+
+Listings are ordered by a unique key such as (created_at, id) and the next
+page starts after the last row of the previous one, so every page costs an
+index seek instead of scanning and discarding ``skip`` rows. The position is
+handed to clients as an opaque cursor in the ``X-Next-Cursor`` header.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import Response
+from sqlalchemy import desc, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("Invalid cursor")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = [_decode_value(value) for value in json.loads(payload)]
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if len(values) != size or any(value is None for value in values):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def keyset_paginate(query, keys: Sequence, cursor: Optional[str] = None, descending: bool = False):
+    """Order ``query`` by ``keys`` and, with a cursor, start after it.
+
+    Works on both ``Query`` and ``select()``. The keys must end in a unique
+    column so the ordering is total.
+    """
+    query = query.order_by(*[desc(key) if descending else key for key in keys])
+    if cursor:
+        bound = tuple_(*keys)
+        values = tuple_(*decode_cursor(cursor, len(keys)))
+        query = query.where(bound < values if descending else bound > values)
+    return query
+
+
+def next_cursor(rows: Sequence, limit: int, keys: Sequence) -> Optional[str]:
+    """Cursor after the last row, or None when the page was not full"""
+    if limit <= 0 or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor([getattr(last, key.key) for key in keys])
+
+
+def set_next_cursor(response: Response, rows: Sequence, limit: int, keys: Sequence) -> None:
+    cursor = next_cursor(rows, limit, keys)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,45 @@
+"""
+Query counting for N+1 checks.
+
+    with assert_max_queries(engine, 2):
+        SalesService(db).get_sales(limit=100)
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryCounter:
+    """Records every statement sent to the database while active"""
+
+    def __init__(self, engine: Union[Engine, AsyncEngine]):
+        self.engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+@contextmanager
+def assert_max_queries(engine: Union[Engine, AsyncEngine], expected: int) -> Iterator[QueryCounter]:
+    """Fail if the block sends more than ``expected`` statements"""
+    with QueryCounter(engine) as counter:
+        yield counter
+    if counter.count > expected:
+        statements = "\n".join(f"  {i}. {statement}" for i, statement in enumerate(counter.statements, 1))
+        raise AssertionError(f"Expected at most {expected} queries, got {counter.count}:\n{statements}")
@@ -0,0 +1,27 @@
+"""
+Search text normalization.
+
+Searchable text is stored and queried in a folded form: Unicode
+decomposition with the combining marks dropped (so "καφές", "ΚΑΦΈΣ" and
+"καφες" are the same word, as are "café" and "cafe"), casefolded (which also
+maps the Greek final sigma to σ) and reduced to word tokens.
+"""
+
+import re
+import unicodedata
+from typing import List, Optional
+
+# Letters and digits, "_" separates words like in the FTS5 tokenizer
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def normalize_search_text(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(_TOKEN_RE.findall(stripped.casefold()))
+
+
+def search_tokens(query: Optional[str]) -> List[str]:
+    return normalize_search_text(query).split()
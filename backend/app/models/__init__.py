@@ -1,21 +1,27 @@
 from .user import User
-from .sales import Sale, SaleItem
-from .inventory import InventoryItem
+from .sales import Sale, SaleItem, DailyProductSales
+from .inventory import InventoryItem, InventoryValuation
 from .employee import Employee, Schedule
 from .marketing import Campaign
-from .finance import Expense
+from .finance import Expense, DailyFinancial
 from .events import Event
 from .assistant import ChatHistory
+from .stock_alerts import StockAlertRecord, StockAlertDailySummary
 
 __all__ = [
     "User",
     "Sale",
     "SaleItem", 
+    "DailyProductSales",
     "InventoryItem",
+    "InventoryValuation",
     "Employee",
     "Schedule",
     "Campaign",
     "Expense",
+    "DailyFinancial",
     "Event",
-    "ChatHistory"
+    "ChatHistory",
+    "StockAlertRecord",
+    "StockAlertDailySummary"
 ]
\ No newline at end of file
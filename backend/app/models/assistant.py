@@ -1,6 +1,6 @@
 from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean
 from sqlalchemy.sql import func
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 class ChatHistory(Base):
     __tablename__ = "chat_messages"
@@ -8,5 +8,10 @@ class ChatHistory(Base):
     id = Column(Integer, primary_key=True, index=True)
     message = Column(Text, nullable=False)
     response = Column(Text, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+# Create indexes for performance
+from sqlalchemy import Index
+
+Index('idx_chat_messages_created_at_id', ChatHistory.created_at, ChatHistory.id)
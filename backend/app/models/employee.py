@@ -32,4 +32,9 @@ class Schedule(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    employee = relationship("Employee", back_populates="schedules")
\ No newline at end of file
+    employee = relationship("Employee", back_populates="schedules")
+# Create indexes for performance
+from sqlalchemy import Index
+
+Index('idx_schedules_date_employee', Schedule.date, Schedule.employee_id)
+Index('idx_employees_full_name_id', Employee.full_name, Employee.id)
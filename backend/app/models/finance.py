@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, Boolean, Text, Enum, UniqueConstraint
 from sqlalchemy.sql import func
 from app.core.database import Base
 import enum
@@ -29,4 +29,29 @@ class Expense(Base):
     recurrence_period = Column(String(50))  # monthly, weekly, etc.
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+class DailyFinancial(Base):
+    """Per-day rollup of sales and expenses, maintained on every write.
+
+    Sales are booked under the ``sales`` category, expenses under their
+    ExpenseCategory value.
+    """
+    __tablename__ = "daily_financials"
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    category = Column(String(50), nullable=False)
+    revenue = Column(Float, nullable=False, default=0.0)
+    expenses = Column(Float, nullable=False, default=0.0)
+    sales_count = Column(Integer, nullable=False, default=0)
+    expense_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (UniqueConstraint('day', 'category', name='uq_daily_financials_day_category'),)
+
+# Create indexes for performance
+from sqlalchemy import Index
+
+Index('idx_expenses_date_category', Expense.date, Expense.category, postgresql_include=['amount'])
+Index('idx_expenses_date_id', Expense.date, Expense.id)
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, DDL, UniqueConstraint, event
 from sqlalchemy.sql import func
 from app.core.database import Base
+from app.core.search import normalize_search_text
 
 class InventoryItem(Base):
     __tablename__ = "inventory_items"
@@ -19,5 +20,110 @@ class InventoryItem(Base):
     supplier = Column(String(100))
     location = Column(String(100))
     is_active = Column(Boolean, default=True)
+    # Folded copy of SEARCH_FIELDS, kept current on every ORM write
+    search_text = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+class InventoryValuation(Base):
+    """Per-category stock valuation, maintained by triggers on inventory_items.
+
+    Every insert, delete and change of stock, cost, price or category
+    adjusts its category row in the same transaction, whichever code path
+    wrote it. Uncategorized items are booked under ''.
+    """
+    __tablename__ = "inventory_valuation"
+
+    id = Column(Integer, primary_key=True, index=True)
+    category = Column(String(50), nullable=False)
+    item_count = Column(Integer, nullable=False, default=0)
+    total_quantity = Column(Integer, nullable=False, default=0)
+    cost_value = Column(Float, nullable=False, default=0.0)
+    retail_value = Column(Float, nullable=False, default=0.0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (UniqueConstraint('category', name='uq_inventory_valuation_category'),)
+
+# Name first, so name matches rank first
+SEARCH_FIELDS = ("name", "sku", "barcode", "supplier", "description")
+
+def build_search_text(values) -> str:
+    """``values`` is an item or a mapping of SEARCH_FIELDS"""
+    get = values.get if isinstance(values, dict) else lambda field: getattr(values, field)
+    return " ".join(filter(None, (normalize_search_text(get(field)) for field in SEARCH_FIELDS)))
+
+@event.listens_for(InventoryItem, "before_insert")
+@event.listens_for(InventoryItem, "before_update")
+def _set_search_text(mapper, connection, target):
+    target.search_text = build_search_text(target)
+
+# Search index: FTS5 over search_text on SQLite, kept in sync by triggers so
+# any writer updates it, and a trigram GIN index on PostgreSQL
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE inventory_items_fts USING fts5("
+    "search_text, content='inventory_items', content_rowid='id', prefix='1 2 3')",
+    "CREATE TRIGGER inventory_items_fts_ai AFTER INSERT ON inventory_items BEGIN "
+    "INSERT INTO inventory_items_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+    "CREATE TRIGGER inventory_items_fts_ad AFTER DELETE ON inventory_items BEGIN "
+    "INSERT INTO inventory_items_fts(inventory_items_fts, rowid, search_text) "
+    "VALUES ('delete', old.id, old.search_text); END",
+    "CREATE TRIGGER inventory_items_fts_au AFTER UPDATE OF search_text ON inventory_items BEGIN "
+    "INSERT INTO inventory_items_fts(inventory_items_fts, rowid, search_text) "
+    "VALUES ('delete', old.id, old.search_text); "
+    "INSERT INTO inventory_items_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+]
+POSTGRES_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX idx_inventory_items_search_trgm ON inventory_items USING gin (search_text gin_trgm_ops)",
+]
+
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(InventoryItem.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(InventoryItem.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+event.listen(
+    InventoryItem.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS inventory_items_fts").execute_if(dialect="sqlite")
+)
+
+def _valuation_upsert(row: str, sign: str) -> str:
+    """Add (sign '') or remove (sign '-') the OLD/NEW row from its category"""
+    stock = f"COALESCE({row}.current_stock, 0)"
+    return (
+        "INSERT INTO inventory_valuation (category, item_count, total_quantity, cost_value, retail_value) "
+        f"VALUES (COALESCE({row}.category, ''), {sign}1, {sign}{stock}, "
+        f"{sign}{stock} * COALESCE({row}.unit_cost, 0), {sign}{stock} * COALESCE({row}.selling_price, 0)) "
+        "ON CONFLICT (category) DO UPDATE SET "
+        "item_count = inventory_valuation.item_count + excluded.item_count, "
+        "total_quantity = inventory_valuation.total_quantity + excluded.total_quantity, "
+        "cost_value = inventory_valuation.cost_value + excluded.cost_value, "
+        "retail_value = inventory_valuation.retail_value + excluded.retail_value"
+    )
+
+VALUATION_COLUMNS = "current_stock, unit_cost, selling_price, category"
+SQLITE_VALUATION_DDL = [
+    "CREATE TRIGGER inventory_valuation_ai AFTER INSERT ON inventory_items BEGIN "
+    f"{_valuation_upsert('new', '')}; END",
+    "CREATE TRIGGER inventory_valuation_ad AFTER DELETE ON inventory_items BEGIN "
+    f"{_valuation_upsert('old', '-')}; END",
+    f"CREATE TRIGGER inventory_valuation_au AFTER UPDATE OF {VALUATION_COLUMNS} ON inventory_items BEGIN "
+    f"{_valuation_upsert('old', '-')}; {_valuation_upsert('new', '')}; END",
+]
+POSTGRES_VALUATION_DDL = [
+    "CREATE OR REPLACE FUNCTION inventory_valuation_sync() RETURNS trigger AS $$ BEGIN "
+    f"IF TG_OP IN ('UPDATE', 'DELETE') THEN {_valuation_upsert('OLD', '-')}; END IF; "
+    f"IF TG_OP IN ('INSERT', 'UPDATE') THEN {_valuation_upsert('NEW', '')}; END IF; "
+    "RETURN NULL; END $$ LANGUAGE plpgsql",
+    f"CREATE TRIGGER inventory_valuation_sync AFTER INSERT OR DELETE OR UPDATE OF {VALUATION_COLUMNS} "
+    "ON inventory_items FOR EACH ROW EXECUTE FUNCTION inventory_valuation_sync()",
+]
+
+for statement in SQLITE_VALUATION_DDL:
+    event.listen(InventoryItem.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in POSTGRES_VALUATION_DDL:
+    event.listen(InventoryItem.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+# Create indexes for performance
+from sqlalchemy import Index
+
+Index('idx_inventory_items_name_id', InventoryItem.name, InventoryItem.id)
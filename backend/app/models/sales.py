@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, Date, ForeignKey, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 class Sale(Base):
     __tablename__ = "sales"
@@ -14,7 +14,10 @@ class Sale(Base):
     customer_name = Column(String(100))
     customer_email = Column(String(100))
     notes = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Client-supplied POS receipt id, makes bulk uploads idempotent
+    receipt_id = Column(String(64), unique=True, index=True)
+    # Written by the app so every row has the same format, see utcnow
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     items = relationship("SaleItem", back_populates="sale")
@@ -24,9 +27,39 @@ class SaleItem(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     sale_id = Column(Integer, ForeignKey("sales.id"))
+    # Inventory item sold; product_name keeps the name printed on the receipt
+    product_id = Column(Integer, ForeignKey("inventory_items.id", ondelete="SET NULL", name="fk_sale_items_product_id"))
     product_name = Column(String(100), nullable=False)
     quantity = Column(Integer, nullable=False)
     unit_price = Column(Float, nullable=False)
     total_price = Column(Float, nullable=False)
     
-    sale = relationship("Sale", back_populates="items")
\ No newline at end of file
+    sale = relationship("Sale", back_populates="items")
+    product = relationship("InventoryItem")
+
+class DailyProductSales(Base):
+    """Per-day, per-product sales counters, maintained on every sale write.
+
+    Top products for a window are answered by merging the window's daily
+    buckets instead of grouping sale_items. With a sketch capacity set, each
+    day keeps at most that many products (Space-Saving); ``error`` is the
+    revenue a product may have inherited from the counter it replaced.
+    """
+    __tablename__ = "daily_product_sales"
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    product_name = Column(String(100), nullable=False)
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue = Column(Float, nullable=False, default=0.0)
+    error = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (UniqueConstraint('day', 'product_name', name='uq_daily_product_sales_day_product'),)
+# Create indexes for performance
+from sqlalchemy import Index
+
+Index('idx_sales_created_at', Sale.created_at, Sale.id, postgresql_include=['total_amount'])
+Index('idx_sale_items_sale_product', SaleItem.sale_id, SaleItem.product_name,
+      postgresql_include=['quantity', 'total_price'])
+Index('idx_sale_items_product_sale', SaleItem.product_id, SaleItem.sale_id,
+      postgresql_include=['quantity'])
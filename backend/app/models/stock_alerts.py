@@ -0,0 +1,64 @@
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Text, UniqueConstraint, text
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# Statuses of an alert that still needs attention
+OPEN_ALERT_STATUSES = ("active", "acknowledged")
+
+class StockAlertRecord(Base):
+    """Stock alert raised by StockAlertsService.
+
+    A product has at most one open alert per type; re-detecting the same
+    condition updates it (and bumps ``occurrences``) instead of adding a row.
+    History is partitioned by ``day``, the date the alert was raised.
+    """
+    __tablename__ = "stock_alerts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(String(100), nullable=False)
+    product_name = Column(String(200), nullable=False)
+    alert_type = Column(String(30), nullable=False)
+    urgency = Column(String(20), nullable=False)
+    status = Column(String(20), nullable=False, default="active")
+    current_stock = Column(Integer, nullable=False)
+    threshold = Column(Integer, nullable=False)
+    message = Column(Text, nullable=False)
+    occurrences = Column(Integer, nullable=False, default=1)
+    predicted_stockout_date = Column(DateTime(timezone=True))
+    recommended_order_quantity = Column(Integer)
+    cost_impact = Column(Float)
+    acknowledged_by = Column(String(100))
+    acknowledged_at = Column(DateTime(timezone=True))
+    dismissed_by = Column(String(100))
+    dismissed_at = Column(DateTime(timezone=True))
+    resolved_at = Column(DateTime(timezone=True))
+    day = Column(Date, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class StockAlertDailySummary(Base):
+    """Alert counts of a day whose closed alerts were compacted.
+
+    Closed alerts older than the history retention are folded into these
+    counters and deleted, so trend charts keep their full range.
+    """
+    __tablename__ = "stock_alert_daily_summary"
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    alert_type = Column(String(30), nullable=False)
+    urgency = Column(String(20), nullable=False)
+    alert_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (UniqueConstraint('day', 'alert_type', 'urgency', name='uq_stock_alert_daily_summary_day_type_urgency'),)
+
+# Create indexes for performance
+from sqlalchemy import Index
+
+Index('idx_stock_alerts_status_urgency_product', StockAlertRecord.status, StockAlertRecord.urgency,
+      StockAlertRecord.product_id)
+Index('idx_stock_alerts_day_created_at', StockAlertRecord.day, StockAlertRecord.created_at)
+# One open alert per product and type
+_open = text("status IN ('active', 'acknowledged')")
+Index('uq_stock_alerts_open_product_type', StockAlertRecord.product_id, StockAlertRecord.alert_type,
+      unique=True, sqlite_where=_open, postgresql_where=_open)
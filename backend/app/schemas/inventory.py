@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 class InventoryBase(BaseModel):
@@ -50,4 +50,24 @@ class DemandForecast(BaseModel):
     item_id: int
     predictions: list
     suggested_reorder: int
-    confidence: float
\ No newline at end of file
+    confidence: float
+
+class StockAdjustment(BaseModel):
+    sku: str = Field(..., min_length=1, max_length=50)
+    # Signed: positive for deliveries, negative for removals
+    quantity_change: int
+
+class StockBatchUpdate(BaseModel):
+    items: List[StockAdjustment] = Field(..., min_length=1)
+
+class StockLevel(BaseModel):
+    id: int
+    sku: str
+    current_stock: int
+
+    class Config:
+        from_attributes = True
+
+class StockBatchResult(BaseModel):
+    updated: List[StockLevel]
+    not_found: List[str]
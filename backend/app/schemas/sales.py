@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 
 class SaleItemBase(BaseModel):
     product_name: str
+    # Resolved from product_name against inventory when omitted
+    product_id: Optional[int] = None
     quantity: int
     unit_price: float
     total_price: float
@@ -38,8 +40,25 @@ class SaleUpdate(BaseModel):
     customer_email: Optional[str] = None
     notes: Optional[str] = None
 
+class SaleBulkCreate(SaleCreate):
+    receipt_id: str = Field(..., min_length=1, max_length=64)
+    created_at: Optional[datetime] = None
+
+class SaleBulkError(BaseModel):
+    line: int
+    receipt_id: Optional[str] = None
+    error: str
+
+class SaleBulkResult(BaseModel):
+    received: int
+    inserted: int
+    duplicates: int
+    failed: int
+    errors: List[SaleBulkError]
+
 class SaleResponse(SaleBase):
     id: int
+    receipt_id: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     items: List[SaleItemResponse]
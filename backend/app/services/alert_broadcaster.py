@@ -0,0 +1,65 @@
+"""
+Alert Broadcaster for BusinessPilot AI
+Pushes stock alert events to subscribed dashboards (WebSocket and SSE)
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Events buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class AlertBroadcaster:
+    """Fans alert events out to every subscriber.
+
+    ``publish`` may be called from any thread (alert checks run in the
+    threadpool); each subscriber has a bounded queue on its own event loop,
+    so a slow dashboard loses its oldest events instead of holding memory.
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Set[Tuple[asyncio.Queue, asyncio.AbstractEventLoop]] = set()
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue]:
+        subscriber = (asyncio.Queue(maxsize=self.queue_size), asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            yield subscriber[0]
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+    def publish(self, events: List[Dict[str, Any]]) -> None:
+        if not events:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, events)
+            except RuntimeError:
+                # Its event loop is gone
+                with self._lock:
+                    self._subscribers.discard((queue, loop))
+
+    def _offer(self, queue: asyncio.Queue, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
@@ -1,12 +1,14 @@
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy.orm import Session, joinedload
 from datetime import datetime, timedelta
+from app.core.pagination import keyset_paginate
 from app.models.assistant import ChatHistory
 from app.schemas.assistant import ChatRequest, ChatResponse
 import json
 import re
 
+CHAT_PAGE_KEYS = (ChatHistory.created_at, ChatHistory.id)
+
 
 class AssistantService:
     def __init__(self, db: Session):
@@ -49,9 +51,11 @@ class AssistantService:
         
         return db_message
 
-    def get_chat_history(self, skip: int = 0, limit: int = 50) -> List[ChatHistory]:
-        """Get chat history"""
-        return self.db.query(ChatHistory).order_by(desc(ChatHistory.created_at)).offset(skip).limit(limit).all()
+    def get_chat_history(self, skip: int = 0, limit: int = 50,
+                         cursor: Optional[str] = None) -> List[ChatHistory]:
+        """Get chat history, newest first"""
+        query = keyset_paginate(self.db.query(ChatHistory), CHAT_PAGE_KEYS, cursor, descending=True)
+        return query.offset(skip).limit(limit).all()
 
     def get_chat_message(self, message_id: int) -> Optional[ChatHistory]:
         """Get specific chat message"""
@@ -346,7 +350,8 @@ class AssistantService:
         """Get sales context for AI responses"""
         
         try:
-            from app.models.sales import Sale, SaleItem
+            from app.models.sales import Sale
+            from app.services.product_rollup_service import ProductSalesRollupService
             
             # Get last 30 days of sales
             thirty_days_ago = datetime.now() - timedelta(days=30)
@@ -357,15 +362,7 @@ class AssistantService:
             total_sales = len(sales)
             
             # Get top products
-            top_products = self.db.query(
-                SaleItem.product_name,
-                func.sum(SaleItem.quantity).label('total_quantity'),
-                func.sum(SaleItem.total_price).label('total_revenue')
-            ).join(Sale).filter(
-                Sale.created_at >= thirty_days_ago
-            ).group_by(SaleItem.product_name).order_by(
-                desc('total_revenue')
-            ).limit(5).all()
+            top_products = ProductSalesRollupService(self.db).top_products(thirty_days_ago, limit=5)
             
             return {
                 "total_revenue": total_revenue,
@@ -389,26 +386,26 @@ class AssistantService:
         
         try:
             from app.models.inventory import InventoryItem
+            from app.services.inventory_valuation_service import InventoryValuationService
             
-            items = self.db.query(InventoryItem).all()
-            
-            total_items = len(items)
-            total_value = sum(item.quantity * item.cost_price for item in items)
+            valuation = InventoryValuationService(self.db).get_inventory_value()
             
             # Get low stock items
+            low_stock = self.db.query(
+                InventoryItem.name, InventoryItem.current_stock, InventoryItem.minimum_stock
+            ).filter(InventoryItem.current_stock <= InventoryItem.minimum_stock).all()
             low_stock_items = [
                 {
                     "name": item.name,
-                    "quantity": item.quantity,
-                    "min_level": item.min_stock_level
+                    "quantity": item.current_stock,
+                    "min_level": item.minimum_stock
                 }
-                for item in items
-                if item.quantity <= item.min_stock_level
+                for item in low_stock
             ]
             
             return {
-                "total_items": total_items,
-                "total_value": total_value,
+                "total_items": valuation["total_items"],
+                "total_value": valuation["total_value"],
                 "low_stock_items": low_stock_items
             }
         except Exception as e:
@@ -425,7 +422,7 @@ class AssistantService:
             
             # Get recent schedule data
             thirty_days_ago = datetime.now() - timedelta(days=30)
-            schedules = self.db.query(Schedule).filter(
+            schedules = self.db.query(Schedule).options(joinedload(Schedule.employee)).filter(
                 Schedule.date >= thirty_days_ago.date()
             ).all()
             
@@ -1,10 +1,13 @@
 from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, desc, extract
 from datetime import datetime, timedelta, time
+from app.core.pagination import keyset_paginate
 from app.models.employee import Employee, Schedule
 from app.schemas.employee import EmployeeCreate, EmployeeUpdate, ScheduleCreate
 
+EMPLOYEE_PAGE_KEYS = (Employee.full_name, Employee.id)
+
 
 class EmployeeService:
     def __init__(self, db: Session):
@@ -32,13 +35,15 @@ class EmployeeService:
         return self.db.query(Employee).filter(Employee.email == email).first()
 
     def get_employees(self, skip: int = 0, limit: int = 100, 
-                     active_only: bool = True) -> List[Employee]:
+                     active_only: bool = True,
+                     cursor: Optional[str] = None) -> List[Employee]:
         query = self.db.query(Employee)
         
         if active_only:
             query = query.filter(Employee.is_active == True)
         
-        return query.order_by(Employee.full_name).offset(skip).limit(limit).all()
+        query = keyset_paginate(query, EMPLOYEE_PAGE_KEYS, cursor)
+        return query.offset(skip).limit(limit).all()
 
     def update_employee(self, employee_id: int, employee_update: EmployeeUpdate) -> Optional[Employee]:
         db_employee = self.get_employee(employee_id)
@@ -94,7 +99,8 @@ class EmployeeService:
 
     def get_schedules(self, start_date: datetime, end_date: datetime,
                      employee_id: Optional[int] = None) -> List[Schedule]:
-        query = self.db.query(Schedule).filter(
+        # Payroll reads schedule.employee for every row, join it in up front
+        query = self.db.query(Schedule).options(joinedload(Schedule.employee)).filter(
             Schedule.date >= start_date.date(),
             Schedule.date <= end_date.date()
         )
@@ -1,16 +1,38 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, extract, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, desc, extract, and_, select
 from datetime import datetime, timedelta
-from app.models.finance import Expense
+from app.core.pagination import keyset_paginate
+from app.models.finance import Expense, DailyFinancial, ExpenseCategory
 from app.schemas.finance import ExpenseCreate, ExpenseUpdate
+from app.services.financial_rollup_service import FinancialRollupService, SALES_CATEGORY
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfgen import canvas
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from openpyxl import Workbook
+import numpy as np
+import tempfile
 import io
 
+CASH_FLOW_GRANULARITIES = ("daily", "weekly", "monthly")
+LEDGER_BATCH_SIZE = 1000
+EXPORT_CHUNK_SIZE = 64 * 1024
+EXPENSE_PAGE_KEYS = (Expense.date, Expense.id)
+
+
+def _naive(value):
+    # openpyxl cannot write timezone-aware datetimes
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def _category_label(category) -> str:
+    return category.value if isinstance(category, ExpenseCategory) else str(category)
+
 
 class FinanceService:
     def __init__(self, db: Session):
@@ -26,6 +48,7 @@ class FinanceService:
             is_recurring=expense_create.is_recurring
         )
         self.db.add(db_expense)
+        FinancialRollupService(self.db).record_expense(db_expense.date, db_expense.category, db_expense.amount)
         self.db.commit()
         self.db.refresh(db_expense)
         return db_expense
@@ -36,7 +59,8 @@ class FinanceService:
     def get_expenses(self, skip: int = 0, limit: int = 100,
                     start_date: Optional[datetime] = None,
                     end_date: Optional[datetime] = None,
-                    category: Optional[str] = None) -> List[Expense]:
+                    category: Optional[str] = None,
+                    cursor: Optional[str] = None) -> List[Expense]:
         query = self.db.query(Expense)
         
         if start_date:
@@ -46,17 +70,21 @@ class FinanceService:
         if category:
             query = query.filter(Expense.category == category)
         
-        return query.order_by(desc(Expense.date)).offset(skip).limit(limit).all()
+        query = keyset_paginate(query, EXPENSE_PAGE_KEYS, cursor, descending=True)
+        return query.offset(skip).limit(limit).all()
 
     def update_expense(self, expense_id: int, expense_update: ExpenseUpdate) -> Optional[Expense]:
         db_expense = self.get_expense(expense_id)
         if not db_expense:
             return None
         
+        previous = (db_expense.date, db_expense.category, db_expense.amount)
         update_data = expense_update.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_expense, field, value)
         
+        self._rebook_expense(self.db, db_expense, previous)
+        
         self.db.commit()
         self.db.refresh(db_expense)
         return db_expense
@@ -66,10 +94,22 @@ class FinanceService:
         if not db_expense:
             return False
         
+        FinancialRollupService(self.db).record_expense(
+            db_expense.date, db_expense.category, db_expense.amount, sign=-1
+        )
         self.db.delete(db_expense)
         self.db.commit()
         return True
 
+    @staticmethod
+    def _rebook_expense(db: Session, db_expense: Expense, previous: tuple) -> None:
+        """Move an edited expense to its new rollup bucket"""
+        if previous == (db_expense.date, db_expense.category, db_expense.amount):
+            return
+        rollup = FinancialRollupService(db)
+        rollup.record_expense(*previous, sign=-1)
+        rollup.record_expense(db_expense.date, db_expense.category, db_expense.amount)
+
     def get_expense_categories(self) -> List[str]:
         """Get all expense categories"""
         categories = self.db.query(Expense.category).distinct().all()
@@ -78,11 +118,14 @@ class FinanceService:
     def get_financial_summary(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Get comprehensive financial summary"""
         
+        # One read of the daily rollup feeds every section of the summary
+        rows = FinancialRollupService(self.db).get_daily_rows(start_date, end_date)
+        
         # Get revenue from sales
-        revenue = self._get_revenue(start_date, end_date)
+        revenue = self._get_revenue(start_date, end_date, rows)
         
         # Get expenses
-        expenses = self._get_expenses_summary(start_date, end_date)
+        expenses = self._get_expenses_summary(start_date, end_date, rows)
         
         # Calculate profit/loss
         total_revenue = revenue.get("total_revenue", 0)
@@ -90,10 +133,10 @@ class FinanceService:
         profit_loss = total_revenue - total_expenses
         
         # Get expense breakdown by category
-        expense_breakdown = self._get_expense_breakdown(start_date, end_date)
+        expense_breakdown = self._get_expense_breakdown(start_date, end_date, rows)
         
         # Get monthly trends
-        monthly_trends = self._get_monthly_trends(start_date, end_date)
+        monthly_trends = self._get_monthly_trends(start_date, end_date, rows)
         
         return {
             "period": {
@@ -113,70 +156,56 @@ class FinanceService:
             "monthly_trends": monthly_trends
         }
 
-    def _get_revenue(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-        """Get revenue data from sales"""
-        
-        try:
-            from app.models.sales import Sale
-            
-            sales_query = self.db.query(Sale).filter(
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
-            )
-            
-            sales = sales_query.all()
-            
-            total_revenue = sum(sale.total_amount for sale in sales)
-            total_sales = len(sales)
-            average_sale = total_revenue / total_sales if total_sales > 0 else 0
-            
-            # Get daily revenue
-            daily_revenue = self.db.query(
-                func.date(Sale.created_at).label('date'),
-                func.sum(Sale.total_amount).label('revenue')
-            ).filter(
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
-            ).group_by(func.date(Sale.created_at)).order_by('date').all()
-            
-            return {
-                "total_revenue": total_revenue,
-                "total_sales": total_sales,
-                "average_sale": average_sale,
-                "daily_revenue": [
-                    {
-                        "date": day.date.isoformat(),
-                        "revenue": day.revenue
-                    }
-                    for day in daily_revenue
-                ]
-            }
-        except Exception as e:
-            print(f"Error getting revenue data: {e}")
-            return {"total_revenue": 0, "total_sales": 0, "average_sale": 0, "daily_revenue": []}
+    def _get_rollup_rows(self, start_date: datetime, end_date: datetime,
+                         rows: Optional[List[DailyFinancial]]) -> List[DailyFinancial]:
+        if rows is None:
+            rows = FinancialRollupService(self.db).get_daily_rows(start_date, end_date)
+        return rows
 
-    def _get_expenses_summary(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-        """Get expenses summary"""
+    def _get_revenue(self, start_date: datetime, end_date: datetime,
+                     rows: Optional[List[DailyFinancial]] = None) -> Dict[str, Any]:
+        """Get revenue data from the daily rollup"""
         
-        expenses_query = self.db.query(Expense).filter(
-            Expense.date >= start_date.date(),
-            Expense.date <= end_date.date()
-        )
+        sales_rows = [
+            row for row in self._get_rollup_rows(start_date, end_date, rows)
+            if row.category == SALES_CATEGORY and row.sales_count
+        ]
+        
+        total_revenue = sum(row.revenue for row in sales_rows)
+        total_sales = sum(row.sales_count for row in sales_rows)
+        average_sale = total_revenue / total_sales if total_sales > 0 else 0
+        
+        return {
+            "total_revenue": total_revenue,
+            "total_sales": total_sales,
+            "average_sale": average_sale,
+            "daily_revenue": [
+                {
+                    "date": row.day.isoformat(),
+                    "revenue": row.revenue
+                }
+                for row in sales_rows
+            ]
+        }
+
+    def _get_expenses_summary(self, start_date: datetime, end_date: datetime,
+                              rows: Optional[List[DailyFinancial]] = None) -> Dict[str, Any]:
+        """Get expenses summary from the daily rollup"""
         
-        expenses = expenses_query.all()
+        expense_rows = [
+            row for row in self._get_rollup_rows(start_date, end_date, rows)
+            if row.category != SALES_CATEGORY and row.expense_count
+        ]
         
-        total_expenses = sum(expense.amount for expense in expenses)
-        total_transactions = len(expenses)
+        total_expenses = sum(row.expenses for row in expense_rows)
+        total_transactions = sum(row.expense_count for row in expense_rows)
         average_expense = total_expenses / total_transactions if total_transactions > 0 else 0
         
-        # Get daily expenses
-        daily_expenses = self.db.query(
-            Expense.date,
-            func.sum(Expense.amount).label('amount')
-        ).filter(
-            Expense.date >= start_date.date(),
-            Expense.date <= end_date.date()
-        ).group_by(Expense.date).order_by(Expense.date).all()
+        # Rows are ordered by day, so consecutive categories of the same day collapse here
+        daily_expenses: Dict[str, float] = {}
+        for row in expense_rows:
+            day = row.day.isoformat()
+            daily_expenses[day] = daily_expenses.get(day, 0) + row.expenses
         
         return {
             "total_expenses": total_expenses,
@@ -184,85 +213,49 @@ class FinanceService:
             "average_expense": average_expense,
             "daily_expenses": [
                 {
-                    "date": day.date.isoformat(),
-                    "amount": day.amount
+                    "date": day,
+                    "amount": amount
                 }
-                for day in daily_expenses
+                for day, amount in daily_expenses.items()
             ]
         }
 
-    def _get_expense_breakdown(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
-        """Get expense breakdown by category"""
+    def _get_expense_breakdown(self, start_date: datetime, end_date: datetime,
+                               rows: Optional[List[DailyFinancial]] = None) -> List[Dict[str, Any]]:
+        """Get expense breakdown by category from the daily rollup"""
         
-        breakdown = self.db.query(
-            Expense.category,
-            func.sum(Expense.amount).label('total_amount'),
-            func.count(Expense.id).label('transaction_count')
-        ).filter(
-            Expense.date >= start_date.date(),
-            Expense.date <= end_date.date()
-        ).group_by(Expense.category).order_by(desc('total_amount')).all()
+        categories: Dict[str, Dict[str, Any]] = {}
+        for row in self._get_rollup_rows(start_date, end_date, rows):
+            if row.category == SALES_CATEGORY or not row.expense_count:
+                continue
+            item = categories.setdefault(row.category, {"total_amount": 0, "transaction_count": 0})
+            item["total_amount"] += row.expenses
+            item["transaction_count"] += row.expense_count
         
-        total_expenses = sum(item.total_amount for item in breakdown)
+        breakdown = sorted(categories.items(), key=lambda item: item[1]["total_amount"], reverse=True)
+        total_expenses = sum(item["total_amount"] for _, item in breakdown)
         
         return [
             {
-                "category": item.category,
-                "total_amount": item.total_amount,
-                "transaction_count": item.transaction_count,
-                "percentage": (item.total_amount / total_expenses * 100) if total_expenses > 0 else 0
+                "category": category,
+                "total_amount": item["total_amount"],
+                "transaction_count": item["transaction_count"],
+                "percentage": (item["total_amount"] / total_expenses * 100) if total_expenses > 0 else 0
             }
-            for item in breakdown
+            for category, item in breakdown
         ]
 
-    def _get_monthly_trends(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
-        """Get monthly financial trends"""
-        
-        # Get monthly revenue
-        try:
-            from app.models.sales import Sale
-            
-            monthly_revenue = self.db.query(
-                extract('year', Sale.created_at).label('year'),
-                extract('month', Sale.created_at).label('month'),
-                func.sum(Sale.total_amount).label('revenue')
-            ).filter(
-                Sale.created_at >= start_date,
-                Sale.created_at <= end_date
-            ).group_by(
-                extract('year', Sale.created_at),
-                extract('month', Sale.created_at)
-            ).order_by('year', 'month').all()
-            
-        except Exception:
-            monthly_revenue = []
-        
-        # Get monthly expenses
-        monthly_expenses = self.db.query(
-            extract('year', Expense.date).label('year'),
-            extract('month', Expense.date).label('month'),
-            func.sum(Expense.amount).label('expenses')
-        ).filter(
-            Expense.date >= start_date.date(),
-            Expense.date <= end_date.date()
-        ).group_by(
-            extract('year', Expense.date),
-            extract('month', Expense.date)
-        ).order_by('year', 'month').all()
+    def _get_monthly_trends(self, start_date: datetime, end_date: datetime,
+                            rows: Optional[List[DailyFinancial]] = None) -> List[Dict[str, Any]]:
+        """Get monthly financial trends from the daily rollup"""
         
         # Combine revenue and expenses by month
         trends = {}
-        
-        for rev in monthly_revenue:
-            key = f"{int(rev.year)}-{int(rev.month):02d}"
-            trends[key] = {"revenue": rev.revenue, "expenses": 0}
-        
-        for exp in monthly_expenses:
-            key = f"{int(exp.year)}-{int(exp.month):02d}"
-            if key in trends:
-                trends[key]["expenses"] = exp.expenses
-            else:
-                trends[key] = {"revenue": 0, "expenses": exp.expenses}
+        for row in self._get_rollup_rows(start_date, end_date, rows):
+            key = row.day.strftime('%Y-%m')
+            month = trends.setdefault(key, {"revenue": 0, "expenses": 0})
+            month["revenue"] += row.revenue
+            month["expenses"] += row.expenses
         
         # Convert to list and calculate profit
         result = []
@@ -277,65 +270,85 @@ class FinanceService:
         
         return result
 
-    def get_cash_flow_analysis(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-        """Get cash flow analysis"""
-        
-        # Get daily cash flow
-        daily_cash_flow = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            # Get revenue for the day
-            try:
-                from app.models.sales import Sale
-                
-                daily_revenue = self.db.query(
-                    func.sum(Sale.total_amount)
-                ).filter(
-                    func.date(Sale.created_at) == current_date.date()
-                ).scalar() or 0
-                
-            except Exception:
-                daily_revenue = 0
-            
-            # Get expenses for the day
-            daily_expenses = self.db.query(
-                func.sum(Expense.amount)
-            ).filter(
-                Expense.date == current_date.date()
-            ).scalar() or 0
-            
-            net_cash_flow = daily_revenue - daily_expenses
-            
-            daily_cash_flow.append({
-                "date": current_date.strftime('%Y-%m-%d'),
-                "revenue": daily_revenue,
-                "expenses": daily_expenses,
-                "net_cash_flow": net_cash_flow
-            })
-            
-            current_date += timedelta(days=1)
+    def get_cash_flow_analysis(self, start_date: datetime, end_date: datetime,
+                               granularity: str = "daily") -> Dict[str, Any]:
+        """Get cash flow analysis at daily, weekly or monthly granularity"""
+        
+        if granularity not in CASH_FLOW_GRANULARITIES:
+            raise ValueError(f"Unsupported granularity. Use one of {', '.join(CASH_FLOW_GRANULARITIES)}")
+        
+        # Dense daily series for the whole range; missing days stay at zero
+        days = np.arange(np.datetime64(start_date.date(), 'D'), np.datetime64(end_date.date(), 'D') + 1)
+        revenue = np.zeros(len(days))
+        expenses = np.zeros(len(days))
+        
+        # Single grouped query over the daily rollup
+        rows = self.db.query(
+            DailyFinancial.day,
+            func.sum(DailyFinancial.revenue).label('revenue'),
+            func.sum(DailyFinancial.expenses).label('expenses')
+        ).filter(
+            DailyFinancial.day >= start_date.date(),
+            DailyFinancial.day <= end_date.date()
+        ).group_by(DailyFinancial.day).all()
         
-        # Calculate cumulative cash flow
-        cumulative_cash_flow = 0
-        for day in daily_cash_flow:
-            cumulative_cash_flow += day["net_cash_flow"]
-            day["cumulative_cash_flow"] = cumulative_cash_flow
+        if rows and len(days):
+            offsets = (np.array([row.day for row in rows], dtype='datetime64[D]') - days[0]).astype(np.int64)
+            revenue[offsets] = [row.revenue or 0 for row in rows]
+            expenses[offsets] = [row.expenses or 0 for row in rows]
+        
+        periods, revenue, expenses = self._bucket_cash_flow(days, revenue, expenses, granularity)
+        net_cash_flow = revenue - expenses
+        cumulative_cash_flow = np.cumsum(net_cash_flow)
+        
+        cash_flow = [
+            {
+                "date": str(period),
+                "revenue": float(period_revenue),
+                "expenses": float(period_expenses),
+                "net_cash_flow": float(period_net),
+                "cumulative_cash_flow": float(period_cumulative)
+            }
+            for period, period_revenue, period_expenses, period_net, period_cumulative in zip(
+                periods.astype('datetime64[D]'), revenue, expenses, net_cash_flow, cumulative_cash_flow
+            )
+        ]
         
         # Calculate cash flow metrics
-        total_inflow = sum(day["revenue"] for day in daily_cash_flow)
-        total_outflow = sum(day["expenses"] for day in daily_cash_flow)
-        net_cash_flow = total_inflow - total_outflow
+        total_inflow = float(revenue.sum())
+        total_outflow = float(expenses.sum())
         
-        return {
+        result = {
             "summary": {
                 "total_inflow": total_inflow,
                 "total_outflow": total_outflow,
-                "net_cash_flow": net_cash_flow,
+                "net_cash_flow": total_inflow - total_outflow,
                 "cash_flow_ratio": (total_inflow / total_outflow) if total_outflow > 0 else 0
             },
-            "daily_cash_flow": daily_cash_flow
+            "granularity": granularity,
+            "cash_flow": cash_flow
         }
+        if granularity == "daily":
+            result["daily_cash_flow"] = cash_flow
+        return result
+
+    @staticmethod
+    def _bucket_cash_flow(days: np.ndarray, revenue: np.ndarray, expenses: np.ndarray,
+                          granularity: str) -> tuple:
+        """Sum a dense daily series into weekly (ISO, Monday start) or monthly buckets"""
+        
+        if granularity == "daily" or not len(days):
+            return days, revenue, expenses
+        
+        if granularity == "weekly":
+            # datetime64 day 0 (1970-01-01) is a Thursday
+            keys = days - ((days.astype(np.int64) + 3) % 7)
+        else:
+            keys = days.astype('datetime64[M]').astype('datetime64[D]')
+        
+        # Days are sorted, so every bucket is a contiguous run
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        return keys[starts], np.add.reduceat(revenue, starts), np.add.reduceat(expenses, starts)
 
     def get_budget_analysis(self, budget_data: Dict[str, float], 
                           start_date: datetime, end_date: datetime) -> Dict[str, Any]:
@@ -517,6 +530,170 @@ class FinanceService:
         buffer.seek(0)
         return buffer.read()
 
+    def stream_financial_report(self, format: str, start_date: datetime, end_date: datetime,
+                                include_ledger: bool = False) -> Iterator[bytes]:
+        """Stream a financial report, optionally with the full transaction ledger.
+
+        The report is rendered into a temporary file while the ledger is read
+        in ``yield_per`` chunks, then sent back in fixed-size blocks, so memory
+        stays bounded however many transactions fall in the period.
+        """
+        
+        if format.lower() not in ("pdf", "excel"):
+            raise ValueError("Unsupported format. Use 'pdf' or 'excel'")
+        
+        return self._iter_report(format.lower(), start_date, end_date, include_ledger)
+
+    def _iter_report(self, format: str, start_date: datetime, end_date: datetime,
+                     include_ledger: bool) -> Iterator[bytes]:
+        financial_data = self.get_financial_summary(start_date, end_date)
+        
+        with tempfile.TemporaryFile() as report_file:
+            if format == "pdf":
+                if include_ledger:
+                    self._write_pdf_ledger_report(financial_data, start_date, end_date, report_file)
+                else:
+                    report_file.write(self._export_pdf_report(financial_data))
+            else:
+                self._write_excel_report(financial_data, start_date, end_date, include_ledger, report_file)
+            
+            report_file.seek(0)
+            while True:
+                chunk = report_file.read(EXPORT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+    def _iter_sales_ledger(self, start_date: datetime, end_date: datetime) -> Iterator[tuple]:
+        """Sales rows as plain tuples, fetched in chunks without ORM hydration"""
+        from app.models.sales import Sale
+        
+        return self.db.query(
+            Sale.id,
+            Sale.created_at,
+            Sale.payment_method,
+            Sale.customer_name,
+            Sale.tax_amount,
+            Sale.total_amount
+        ).filter(
+            Sale.created_at >= start_date,
+            Sale.created_at <= end_date
+        ).order_by(Sale.created_at, Sale.id).yield_per(LEDGER_BATCH_SIZE)
+
+    def _iter_expense_ledger(self, start_date: datetime, end_date: datetime) -> Iterator[tuple]:
+        """Expense rows as plain tuples, fetched in chunks without ORM hydration"""
+        return self.db.query(
+            Expense.id,
+            Expense.date,
+            Expense.category,
+            Expense.vendor,
+            Expense.description,
+            Expense.amount
+        ).filter(
+            Expense.date >= start_date.date(),
+            Expense.date <= end_date.date()
+        ).order_by(Expense.date, Expense.id).yield_per(LEDGER_BATCH_SIZE)
+
+    def _write_excel_report(self, data: Dict[str, Any], start_date: datetime, end_date: datetime,
+                            include_ledger: bool, fileobj) -> None:
+        """Write the Excel report with write-only worksheets"""
+        
+        wb = Workbook(write_only=True)
+        
+        ws_summary = wb.create_sheet("Financial Summary")
+        ws_summary.append(["Financial Report"])
+        ws_summary.append([f"Period: {data['period']['start_date']} to {data['period']['end_date']}"])
+        ws_summary.append([])
+        ws_summary.append(["Metric", "Amount"])
+        ws_summary.append(["Total Revenue", data['summary']['total_revenue']])
+        ws_summary.append(["Total Expenses", data['summary']['total_expenses']])
+        ws_summary.append(["Profit/Loss", data['summary']['profit_loss']])
+        ws_summary.append(["Profit Margin", f"{data['summary']['profit_margin']:.2f}%"])
+        
+        if data['expense_breakdown']:
+            ws_expenses = wb.create_sheet("Expense Breakdown")
+            ws_expenses.append(["Category", "Amount", "Percentage"])
+            for item in data['expense_breakdown']:
+                ws_expenses.append([item['category'], item['total_amount'], f"{item['percentage']:.1f}%"])
+        
+        if data['monthly_trends']:
+            ws_trends = wb.create_sheet("Monthly Trends")
+            ws_trends.append(["Period", "Revenue", "Expenses", "Profit"])
+            for item in data['monthly_trends']:
+                ws_trends.append([item['period'], item['revenue'], item['expenses'], item['profit']])
+        
+        if include_ledger:
+            ws_sales = wb.create_sheet("Sales Ledger")
+            ws_sales.append(["Sale ID", "Date", "Payment Method", "Customer", "Tax", "Total"])
+            for sale_id, created_at, payment_method, customer, tax, total in self._iter_sales_ledger(start_date, end_date):
+                ws_sales.append([sale_id, _naive(created_at), payment_method, customer, tax, total])
+            
+            ws_ledger = wb.create_sheet("Expense Ledger")
+            ws_ledger.append(["Expense ID", "Date", "Category", "Vendor", "Description", "Amount"])
+            for expense_id, expense_date, category, vendor, description, amount in self._iter_expense_ledger(start_date, end_date):
+                ws_ledger.append([expense_id, _naive(expense_date), _category_label(category), vendor, description, amount])
+        
+        wb.save(fileobj)
+
+    def _write_pdf_ledger_report(self, data: Dict[str, Any], start_date: datetime, end_date: datetime,
+                                 fileobj) -> None:
+        """Write the PDF report with ledger pages drawn row by row on a canvas"""
+        
+        pdf = canvas.Canvas(fileobj, pagesize=letter)
+        width, height = letter
+        margin = 50
+        line_height = 14
+        y = height - margin
+        
+        def write_line(text: str, font: str = "Helvetica", size: int = 9, columns: Optional[List[float]] = None) -> None:
+            nonlocal y
+            if y < margin:
+                pdf.showPage()
+                y = height - margin
+            pdf.setFont(font, size)
+            if columns:
+                for offset, value in zip(columns, text):
+                    pdf.drawString(margin + offset, y, str(value))
+            else:
+                pdf.drawString(margin, y, text)
+            y -= line_height
+        
+        write_line("Financial Report", "Helvetica-Bold", 18)
+        write_line(f"Period: {data['period']['start_date']} to {data['period']['end_date']}", size=10)
+        write_line("")
+        write_line(f"Total Revenue: ${data['summary']['total_revenue']:.2f}", size=10)
+        write_line(f"Total Expenses: ${data['summary']['total_expenses']:.2f}", size=10)
+        write_line(f"Profit/Loss: ${data['summary']['profit_loss']:.2f}", size=10)
+        write_line(f"Profit Margin: {data['summary']['profit_margin']:.2f}%", size=10)
+        
+        if data['expense_breakdown']:
+            write_line("")
+            write_line("Expense Breakdown by Category", "Helvetica-Bold", 12)
+            for item in data['expense_breakdown']:
+                write_line(f"{item['category']}: ${item['total_amount']:.2f} ({item['percentage']:.1f}%)")
+        
+        sales_columns = [0, 60, 190, 290, 420]
+        write_line("")
+        write_line("Sales Ledger", "Helvetica-Bold", 12)
+        write_line(("ID", "Date", "Payment", "Customer", "Total"), "Helvetica-Bold", columns=sales_columns)
+        for sale_id, created_at, payment_method, customer, tax, total in self._iter_sales_ledger(start_date, end_date):
+            write_line(
+                (sale_id, f"{created_at:%Y-%m-%d %H:%M}", payment_method, (customer or "")[:24], f"${total:.2f}"),
+                columns=sales_columns
+            )
+        
+        expense_columns = [0, 60, 140, 240, 420]
+        write_line("")
+        write_line("Expense Ledger", "Helvetica-Bold", 12)
+        write_line(("ID", "Date", "Category", "Description", "Amount"), "Helvetica-Bold", columns=expense_columns)
+        for expense_id, expense_date, category, vendor, description, amount in self._iter_expense_ledger(start_date, end_date):
+            write_line(
+                (expense_id, f"{expense_date:%Y-%m-%d}", _category_label(category), (description or "")[:34], f"${amount:.2f}"),
+                columns=expense_columns
+            )
+        
+        pdf.save()
+
     def get_tax_report(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         """Generate tax report for the specified period"""
         
@@ -634,4 +811,98 @@ class FinanceService:
                 "recommendation": "Focus on increasing revenue or reducing expenses"
             })
         
-        return insights
\ No newline at end of file
+        return insights
+
+class AsyncFinanceService:
+    """Non-blocking variant of FinanceService for async endpoints.
+
+    Expense CRUD runs natively on the AsyncSession; the multi-query reports
+    reuse the synchronous implementation through ``AsyncSession.run_sync``.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_expense(self, expense_create: ExpenseCreate) -> Expense:
+        db_expense = Expense(**expense_create.dict())
+        self.db.add(db_expense)
+        await self.db.run_sync(
+            lambda session: FinancialRollupService(session).record_expense(
+                db_expense.date, db_expense.category, db_expense.amount
+            )
+        )
+        await self.db.commit()
+        await self.db.refresh(db_expense)
+        return db_expense
+
+    async def get_expense(self, expense_id: int) -> Optional[Expense]:
+        result = await self.db.execute(select(Expense).where(Expense.id == expense_id))
+        return result.scalars().first()
+
+    async def get_expenses(self, skip: int = 0, limit: int = 100,
+                           start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None,
+                           category: Optional[str] = None,
+                           cursor: Optional[str] = None) -> List[Expense]:
+        query = select(Expense)
+
+        if start_date:
+            query = query.where(Expense.date >= start_date.date())
+        if end_date:
+            query = query.where(Expense.date <= end_date.date())
+        if category:
+            query = query.where(Expense.category == category)
+
+        query = keyset_paginate(query, EXPENSE_PAGE_KEYS, cursor, descending=True)
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def update_expense(self, expense_id: int, expense_update: ExpenseUpdate) -> Optional[Expense]:
+        db_expense = await self.get_expense(expense_id)
+        if not db_expense:
+            return None
+
+        previous = (db_expense.date, db_expense.category, db_expense.amount)
+        update_data = expense_update.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_expense, field, value)
+
+        await self.db.run_sync(FinanceService._rebook_expense, db_expense, previous)
+
+        await self.db.commit()
+        await self.db.refresh(db_expense)
+        return db_expense
+
+    async def delete_expense(self, expense_id: int) -> bool:
+        db_expense = await self.get_expense(expense_id)
+        if not db_expense:
+            return False
+
+        await self.db.run_sync(
+            lambda session: FinancialRollupService(session).record_expense(
+                db_expense.date, db_expense.category, db_expense.amount, sign=-1
+            )
+        )
+        await self.db.delete(db_expense)
+        await self.db.commit()
+        return True
+
+    async def get_expense_categories(self) -> List[str]:
+        result = await self.db.execute(select(Expense.category).distinct())
+        return [cat for cat in result.scalars().all() if cat]
+
+    async def get_financial_summary(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        return await self.db.run_sync(
+            lambda session: FinanceService(session).get_financial_summary(start_date, end_date)
+        )
+
+    async def get_cash_flow_analysis(self, start_date: datetime, end_date: datetime,
+                                     granularity: str = "daily") -> Dict[str, Any]:
+        return await self.db.run_sync(
+            lambda session: FinanceService(session).get_cash_flow_analysis(start_date, end_date, granularity)
+        )
+
+    async def get_financial_insights(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+        return await self.db.run_sync(
+            lambda session: FinanceService(session).get_financial_insights(start_date, end_date)
+        )
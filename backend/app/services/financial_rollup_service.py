@@ -0,0 +1,132 @@
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, Union, Iterable, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, delete, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import date, datetime
+from app.models.finance import DailyFinancial, Expense, ExpenseCategory
+
+SALES_CATEGORY = "sales"
+METRICS = ("revenue", "expenses", "sales_count", "expense_count")
+
+
+def _to_day(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def parse_day(value: Union[str, date, datetime]) -> date:
+    # SQLite returns DATE() results as ISO strings
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return _to_day(value)
+
+
+def _category_key(category: Union[ExpenseCategory, str, None]) -> str:
+    if isinstance(category, ExpenseCategory):
+        return category.value
+    return str(category) if category else ExpenseCategory.OTHER.value
+
+
+class FinancialRollupService:
+    """Maintains the ``daily_financials`` rollup.
+
+    Writers call ``record_sale`` / ``record_expense`` inside their own
+    transaction with ``sign=-1`` to retract a previous booking, so the
+    rollup commits or rolls back together with the source row.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_sale(self, created_at: Union[date, datetime], amount: float, sign: int = 1) -> None:
+        self._apply(_to_day(created_at), SALES_CATEGORY, revenue=sign * (amount or 0.0), sales_count=sign)
+
+    def record_sales(self, sales: Iterable[Tuple[Union[date, datetime], float]]) -> None:
+        """Book many (created_at, amount) sales with one upsert per day."""
+        totals = defaultdict(lambda: [0.0, 0])
+        for created_at, amount in sales:
+            day_totals = totals[_to_day(created_at)]
+            day_totals[0] += amount or 0.0
+            day_totals[1] += 1
+        for day, (revenue, count) in totals.items():
+            self._apply(day, SALES_CATEGORY, revenue=revenue, sales_count=count)
+
+    def record_expense(self, expense_date: Union[date, datetime],
+                       category: Union[ExpenseCategory, str, None],
+                       amount: float, sign: int = 1) -> None:
+        self._apply(_to_day(expense_date), _category_key(category),
+                    expenses=sign * (amount or 0.0), expense_count=sign)
+
+    def _apply(self, day: date, category: str, **deltas: float) -> None:
+        values = {metric: deltas.get(metric, 0) for metric in METRICS}
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect in ("sqlite", "postgresql"):
+            insert_fn = sqlite_insert if dialect == "sqlite" else pg_insert
+            stmt = insert_fn(DailyFinancial).values(day=day, category=category, **values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["day", "category"],
+                set_={
+                    metric: getattr(DailyFinancial, metric) + getattr(stmt.excluded, metric)
+                    for metric in METRICS
+                } | {"updated_at": func.now()}
+            )
+            self.db.execute(stmt)
+            return
+
+        # Generic fallback for dialects without ON CONFLICT support
+        row = self.db.query(DailyFinancial).filter(
+            DailyFinancial.day == day,
+            DailyFinancial.category == category
+        ).with_for_update().first()
+        if row is None:
+            self.db.add(DailyFinancial(day=day, category=category, **values))
+        else:
+            for metric, delta in values.items():
+                setattr(row, metric, getattr(row, metric) + delta)
+        self.db.flush()
+
+    def get_daily_rows(self, start_date: Union[date, datetime], end_date: Union[date, datetime],
+                       category: Optional[str] = None) -> List[DailyFinancial]:
+        query = self.db.query(DailyFinancial).filter(
+            DailyFinancial.day >= _to_day(start_date),
+            DailyFinancial.day <= _to_day(end_date)
+        )
+        if category:
+            query = query.filter(DailyFinancial.category == category)
+        return query.order_by(DailyFinancial.day).all()
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Recompute the rollup from the raw sales and expenses tables."""
+        from app.models.sales import Sale
+
+        self.db.execute(delete(DailyFinancial))
+
+        sales = self.db.query(
+            func.date(Sale.created_at).label('day'),
+            func.sum(Sale.total_amount).label('revenue'),
+            func.count(Sale.id).label('sales_count')
+        ).group_by(func.date(Sale.created_at)).all()
+
+        expenses = self.db.query(
+            func.date(Expense.date).label('day'),
+            Expense.category,
+            func.sum(Expense.amount).label('expenses'),
+            func.count(Expense.id).label('expense_count')
+        ).group_by(func.date(Expense.date), Expense.category).all()
+
+        rows = [
+            {"day": parse_day(row.day), "category": SALES_CATEGORY, "revenue": row.revenue or 0.0,
+             "expenses": 0.0, "sales_count": row.sales_count, "expense_count": 0}
+            for row in sales
+        ] + [
+            {"day": parse_day(row.day), "category": _category_key(row.category), "revenue": 0.0,
+             "expenses": row.expenses or 0.0, "sales_count": 0, "expense_count": row.expense_count}
+            for row in expenses
+        ]
+        if rows:
+            self.db.execute(insert(DailyFinancial), rows)
+        self.db.commit()
+
+        return {"days": len({row["day"] for row in rows}), "rows": len(rows)}
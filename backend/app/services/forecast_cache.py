@@ -0,0 +1,217 @@
+"""
+Forecast Cache for BusinessPilot AI
+Disk-backed store of fitted forecast models and their predictions
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "default"
+
+
+@dataclass
+class ForecastCacheEntry:
+    """Predictions of one fitted series plus what they were fitted on"""
+    tenant: str
+    series: str
+    horizon: int
+    fitted_at: str
+    data_points: int
+    last_observation: Optional[str]
+    predictions: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.now() - datetime.fromisoformat(self.fitted_at)).total_seconds()
+
+
+class ForecastCache:
+    """Stale-while-revalidate cache keyed by (tenant, series, horizon).
+
+    Each entry is a small JSON file with the predictions and a sidecar file
+    with the serialized model parameters. An entry goes stale once enough new
+    observations arrived since the fit, or once it is older than the maximum
+    age; stale entries are still served while a background thread refits.
+    """
+
+    _refreshing: set = set()
+    # Per-key (lock, holders and waiters) for synchronous fits on a miss
+    _fit_locks: Dict[Tuple[str, str, str, int], Tuple[threading.Lock, int]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_age_seconds: Optional[int] = None,
+                 refit_min_new_points: Optional[int] = None):
+        self.cache_dir = cache_dir or settings.FORECAST_CACHE_DIR
+        self.max_age_seconds = max_age_seconds if max_age_seconds is not None else settings.FORECAST_CACHE_MAX_AGE_SECONDS
+        self.refit_min_new_points = (
+            refit_min_new_points if refit_min_new_points is not None else settings.FORECAST_REFIT_MIN_NEW_POINTS
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, tenant: str, series: str, horizon: int, suffix: str = "json") -> str:
+        digest = hashlib.sha1(f"{tenant}|{series}|{horizon}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.{suffix}")
+
+    def get(self, tenant: str, series: str, horizon: int) -> Optional[ForecastCacheEntry]:
+        try:
+            with open(self._path(tenant, series, horizon)) as f:
+                return ForecastCacheEntry(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable forecast cache entry for {series}: {e}")
+            return None
+
+    def get_model(self, tenant: str, series: str, horizon: int) -> Optional[str]:
+        try:
+            with open(self._path(tenant, series, horizon, "model.json")) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, entry: ForecastCacheEntry, model_json: Optional[str] = None) -> None:
+        if model_json is not None:
+            self._atomic_write(self._path(entry.tenant, entry.series, entry.horizon, "model.json"), model_json)
+        self._atomic_write(self._path(entry.tenant, entry.series, entry.horizon), json.dumps(asdict(entry)))
+
+    def invalidate(self, tenant: str, series: str, horizon: int) -> None:
+        for suffix in ("json", "model.json"):
+            try:
+                os.remove(self._path(tenant, series, horizon, suffix))
+            except FileNotFoundError:
+                pass
+
+    def is_stale(self, entry: ForecastCacheEntry, data_points: int,
+                 last_observation: Optional[str]) -> bool:
+        """Whether enough new observations arrived since the fit, or it is too old.
+
+        New observations are counted both by how many more there are and by how
+        many days the last one moved on, so a series whose count stayed the same
+        while its data moved forward is refitted too. Fewer observations or an
+        earlier last one means history was removed, which always refits.
+        """
+        new_points = data_points - entry.data_points
+        if last_observation and entry.last_observation and last_observation != entry.last_observation:
+            days_on = (datetime.fromisoformat(last_observation) - datetime.fromisoformat(entry.last_observation)).days
+            if days_on < 0:
+                return True
+            new_points = max(new_points, days_on)
+        elif bool(last_observation) != bool(entry.last_observation):
+            return True
+        return new_points >= self.refit_min_new_points or new_points < 0 or entry.age_seconds >= self.max_age_seconds
+
+    def get_or_fit(self, tenant: str, series: str, horizon: int,
+                   fingerprint: Tuple[int, Optional[str]],
+                   fit: Callable[[], Tuple[List[Dict[str, Any]], Optional[str]]],
+                   background_fit: Optional[Callable[[], Tuple[List[Dict[str, Any]], Optional[str]]]] = None
+                   ) -> List[Dict[str, Any]]:
+        """Serve predictions from cache, fitting synchronously only on a miss.
+
+        ``fingerprint`` is (number of observations, last observation) of the
+        series right now; ``fit`` returns (predictions, model_json). When the
+        cached entry is stale, ``background_fit`` (which must open its own
+        database session) refits on a daemon thread. Concurrent misses of the
+        same key in this process wait for a single fit.
+        """
+        data_points, last_observation = fingerprint
+        entry = self.get(tenant, series, horizon)
+
+        if entry is None:
+            with self._fitting(tenant, series, horizon):
+                # Another request may have fitted it while this one waited
+                entry = self.get(tenant, series, horizon)
+                if entry is None:
+                    predictions, model_json = fit()
+                    self.store(tenant, series, horizon, fingerprint, predictions, model_json)
+                    return predictions
+
+        if self.is_stale(entry, data_points, last_observation) and background_fit is not None:
+            self._refresh_in_background(tenant, series, horizon, fingerprint, background_fit)
+
+        return entry.predictions
+
+    def store(self, tenant: str, series: str, horizon: int, fingerprint: Tuple[int, Optional[str]],
+               predictions: List[Dict[str, Any]], model_json: Optional[str]) -> None:
+        data_points, last_observation = fingerprint
+        self.put(ForecastCacheEntry(
+            tenant=tenant,
+            series=series,
+            horizon=horizon,
+            fitted_at=datetime.now().isoformat(),
+            data_points=data_points,
+            last_observation=last_observation,
+            predictions=predictions
+        ), model_json)
+
+    def _refresh_in_background(self, tenant: str, series: str, horizon: int,
+                               fingerprint: Tuple[int, Optional[str]],
+                               fit: Callable[[], Tuple[List[Dict[str, Any]], Optional[str]]]) -> None:
+        if not self.begin_refresh(tenant, series, horizon):
+            return
+
+        def run():
+            try:
+                predictions, model_json = fit()
+                self.store(tenant, series, horizon, fingerprint, predictions, model_json)
+                logger.info(f"Refreshed forecast cache for {series} ({horizon} days)")
+            except Exception as e:
+                logger.error(f"Background forecast refresh failed for {series}: {e}")
+            finally:
+                self.end_refresh(tenant, series, horizon)
+
+        threading.Thread(target=run, name=f"forecast-refresh-{series}", daemon=True).start()
+
+    def begin_refresh(self, tenant: str, series: str, horizon: int) -> bool:
+        """Claim a refit of the series, False if one is already running"""
+        key = (self.cache_dir, tenant, series, horizon)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, tenant: str, series: str, horizon: int) -> None:
+        with self._lock:
+            self._refreshing.discard((self.cache_dir, tenant, series, horizon))
+
+    @contextmanager
+    def _fitting(self, tenant: str, series: str, horizon: int) -> Iterator[None]:
+        """Hold the series' fit lock, dropping it once nobody needs it"""
+        key = (self.cache_dir, tenant, series, horizon)
+        with self._lock:
+            lock, users = self._fit_locks.get(key, (threading.Lock(), 0))
+            self._fit_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._fit_locks[key]
+                if users == 1:
+                    del self._fit_locks[key]
+                else:
+                    self._fit_locks[key] = (lock, users - 1)
+
+    @staticmethod
+    def _atomic_write(path: str, content: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
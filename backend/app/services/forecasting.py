@@ -0,0 +1,316 @@
+"""
+Forecasting Engines for BusinessPilot AI
+Pluggable daily-series forecasters: Prophet and NumPy-only alternatives
+"""
+
+import json
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+SEASON_LENGTH = 7  # weekly seasonality on daily data
+CHUNKS_PER_WORKER = 4  # smaller chunks let partial batches finish within a timeout
+INTERVAL_Z = 1.2816  # 80% interval, matching Prophet's default interval_width
+
+Series = Tuple[Sequence[date], Sequence[float]]
+
+
+@dataclass
+class ForecastResult:
+    """Point forecast and prediction interval for the days after the history"""
+    dates: List[date]
+    yhat: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    model_json: Optional[str] = None
+
+    def to_records(self, value_key: str) -> List[Dict[str, float]]:
+        """API rows with negative values clamped to zero"""
+        return [
+            {
+                "date": day.strftime('%Y-%m-%d'),
+                value_key: max(0.0, float(yhat)),
+                "lower_bound": max(0.0, float(lower)),
+                "upper_bound": max(0.0, float(upper))
+            }
+            for day, yhat, lower, upper in zip(self.dates, self.yhat, self.lower, self.upper)
+        ]
+
+
+class ForecastEngine:
+    """Base class for forecasting engines.
+
+    Engines take a daily history as (dates, values) and return ``horizon``
+    predictions starting the day after the last observation.
+    """
+
+    name = "base"
+    # Whether batches are worth spreading over processes; vectorized engines are not
+    parallel_batch = True
+
+    def forecast(self, ds: Sequence[date], y: Sequence[float], horizon: int) -> ForecastResult:
+        raise NotImplementedError
+
+    def forecast_batch(self, series: List[Series], horizon: int) -> List[ForecastResult]:
+        return [self.forecast(ds, y, horizon) for ds, y in series]
+
+
+def _densify(ds: Sequence[date], y: Sequence[float]) -> Tuple[date, np.ndarray]:
+    """Daily series from first to last observation, missing days as zero"""
+    first = min(ds)
+    offsets = np.array([(day - first).days for day in ds])
+    values = np.zeros(offsets.max() + 1)
+    np.add.at(values, offsets, np.asarray(y, dtype=float))
+    return first, values
+
+
+def _future_dates(last: date, horizon: int) -> List[date]:
+    return [last + timedelta(days=h) for h in range(1, horizon + 1)]
+
+
+class ProphetEngine(ForecastEngine):
+    """Prophet with daily, weekly and yearly seasonality"""
+
+    name = "prophet"
+
+    def forecast(self, ds: Sequence[date], y: Sequence[float], horizon: int) -> ForecastResult:
+        # Imported lazily, Prophet is slow to import and optional for the NumPy engines
+        import pandas as pd
+        from prophet import Prophet
+        from prophet.serialize import model_to_json
+
+        df = pd.DataFrame({"ds": pd.to_datetime(list(ds)), "y": np.asarray(y, dtype=float)})
+
+        model = Prophet(
+            daily_seasonality=True,
+            weekly_seasonality=True,
+            yearly_seasonality=True
+        )
+        model.fit(df)
+
+        future = model.make_future_dataframe(periods=horizon)
+        forecast = model.predict(future).tail(horizon)
+
+        return ForecastResult(
+            dates=[timestamp.date() for timestamp in forecast['ds']],
+            yhat=forecast['yhat'].to_numpy(),
+            lower=forecast['yhat_lower'].to_numpy(),
+            upper=forecast['yhat_upper'].to_numpy(),
+            model_json=model_to_json(model)
+        )
+
+
+class HoltWintersEngine(ForecastEngine):
+    """Additive damped-trend Holt-Winters with weekly seasonality.
+
+    Smoothing parameters are picked per series from a small grid by in-sample
+    one-step SSE. The recursion runs over time only, vectorized across series
+    and grid points, so a batch of thousands of series costs one pass.
+    """
+
+    name = "holt_winters"
+    parallel_batch = False
+
+    ALPHAS = (0.1, 0.3, 0.5, 0.8)
+    BETAS = (0.0, 0.05, 0.2)
+    GAMMAS = (0.05, 0.2, 0.5)
+    PHI = 0.98
+
+    def forecast(self, ds: Sequence[date], y: Sequence[float], horizon: int) -> ForecastResult:
+        return self.forecast_batch([(ds, y)], horizon)[0]
+
+    def forecast_batch(self, series: List[Series], horizon: int) -> List[ForecastResult]:
+        if not series:
+            return []
+
+        m = SEASON_LENGTH
+        dense = [_densify(ds, y) for ds, y in series]
+        length = max(m, max(len(values) for _, values in dense))
+
+        # Right-align the series; the left padding repeats each series' first
+        # week in phase so the recursion starts from a steady state
+        Y = np.empty((len(dense), length))
+        observed = np.zeros((len(dense), length), dtype=bool)
+        for row, (_, values) in enumerate(dense):
+            start = length - len(values)
+            first_week = values[:m] if len(values) >= m else np.resize(values, m)
+            Y[row, :start] = first_week[(np.arange(start) - start) % m]
+            Y[row, start:] = values
+            observed[row, start:] = True
+
+        grid = np.array([(a, b, g) for a in self.ALPHAS for b in self.BETAS for g in self.GAMMAS])
+        alpha, beta, gamma = (grid[:, i][None, :] for i in range(3))
+        phi = self.PHI
+
+        level = np.repeat(Y[:, :m].mean(axis=1, keepdims=True), len(grid), axis=1)
+        if length >= 2 * m:
+            trend0 = (Y[:, m:2 * m].mean(axis=1) - Y[:, :m].mean(axis=1)) / m
+        else:
+            trend0 = np.zeros(len(dense))
+        trend = np.repeat(trend0[:, None], len(grid), axis=1)
+        seasonal = np.repeat((Y[:, :m] - level[:, :1])[:, None, :], len(grid), axis=1)
+        sse = np.zeros_like(level)
+
+        for t in range(length):
+            y_t = Y[:, t][:, None]
+            s_t = seasonal[:, :, t % m]
+            error = y_t - (level + phi * trend + s_t)
+            sse += np.where(observed[:, t][:, None], error ** 2, 0.0)
+
+            new_level = alpha * (y_t - s_t) + (1 - alpha) * (level + phi * trend)
+            trend = beta * (new_level - level) + (1 - beta) * phi * trend
+            seasonal[:, :, t % m] = gamma * (y_t - new_level) + (1 - gamma) * s_t
+            level = new_level
+
+        rows = np.arange(len(dense))
+        best = sse.argmin(axis=1)
+        a, b, g = grid[best, 0], grid[best, 1], grid[best, 2]
+        level, trend = level[rows, best], trend[rows, best]
+        seasonal = seasonal[rows, best, :]
+        sigma = np.sqrt(sse[rows, best] / np.maximum(observed.sum(axis=1), 1))
+
+        h = np.arange(1, horizon + 1)
+        damped = np.cumsum(phi ** h)  # phi + phi^2 + ... + phi^h
+        season_index = (length + h - 1) % m
+        yhat = level[:, None] + damped[None, :] * trend[:, None] + seasonal[:, season_index]
+
+        # Variance of the h-step error for the additive damped model:
+        # sigma^2 * (1 + sum_{j<h} c_j^2), c_j = alpha * (1 + beta * damped_j) + gamma * [j % m == 0]
+        j = h[:-1] if horizon > 1 else np.array([], dtype=int)
+        c = a[:, None] * (1 + b[:, None] * damped[None, :len(j)]) + g[:, None] * (j % m == 0)[None, :]
+        variance = np.concatenate([np.ones((len(dense), 1)), 1 + np.cumsum(c ** 2, axis=1)], axis=1)[:, :horizon]
+        width = INTERVAL_Z * sigma[:, None] * np.sqrt(variance)
+
+        results = []
+        for row, (first, values) in enumerate(dense):
+            last = first + timedelta(days=len(values) - 1)
+            params = {
+                "engine": self.name,
+                "alpha": float(a[row]), "beta": float(b[row]), "gamma": float(g[row]), "phi": phi,
+                "level": float(level[row]), "trend": float(trend[row]),
+                "seasonal": seasonal[row].tolist(), "sigma": float(sigma[row]),
+                "last_observation": last.isoformat()
+            }
+            results.append(ForecastResult(
+                dates=_future_dates(last, horizon),
+                yhat=yhat[row],
+                lower=yhat[row] - width[row],
+                upper=yhat[row] + width[row],
+                model_json=json.dumps(params)
+            ))
+        return results
+
+
+class SeasonalNaiveEngine(ForecastEngine):
+    """Repeats the last observed week; intervals from week-over-week residuals"""
+
+    name = "seasonal_naive"
+    parallel_batch = False
+
+    def forecast(self, ds: Sequence[date], y: Sequence[float], horizon: int) -> ForecastResult:
+        m = SEASON_LENGTH
+        first, values = _densify(ds, y)
+        last = first + timedelta(days=len(values) - 1)
+        if len(values) < m:
+            values = np.resize(values, m)
+
+        h = np.arange(1, horizon + 1)
+        yhat = values[len(values) - m + (h - 1) % m]
+
+        residuals = values[m:] - values[:-m]
+        sigma = float(np.sqrt(np.mean(residuals ** 2))) if len(residuals) else 0.0
+        width = INTERVAL_Z * sigma * np.sqrt((h - 1) // m + 1)
+
+        return ForecastResult(
+            dates=_future_dates(last, horizon),
+            yhat=yhat,
+            lower=yhat - width,
+            upper=yhat + width,
+            model_json=json.dumps({"engine": self.name, "last_week": values[-m:].tolist(), "sigma": sigma})
+        )
+
+
+FORECAST_ENGINES: Dict[str, type] = {
+    ProphetEngine.name: ProphetEngine,
+    HoltWintersEngine.name: HoltWintersEngine,
+    SeasonalNaiveEngine.name: SeasonalNaiveEngine,
+}
+
+
+def get_forecast_engine(name: Optional[str] = None) -> ForecastEngine:
+    """Engine by name, defaulting to settings.FORECAST_ENGINE"""
+    engine_name = name or settings.FORECAST_ENGINE
+    if engine_name not in FORECAST_ENGINES:
+        raise ValueError(f"Unknown forecast engine '{engine_name}'. Use one of {', '.join(FORECAST_ENGINES)}")
+    return FORECAST_ENGINES[engine_name]()
+
+
+def _forecast_chunk(engine_name: str, keys: List[Any], series: List[Series],
+                    horizon: int) -> Dict[Any, ForecastResult]:
+    # Runs in a pool worker, so it only receives plain data and an engine name
+    results = FORECAST_ENGINES[engine_name]().forecast_batch(series, horizon)
+    return dict(zip(keys, results))
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, forking a server with live threads and connections is not safe
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.FORECAST_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def shutdown_forecast_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def submit_forecast_batch(engine_name: str, series: Dict[Any, Series], horizon: int,
+                          workers: Optional[int] = None) -> List[Tuple[List[Any], Future]]:
+    """Fit many series, returning (keys, future) per chunk.
+
+    Each future resolves to ``{key: ForecastResult}`` for its keys. Engines
+    that are not ``parallel_batch``, a single series, or one worker run the
+    whole batch in-process and the returned future is already done.
+    """
+    if engine_name not in FORECAST_ENGINES:
+        raise ValueError(f"Unknown forecast engine '{engine_name}'. Use one of {', '.join(FORECAST_ENGINES)}")
+    if not series:
+        return []
+
+    keys = list(series)
+    workers = settings.FORECAST_WORKERS if workers is None else workers
+
+    if workers <= 1 or len(keys) == 1 or not FORECAST_ENGINES[engine_name].parallel_batch:
+        future = Future()
+        try:
+            future.set_result(_forecast_chunk(engine_name, keys, [series[key] for key in keys], horizon))
+        except Exception as e:
+            future.set_exception(e)
+        return [(keys, future)]
+
+    pool = _get_pool()
+    size = -(-len(keys) // (workers * CHUNKS_PER_WORKER))
+    chunks = [keys[i:i + size] for i in range(0, len(keys), size)]
+    return [
+        (chunk, pool.submit(_forecast_chunk, engine_name, chunk, [series[key] for key in chunk], horizon))
+        for chunk in chunks
+    ]
@@ -0,0 +1,62 @@
+"""
+Inventory search backends.
+
+Name, SKU, barcode, supplier and description are folded into
+``inventory_items.search_text`` (see app.core.search), and each query token
+must match:
+
+- SQLite: as a word prefix in the FTS5 index, ranked by where the words
+  start, so name matches come before SKU, supplier and description ones
+- PostgreSQL: as a substring, served by the pg_trgm GIN index and ranked
+  by word similarity
+- other dialects: as a substring with a plain LIKE, by name
+
+Only the first INVENTORY_SEARCH_RANK_WINDOW matches are ranked, which keeps
+the short, unselective prefixes of search-as-you-type cheap on large
+catalogs; queries with fewer matches than that are ranked exactly.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import Select, column, func, literal, table, text
+
+from app.core.config import settings
+from app.models.inventory import InventoryItem
+
+FTS_TABLE = table("inventory_items_fts", column("rowid"))
+
+
+def _fts_match(tokens: List[str]) -> str:
+    # Tokens are letters and digits only, so quoting them is enough
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def apply_search(query: Select, tokens: List[str], dialect: str, window: Optional[int] = None) -> Select:
+    """Filter a ``select()`` of items to the tokens, best match first.
+
+    ``window`` is the number of rows the caller pages through (skip + limit).
+    """
+    window = max(settings.INVENTORY_SEARCH_RANK_WINDOW, window or 0)
+
+    if dialect == "sqlite":
+        # Cheaper than bm25, whose IDF pass reads every matching doclist
+        padded = literal(" ").concat(InventoryItem.search_text)
+        rank = sum(func.instr(padded, f" {token}") for token in tokens)
+        candidates = query.with_only_columns(InventoryItem.id, rank.label("rank")).join(
+            FTS_TABLE, FTS_TABLE.c.rowid == InventoryItem.id
+        ).where(
+            text("inventory_items_fts MATCH :search_match").bindparams(search_match=_fts_match(tokens))
+        )
+    else:
+        if dialect == "postgresql":
+            rank = -func.word_similarity(" ".join(tokens), InventoryItem.search_text)
+        else:
+            rank = literal(0)
+        candidates = query.with_only_columns(InventoryItem.id, rank.label("rank"))
+        for token in tokens:
+            candidates = candidates.where(InventoryItem.search_text.contains(token, autoescape=True))
+
+    candidates = candidates.limit(window).subquery("search_candidates")
+    return query.join(candidates, candidates.c.id == InventoryItem.id).order_by(
+        candidates.c.rank, InventoryItem.name, InventoryItem.id
+    )
@@ -1,11 +1,76 @@
-from typing import Optional, List, Dict, Any
+import logging
+import threading
+from concurrent.futures import wait
+from typing import Optional, List, Dict, Any, Iterable, Tuple, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, update, case, literal, desc, or_, and_
+from datetime import datetime, timedelta, date
 from app.models.inventory import InventoryItem
-from app.schemas.inventory import InventoryCreate, InventoryUpdate
-import pandas as pd
-from prophet import Prophet
+from app.schemas.inventory import InventoryCreate, InventoryUpdate, InventoryResponse
+from app.core.config import settings
+from app.core.pagination import keyset_paginate
+from app.core.search import search_tokens
+from app.services.financial_rollup_service import parse_day
+from app.services.forecast_cache import ForecastCache, DEFAULT_TENANT
+from app.services.forecasting import get_forecast_engine, submit_forecast_batch
+from app.services.inventory_search import apply_search
+from app.services.inventory_valuation_service import InventoryValuationService
+from app.services.item_lookup_cache import item_lookup_cache
+from app.services.product_rollup_service import ProductSalesRollupService
+
+logger = logging.getLogger(__name__)
+
+REORDER_HORIZON_DAYS = 30
+ITEM_PAGE_KEYS = (InventoryItem.name, InventoryItem.id)
+MIN_DEMAND_HISTORY = 10
+STOCK_OPERATIONS = ("add", "subtract", "set")
+STOCK_BATCH_CHUNK_SIZE = 500
+SLOW_MOVING_THRESHOLD = 0.1
+
+
+def _demand_series_key(item: InventoryItem, engine_name: str) -> str:
+    return f"demand:{item.sku or f'item-{item.id}'}:{engine_name}"
+
+
+def _clamped_stock(value):
+    # Evaluated by the database against the row's current value, never below 0
+    return case((value < 0, 0), else_=value)
+
+
+def _stock_update(item_id: int, quantity_change: int, operation: str):
+    """Single-statement UPDATE ... RETURNING for one stock adjustment"""
+    current = func.coalesce(InventoryItem.current_stock, 0)
+    if operation == "add":
+        value = current + quantity_change
+    elif operation == "subtract":
+        value = current - quantity_change
+    elif operation == "set":
+        value = literal(quantity_change)
+    else:
+        raise ValueError(f"Operation must be one of: {', '.join(STOCK_OPERATIONS)}")
+
+    return update(InventoryItem).where(InventoryItem.id == item_id).values(
+        current_stock=_clamped_stock(value)
+    ).returning(InventoryItem).execution_options(populate_existing=True)
+
+
+def _stock_batch_updates(deltas: Dict[str, int]):
+    """One UPDATE ... RETURNING per chunk of SKUs, each row gets its own delta"""
+    skus = list(deltas)
+    for start in range(0, len(skus), STOCK_BATCH_CHUNK_SIZE):
+        chunk = {sku: deltas[sku] for sku in skus[start:start + STOCK_BATCH_CHUNK_SIZE]}
+        value = func.coalesce(InventoryItem.current_stock, 0) + case(chunk, value=InventoryItem.sku)
+        yield update(InventoryItem).where(InventoryItem.sku.in_(chunk)).values(
+            current_stock=_clamped_stock(value)
+        ).returning(InventoryItem).execution_options(populate_existing=True)
+
+
+def _sum_deltas(adjustments: Iterable[Tuple[str, int]]) -> Dict[str, int]:
+    deltas: Dict[str, int] = {}
+    for sku, quantity_change in adjustments:
+        deltas[sku] = deltas.get(sku, 0) + quantity_change
+    return deltas
 
 
 class InventoryService:
@@ -32,24 +97,39 @@ class InventoryService:
     def get_item(self, item_id: int) -> Optional[InventoryItem]:
         return self.db.query(InventoryItem).filter(InventoryItem.id == item_id).first()
 
-    def get_item_by_sku(self, sku: str) -> Optional[InventoryItem]:
-        return self.db.query(InventoryItem).filter(InventoryItem.sku == sku).first()
+    def _lookup(self, field: str, value: str) -> Optional[InventoryResponse]:
+        cached = item_lookup_cache.get(field, value)
+        if cached is not None:
+            return cached
+        generation = item_lookup_cache.generation
+        db_item = self.db.scalars(select(InventoryItem).where(getattr(InventoryItem, field) == value)).first()
+        return item_lookup_cache.put(db_item, generation) if db_item else None
+
+    def get_item_by_sku(self, sku: str) -> Optional[InventoryResponse]:
+        """Read-only snapshot for scanning, served from the lookup cache"""
+        return self._lookup("sku", sku)
+
+    def get_item_by_barcode(self, barcode: str) -> Optional[InventoryResponse]:
+        return self._lookup("barcode", barcode)
 
     def get_items(self, skip: int = 0, limit: int = 100, 
                   category: Optional[str] = None,
-                  search: Optional[str] = None) -> List[InventoryItem]:
-        query = self.db.query(InventoryItem)
+                  search: Optional[str] = None,
+                  cursor: Optional[str] = None) -> List[InventoryItem]:
+        query = select(InventoryItem)
         
         if category:
-            query = query.filter(InventoryItem.category == category)
+            query = query.where(InventoryItem.category == category)
         
-        if search:
-            query = query.filter(
-                func.lower(InventoryItem.name).contains(search.lower()) |
-                func.lower(InventoryItem.description).contains(search.lower())
-            )
-        
-        return query.order_by(InventoryItem.name).offset(skip).limit(limit).all()
+        tokens = search_tokens(search)
+        if tokens:
+            # Ranked results page by offset only
+            if cursor:
+                raise ValueError("Cursor pagination is not supported with search")
+            query = apply_search(query, tokens, self.db.get_bind().dialect.name, skip + limit)
+        else:
+            query = keyset_paginate(query, ITEM_PAGE_KEYS, cursor)
+        return list(self.db.scalars(query.offset(skip).limit(limit)).all())
 
     def update_item(self, item_id: int, item_update: InventoryUpdate) -> Optional[InventoryItem]:
         db_item = self.get_item(item_id)
@@ -61,6 +141,7 @@ class InventoryService:
             setattr(db_item, field, value)
         
         self.db.commit()
+        item_lookup_cache.invalidate_items([item_id])
         self.db.refresh(db_item)
         return db_item
 
@@ -71,20 +152,21 @@ class InventoryService:
         
         self.db.delete(db_item)
         self.db.commit()
+        item_lookup_cache.invalidate_items([item_id])
         return True
 
     def get_low_stock_items(self) -> List[Dict[str, Any]]:
         items = self.db.query(InventoryItem).filter(
-            InventoryItem.quantity <= InventoryItem.min_stock_level
+            InventoryItem.current_stock <= InventoryItem.minimum_stock
         ).all()
         
         return [
             {
                 "id": item.id,
                 "name": item.name,
-                "current_stock": item.quantity,
-                "min_stock_level": item.min_stock_level,
-                "shortage": item.min_stock_level - item.quantity,
+                "current_stock": item.current_stock,
+                "min_stock_level": item.minimum_stock,
+                "shortage": item.minimum_stock - item.current_stock,
                 "category": item.category,
                 "supplier": item.supplier
             }
@@ -93,154 +175,190 @@ class InventoryService:
 
     def update_stock(self, item_id: int, quantity_change: int, 
                     operation: str = "add") -> Optional[InventoryItem]:
-        db_item = self.get_item(item_id)
-        if not db_item:
-            return None
-        
-        if operation == "add":
-            db_item.quantity += quantity_change
-        elif operation == "subtract":
-            db_item.quantity -= quantity_change
-        elif operation == "set":
-            db_item.quantity = quantity_change
-        
-        # Ensure quantity doesn't go below 0
-        if db_item.quantity < 0:
-            db_item.quantity = 0
-        
+        # Atomic in the database, so concurrent adjustments cannot lose updates
+        db_item = self.db.scalars(_stock_update(item_id, quantity_change, operation)).first()
         self.db.commit()
-        self.db.refresh(db_item)
+        item_lookup_cache.invalidate_items([item_id])
         return db_item
 
+    def update_stock_batch(self, adjustments: Iterable[Tuple[str, int]]) -> Dict[str, Any]:
+        """Apply signed (sku, quantity_change) deltas in one transaction.
+
+        Repeated SKUs are summed. Returns the updated items and the SKUs that
+        matched no item.
+        """
+        deltas = _sum_deltas(adjustments)
+        updated = [item for stmt in _stock_batch_updates(deltas) for item in self.db.scalars(stmt).all()]
+        self.db.commit()
+        item_lookup_cache.invalidate_items(item.id for item in updated)
+
+        found = {item.sku for item in updated}
+        return {"updated": updated, "not_found": [sku for sku in deltas if sku not in found]}
+
     def get_inventory_value(self) -> Dict[str, Any]:
-        items = self.db.query(InventoryItem).all()
-        
-        total_value = sum(item.quantity * item.cost_price for item in items)
-        retail_value = sum(item.quantity * item.unit_price for item in items)
-        total_items = len(items)
-        total_quantity = sum(item.quantity for item in items)
-        
-        categories = {}
-        for item in items:
-            if item.category not in categories:
-                categories[item.category] = {
-                    "count": 0,
-                    "value": 0,
-                    "quantity": 0
-                }
-            categories[item.category]["count"] += 1
-            categories[item.category]["value"] += item.quantity * item.cost_price
-            categories[item.category]["quantity"] += item.quantity
-        
-        return {
-            "total_value": total_value,
-            "retail_value": retail_value,
-            "potential_profit": retail_value - total_value,
-            "total_items": total_items,
-            "total_quantity": total_quantity,
-            "categories": categories
-        }
+        # One row per category from the trigger-maintained counters
+        return InventoryValuationService(self.db).get_inventory_value()
 
     def get_categories(self) -> List[str]:
         categories = self.db.query(InventoryItem.category).distinct().all()
         return [cat[0] for cat in categories if cat[0]]
 
-    def forecast_demand(self, item_id: int, days: int = 30) -> List[Dict[str, Any]]:
+    def forecast_demand(self, item_id: int, days: int = 30,
+                        engine: Optional[str] = None) -> List[Dict[str, Any]]:
+        db_item = self.get_item(item_id)
+        if not db_item:
+            return []
+        return self.forecast_demand_batch([db_item], days, engine).get(db_item.id, [])
+
+    def forecast_demand_batch(self, items: List[InventoryItem], days: int = 30,
+                              engine: Optional[str] = None,
+                              tenant: str = DEFAULT_TENANT) -> Dict[int, List[Dict[str, Any]]]:
+        """Demand forecasts for many items, keyed by item id.
+
+        Histories come from one query. Cached forecasts are served as they are
+        and refitted in the background once stale; missing ones are fitted on
+        the forecast process pool for up to FORECAST_BATCH_TIMEOUT_SECONDS,
+        and fits that finish later still land in the cache for the next call.
+        """
+        forecast_engine = get_forecast_engine(engine)
+        cache = ForecastCache()
+        forecasts = {}
+        item_ids, fingerprints, missing, stale = {}, {}, {}, {}
+
         try:
-            # Get historical sales data for this item
-            from app.models.sales import SaleItem
-            
-            sales_data = self.db.query(
-                func.date(SaleItem.sale.created_at).label('ds'),
-                func.sum(SaleItem.quantity).label('y')
-            ).join(SaleItem.sale).filter(
-                SaleItem.product_name == self.get_item(item_id).name
-            ).group_by(func.date(SaleItem.sale.created_at)).order_by('ds').all()
-            
-            if len(sales_data) < 10:
+            histories = self._get_demand_histories(item.id for item in items)
+        except Exception:
+            logger.exception("Could not load demand histories")
+            return forecasts
+
+        for item in items:
+            history = histories.get(item.id)
+            if not history or len(history[0]) < MIN_DEMAND_HISTORY:
+                continue
+
+            series_key = _demand_series_key(item, forecast_engine.name)
+            ds = history[0]
+            item_ids[series_key] = item.id
+            fingerprints[series_key] = (len(ds), ds[-1].isoformat())
+
+            entry = cache.get(tenant, series_key, days)
+            if entry is None:
+                # Skip series another request is already fitting
+                if cache.begin_refresh(tenant, series_key, days):
+                    missing[series_key] = history
+                continue
+            forecasts[item.id] = entry.predictions
+            if cache.is_stale(entry, *fingerprints[series_key]) and cache.begin_refresh(tenant, series_key, days):
+                stale[series_key] = history
+
+        def store(keys: List[str], future) -> Dict[str, List[Dict[str, Any]]]:
+            records = {}
+            try:
+                if future.cancelled():
+                    return records
+                for series_key, result in future.result().items():
+                    records[series_key] = result.to_records("predicted_demand")
+                    cache.store(tenant, series_key, days, fingerprints[series_key],
+                                records[series_key], result.model_json)
+            except Exception:
+                logger.exception(f"Demand forecast fit failed for {len(keys)} series")
+            finally:
+                for series_key in keys:
+                    cache.end_refresh(tenant, series_key, days)
+            return records
+
+        def submit(series: Dict[str, Tuple[List[date], List[float]]]):
+            try:
+                return submit_forecast_batch(forecast_engine.name, series, days)
+            except Exception:
+                logger.exception(f"Could not submit demand forecasts for {len(series)} series")
+                for series_key in series:
+                    cache.end_refresh(tenant, series_key, days)
                 return []
-            
-            # Convert to DataFrame
-            df = pd.DataFrame([
-                {"ds": pd.to_datetime(row.ds), "y": float(row.y)}
-                for row in sales_data
-            ])
-            
-            # Create and fit Prophet model
-            model = Prophet(
-                daily_seasonality=True,
-                weekly_seasonality=True,
-                yearly_seasonality=True
-            )
-            model.fit(df)
-            
-            # Make future predictions
-            future = model.make_future_dataframe(periods=days)
-            forecast = model.predict(future)
-            
-            # Return last 'days' predictions
-            forecast_data = forecast.tail(days)[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
-            
-            return [
-                {
-                    "date": row['ds'].strftime('%Y-%m-%d'),
-                    "predicted_demand": max(0, row['yhat']),
-                    "lower_bound": max(0, row['yhat_lower']),
-                    "upper_bound": max(0, row['yhat_upper'])
-                }
-                for _, row in forecast_data.iterrows()
-            ]
-        except Exception as e:
-            print(f"Demand forecasting error: {e}")
-            return []
 
-    def get_reorder_suggestions(self) -> List[Dict[str, Any]]:
-        low_stock = self.get_low_stock_items()
+        if stale:
+            def refresh():
+                for keys, future in submit(stale):
+                    future.add_done_callback(lambda done, keys=keys: store(keys, done))
+
+            threading.Thread(target=refresh, name="demand-forecast-refresh", daemon=True).start()
+
+        if missing:
+            chunks = submit(missing)
+            done, _ = wait([future for _, future in chunks], timeout=settings.FORECAST_BATCH_TIMEOUT_SECONDS)
+            for keys, future in chunks:
+                if future in done:
+                    for series_key, records in store(keys, future).items():
+                        forecasts[item_ids[series_key]] = records
+                else:
+                    # Finishes in the background and lands in the cache for the next call
+                    future.add_done_callback(lambda finished, keys=keys: store(keys, finished))
+
+        return forecasts
+
+    def _get_demand_histories(self, item_ids: Iterable[int]) -> Dict[int, Tuple[List[date], List[float]]]:
+        """Daily units sold per inventory item, all items in one query"""
+        from app.models.sales import SaleItem, Sale
+
+        item_ids = list(set(item_ids))
+        if not item_ids:
+            return {}
+
+        day = func.date(Sale.created_at)
+        rows = self.db.query(
+            SaleItem.product_id,
+            day.label('ds'),
+            func.sum(SaleItem.quantity).label('y')
+        ).join(SaleItem.sale).filter(
+            SaleItem.product_id.in_(item_ids)
+        ).group_by(SaleItem.product_id, day).order_by(SaleItem.product_id, day).all()
+
+        histories: Dict[int, Tuple[List[date], List[float]]] = {}
+        for row in rows:
+            ds, y = histories.setdefault(row.product_id, ([], []))
+            ds.append(parse_day(row.ds))
+            y.append(float(row.y))
+        return histories
+
+    def get_reorder_suggestions(self, engine: Optional[str] = None) -> List[Dict[str, Any]]:
+        low_stock = self.db.query(InventoryItem).filter(
+            InventoryItem.current_stock <= InventoryItem.minimum_stock
+        ).all()
+        
+        # Get demand forecasts for the next 30 days in one batch
+        forecasts = self.forecast_demand_batch(low_stock, REORDER_HORIZON_DAYS, engine)
         suggestions = []
         
         for item in low_stock:
-            db_item = self.get_item(item["id"])
-            if not db_item:
-                continue
-            
-            # Get demand forecast for next 30 days
-            forecast = self.forecast_demand(item["id"], 30)
+            forecast = forecasts.get(item.id)
             
             if forecast:
                 avg_daily_demand = sum(f["predicted_demand"] for f in forecast) / len(forecast)
-                suggested_quantity = int(avg_daily_demand * 30) + db_item.min_stock_level
+                suggested_quantity = int(avg_daily_demand * REORDER_HORIZON_DAYS) + item.minimum_stock
             else:
                 # Fallback to simple calculation
-                suggested_quantity = db_item.min_stock_level * 2
+                suggested_quantity = item.minimum_stock * 2
             
             suggestions.append({
-                "item_id": item["id"],
-                "name": item["name"],
-                "current_stock": item["current_stock"],
+                "item_id": item.id,
+                "name": item.name,
+                "current_stock": item.current_stock,
                 "suggested_quantity": suggested_quantity,
-                "supplier": item["supplier"],
-                "estimated_cost": suggested_quantity * db_item.cost_price,
-                "urgency": "high" if item["shortage"] > 0 else "medium"
+                "supplier": item.supplier,
+                "estimated_cost": suggested_quantity * (item.unit_cost or 0.0),
+                "urgency": "high" if item.minimum_stock - item.current_stock > 0 else "medium",
+                "forecasted": bool(forecast)
             })
         
         return sorted(suggestions, key=lambda x: x["urgency"] == "high", reverse=True)
 
     def get_top_selling_items(self, days: int = 30) -> List[Dict[str, Any]]:
-        from app.models.sales import SaleItem, Sale
-        
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        results = self.db.query(
-            SaleItem.product_name,
-            func.sum(SaleItem.quantity).label('total_quantity'),
-            func.sum(SaleItem.total_price).label('total_revenue')
-        ).join(Sale).filter(
-            Sale.created_at >= start_date,
-            Sale.created_at <= end_date
-        ).group_by(SaleItem.product_name).order_by(
-            desc('total_quantity')
-        ).limit(10).all()
+        results = ProductSalesRollupService(self.db).top_products(
+            start_date, end_date, limit=10, order_by="quantity"
+        )
         
         return [
             {
@@ -252,38 +370,213 @@ class InventoryService:
             for result in results
         ]
 
-    def get_slow_moving_items(self, days: int = 90) -> List[Dict[str, Any]]:
+    def get_slow_moving_items(self, days: Union[int, Iterable[int]] = 90,
+                              skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Items that sold less than SLOW_MOVING_THRESHOLD of their stock, or nothing.
+
+        ``days`` may list several windows, all measured in one pass. An item
+        slow over a longer window is also slow over a shorter one, so the
+        shortest window decides which items are listed. ``sold_quantity``
+        covers the longest window and ``days_without_sale`` is the longest
+        window without a sale. Sorted by tied-up value, paginated in SQL.
+        """
         from app.models.sales import SaleItem, Sale
-        
+
+        windows = sorted({days} if isinstance(days, int) else set(days))
+        if not windows or windows[0] <= 0:
+            raise ValueError("Windows must be positive numbers of days")
+
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        # Get all inventory items
-        all_items = self.db.query(InventoryItem).all()
-        
-        # Get items that have been sold
-        sold_items = self.db.query(
-            SaleItem.product_name,
-            func.sum(SaleItem.quantity).label('total_sold')
-        ).join(Sale).filter(
-            Sale.created_at >= start_date,
+        starts = {window: end_date - timedelta(days=window) for window in windows}
+
+        # Units sold per item and window, one grouped scan of the longest window
+        sold = select(
+            SaleItem.product_id,
+            *[
+                func.sum(case((Sale.created_at >= starts[window], SaleItem.quantity), else_=0)).label(f"sold_{window}")
+                for window in windows
+            ]
+        ).join(SaleItem.sale).where(
+            SaleItem.product_id.isnot(None),
+            Sale.created_at >= starts[windows[-1]],
             Sale.created_at <= end_date
-        ).group_by(SaleItem.product_name).all()
-        
-        sold_dict = {item.product_name: item.total_sold for item in sold_items}
-        
+        ).group_by(SaleItem.product_id).subquery()
+
+        stock = func.coalesce(InventoryItem.current_stock, 0)
+        sold_in = {window: func.coalesce(sold.c[f"sold_{window}"], 0) for window in windows}
+        tied_up_value = (stock * func.coalesce(InventoryItem.unit_cost, 0)).label("tied_up_value")
+
+        def is_slow(window):
+            return or_(sold_in[window] == 0, and_(stock > 0, sold_in[window] < stock * SLOW_MOVING_THRESHOLD))
+
+        # LEFT JOIN, so items with no sales at all have NULL sums and count as 0
+        rows = self.db.execute(
+            select(
+                InventoryItem.id,
+                InventoryItem.name,
+                InventoryItem.category,
+                stock.label("current_stock"),
+                tied_up_value,
+                *[sold_in[window].label(f"sold_{window}") for window in windows]
+            ).outerjoin(sold, sold.c.product_id == InventoryItem.id).where(
+                is_slow(windows[0])
+            ).order_by(desc(tied_up_value), InventoryItem.id).offset(skip).limit(limit)
+        ).all()
+
         slow_moving = []
-        for item in all_items:
-            sold_quantity = sold_dict.get(item.name, 0)
-            if sold_quantity == 0 or (item.quantity > 0 and sold_quantity < item.quantity * 0.1):
-                slow_moving.append({
-                    "id": item.id,
-                    "name": item.name,
-                    "current_stock": item.quantity,
-                    "sold_quantity": sold_quantity,
-                    "tied_up_value": item.quantity * item.cost_price,
-                    "category": item.category,
-                    "days_without_sale": days if sold_quantity == 0 else None
-                })
-        
-        return sorted(slow_moving, key=lambda x: x["tied_up_value"], reverse=True)
\ No newline at end of file
+        for row in rows:
+            sold_by_window = {window: row._mapping[f"sold_{window}"] for window in windows}
+            unsold = [window for window in windows if sold_by_window[window] == 0]
+            slow_moving.append({
+                "id": row.id,
+                "name": row.name,
+                "current_stock": row.current_stock,
+                "sold_quantity": sold_by_window[windows[-1]],
+                "tied_up_value": row.tied_up_value,
+                "category": row.category,
+                "days_without_sale": unsold[-1] if unsold else None,
+                "windows": {
+                    window: {
+                        "sold_quantity": quantity,
+                        "slow": quantity == 0 or (
+                            row.current_stock > 0 and quantity < row.current_stock * SLOW_MOVING_THRESHOLD
+                        )
+                    }
+                    for window, quantity in sold_by_window.items()
+                }
+            })
+        return slow_moving
+
+class AsyncInventoryService:
+    """Non-blocking variant of InventoryService for async endpoints.
+
+    Forecasting stays on the synchronous service because it is CPU bound
+    and belongs in the threadpool rather than on the event loop.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_item(self, item_create: InventoryCreate) -> InventoryItem:
+        db_item = InventoryItem(**item_create.dict())
+        self.db.add(db_item)
+        await self.db.commit()
+        await self.db.refresh(db_item)
+        return db_item
+
+    async def get_item(self, item_id: int) -> Optional[InventoryItem]:
+        result = await self.db.execute(select(InventoryItem).where(InventoryItem.id == item_id))
+        return result.scalars().first()
+
+    async def _lookup(self, field: str, value: str) -> Optional[InventoryResponse]:
+        cached = item_lookup_cache.get(field, value)
+        if cached is not None:
+            return cached
+        generation = item_lookup_cache.generation
+        result = await self.db.execute(select(InventoryItem).where(getattr(InventoryItem, field) == value))
+        db_item = result.scalars().first()
+        return item_lookup_cache.put(db_item, generation) if db_item else None
+
+    async def get_item_by_sku(self, sku: str) -> Optional[InventoryResponse]:
+        return await self._lookup("sku", sku)
+
+    async def get_item_by_barcode(self, barcode: str) -> Optional[InventoryResponse]:
+        return await self._lookup("barcode", barcode)
+
+    async def get_items(self, skip: int = 0, limit: int = 100,
+                        category: Optional[str] = None,
+                        search: Optional[str] = None,
+                        cursor: Optional[str] = None) -> List[InventoryItem]:
+        query = select(InventoryItem)
+
+        if category:
+            query = query.where(InventoryItem.category == category)
+
+        tokens = search_tokens(search)
+        if tokens:
+            if cursor:
+                raise ValueError("Cursor pagination is not supported with search")
+            query = apply_search(query, tokens, self.db.get_bind().dialect.name, skip + limit)
+        else:
+            query = keyset_paginate(query, ITEM_PAGE_KEYS, cursor)
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def update_item(self, item_id: int, item_update: InventoryUpdate) -> Optional[InventoryItem]:
+        db_item = await self.get_item(item_id)
+        if not db_item:
+            return None
+
+        update_data = item_update.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_item, field, value)
+
+        await self.db.commit()
+        item_lookup_cache.invalidate_items([item_id])
+        await self.db.refresh(db_item)
+        return db_item
+
+    async def delete_item(self, item_id: int) -> bool:
+        db_item = await self.get_item(item_id)
+        if not db_item:
+            return False
+
+        await self.db.delete(db_item)
+        await self.db.commit()
+        item_lookup_cache.invalidate_items([item_id])
+        return True
+
+    async def get_low_stock_items(self) -> List[Dict[str, Any]]:
+        result = await self.db.execute(
+            select(InventoryItem).where(
+                InventoryItem.current_stock <= InventoryItem.minimum_stock
+            )
+        )
+
+        return [
+            {
+                "id": item.id,
+                "name": item.name,
+                "current_stock": item.current_stock,
+                "min_stock_level": item.minimum_stock,
+                "shortage": item.minimum_stock - item.current_stock,
+                "category": item.category,
+                "supplier": item.supplier
+            }
+            for item in result.scalars().all()
+        ]
+
+    async def update_stock(self, item_id: int, quantity_change: int,
+                           operation: str = "add") -> Optional[InventoryItem]:
+        result = await self.db.scalars(_stock_update(item_id, quantity_change, operation))
+        db_item = result.first()
+        await self.db.commit()
+        item_lookup_cache.invalidate_items([item_id])
+        return db_item
+
+    async def update_stock_batch(self, adjustments: Iterable[Tuple[str, int]]) -> Dict[str, Any]:
+        deltas = _sum_deltas(adjustments)
+        updated = []
+        for stmt in _stock_batch_updates(deltas):
+            result = await self.db.scalars(stmt)
+            updated.extend(result.all())
+        await self.db.commit()
+        item_lookup_cache.invalidate_items(item.id for item in updated)
+
+        found = {item.sku for item in updated}
+        return {"updated": updated, "not_found": [sku for sku in deltas if sku not in found]}
+
+    async def get_inventory_value(self) -> Dict[str, Any]:
+        return await self.db.run_sync(
+            lambda session: InventoryService(session).get_inventory_value()
+        )
+
+    async def get_slow_moving_items(self, days: Union[int, Iterable[int]] = 90,
+                                    skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        return await self.db.run_sync(
+            lambda session: InventoryService(session).get_slow_moving_items(days, skip, limit)
+        )
+
+    async def get_categories(self) -> List[str]:
+        result = await self.db.execute(select(InventoryItem.category).distinct())
+        return [cat for cat in result.scalars().all() if cat]
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from typing import Optional, List, Dict, Any
+from sqlalchemy.orm import Session
+from sqlalchemy import func, delete, insert, select, text
+from app.core.database import SessionLocal
+from app.models.inventory import InventoryItem, InventoryValuation
+
+logger = logging.getLogger(__name__)
+
+UNCATEGORIZED = ""
+VALUATION_FIELDS = ("item_count", "total_quantity", "cost_value", "retail_value")
+# Float sums drift by rounding as they are adjusted, only report more than this
+DRIFT_TOLERANCE = 0.01
+
+
+class InventoryValuationService:
+    """Reads and reconciles the ``inventory_valuation`` counters.
+
+    The counters are kept current by database triggers (SQLite and
+    PostgreSQL), so reading the valuation costs one row per category. Other
+    dialects have no triggers and aggregate inventory_items on read.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _is_maintained(self) -> bool:
+        return self.db.get_bind().dialect.name in ("sqlite", "postgresql")
+
+    def _actual_totals(self):
+        category = func.coalesce(InventoryItem.category, UNCATEGORIZED)
+        stock = func.coalesce(InventoryItem.current_stock, 0)
+        return select(
+            category.label("category"),
+            func.count(InventoryItem.id).label("item_count"),
+            func.sum(stock).label("total_quantity"),
+            func.sum(stock * func.coalesce(InventoryItem.unit_cost, 0)).label("cost_value"),
+            func.sum(stock * func.coalesce(InventoryItem.selling_price, 0)).label("retail_value")
+        ).group_by(category)
+
+    def get_category_totals(self) -> Dict[str, Dict[str, float]]:
+        if self._is_maintained():
+            rows = self.db.execute(
+                select(InventoryValuation).where(InventoryValuation.item_count > 0)
+            ).scalars().all()
+        else:
+            rows = self.db.execute(self._actual_totals()).all()
+        return {row.category: {field: getattr(row, field) or 0 for field in VALUATION_FIELDS} for row in rows}
+
+    def get_inventory_value(self) -> Dict[str, Any]:
+        totals = self.get_category_totals()
+        total_value = sum(row["cost_value"] for row in totals.values())
+        retail_value = sum(row["retail_value"] for row in totals.values())
+
+        return {
+            "total_value": total_value,
+            "retail_value": retail_value,
+            "potential_profit": retail_value - total_value,
+            "total_items": sum(row["item_count"] for row in totals.values()),
+            "total_quantity": sum(row["total_quantity"] for row in totals.values()),
+            "categories": {
+                category or None: {
+                    "count": row["item_count"],
+                    "value": row["cost_value"],
+                    "quantity": row["total_quantity"]
+                }
+                for category, row in totals.items()
+            }
+        }
+
+    def reconcile(self, fix: bool = True) -> Dict[str, Any]:
+        """Recompute the counters from inventory_items and report drift.
+
+        With ``fix`` the table is rewritten from the recomputed totals when
+        any category drifted.
+        """
+        if not self._is_maintained():
+            return {"categories": 0, "drift": [], "fixed": False}
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Hold item writers (and their triggers) off until the rewrite commits
+            self.db.execute(text("LOCK TABLE inventory_items IN SHARE MODE"))
+
+        stored = {
+            row.category: row
+            for row in self.db.execute(select(InventoryValuation)).scalars().all()
+        }
+        actual = {row.category: row for row in self.db.execute(self._actual_totals()).all()}
+
+        drift = []
+        for category in sorted(set(stored) | set(actual)):
+            for field in VALUATION_FIELDS:
+                stored_value = getattr(stored.get(category), field, 0) or 0
+                actual_value = getattr(actual.get(category), field, 0) or 0
+                if abs(stored_value - actual_value) > DRIFT_TOLERANCE:
+                    drift.append({
+                        "category": category or None,
+                        "field": field,
+                        "stored": stored_value,
+                        "actual": actual_value,
+                        "difference": stored_value - actual_value
+                    })
+
+        fixed = fix and bool(drift)
+        if fixed:
+            # Rewritten in SQL within this transaction, so it matches the items at commit
+            self.db.execute(delete(InventoryValuation))
+            self.db.execute(
+                insert(InventoryValuation).from_select(["category", *VALUATION_FIELDS], self._actual_totals())
+            )
+        self.db.commit()
+
+        return {"categories": len(actual), "drift": drift, "fixed": fixed}
+
+
+def _reconcile_once() -> Optional[List[Dict[str, Any]]]:
+    db = SessionLocal()
+    try:
+        return InventoryValuationService(db).reconcile(fix=True)["drift"]
+    finally:
+        db.close()
+
+
+async def run_valuation_reconciler(interval_seconds: float) -> None:
+    """Periodically reconcile the valuation counters and log any drift"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            drift = await asyncio.to_thread(_reconcile_once)
+            if drift:
+                logger.warning(f"Inventory valuation drift fixed in {len({d['category'] for d in drift})} categories: {drift}")
+        except Exception:
+            logger.exception("Inventory valuation reconciliation failed")
@@ -0,0 +1,171 @@
+"""
+Item Lookup Cache for BusinessPilot AI
+In-process LRU/TTL cache of SKU and barcode lookups for POS scanning
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.inventory import InventoryItem
+from app.schemas.inventory import InventoryResponse
+from app.services.product_rollup_service import ProductSalesRollupService
+
+logger = logging.getLogger(__name__)
+
+LOOKUP_FIELDS = ("sku", "barcode")
+WARM_WINDOW_DAYS = 30
+
+LookupKey = Tuple[str, str]
+
+
+class ItemLookupCache:
+    """LRU cache of item snapshots keyed by SKU and by barcode.
+
+    Entries are read-only ``InventoryResponse`` snapshots, so they outlive the
+    session that loaded them. The service layer invalidates an item whenever
+    this process changes it; the TTL bounds how stale an entry can get when
+    another worker or a direct SQL write changed it instead.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size if max_size is not None else settings.ITEM_LOOKUP_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.ITEM_LOOKUP_CACHE_TTL_SECONDS
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[LookupKey, Tuple[float, InventoryResponse]]" = OrderedDict()
+        self._keys_by_item: Dict[int, set] = {}
+        # Bumped by every invalidation, so a lookup that raced a write does not cache what it read
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, field: str, value: str) -> Optional[InventoryResponse]:
+        key = (field, value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, item: InventoryItem, generation: Optional[int] = None) -> Optional[InventoryResponse]:
+        """Cache ``item`` under its SKU and barcode and return its snapshot.
+
+        Pass the ``generation`` read before loading the item; the item is not
+        cached if anything was invalidated since.
+        """
+        snapshot = InventoryResponse.model_validate(item)
+        if not self.enabled:
+            return snapshot
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return snapshot
+            expires_at = self._clock() + self.ttl_seconds
+            for field in LOOKUP_FIELDS:
+                value = getattr(snapshot, field)
+                if not value:
+                    continue
+                key = (field, value)
+                self._remove(key)
+                self._entries[key] = (expires_at, snapshot)
+                self._keys_by_item.setdefault(snapshot.id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return snapshot
+
+    def invalidate_items(self, item_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._generation += 1
+            for item_id in item_ids:
+                for key in self._keys_by_item.pop(item_id, ()):
+                    if self._entries.pop(key, None) is not None:
+                        self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_item.clear()
+
+    def _remove(self, key: LookupKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_item.get(entry[1].id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_item[entry[1].id]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+    def warm(self, db: Session, limit: Optional[int] = None) -> int:
+        """Load the best sellers of the last WARM_WINDOW_DAYS, returns how many"""
+        limit = limit if limit is not None else settings.ITEM_LOOKUP_CACHE_WARM_SIZE
+        if not self.enabled or limit <= 0:
+            return 0
+
+        end = date.today()
+        top = ProductSalesRollupService(db).top_products(
+            end - timedelta(days=WARM_WINDOW_DAYS), end, limit, order_by="quantity"
+        )
+        names = [row.product_name for row in top]
+        if not names:
+            return 0
+
+        generation = self.generation
+        items = db.scalars(select(InventoryItem).where(InventoryItem.name.in_(names))).all()
+        for item in items:
+            self.put(item, generation)
+        return len(items)
+
+
+item_lookup_cache = ItemLookupCache()
+
+
+def warm_item_lookup_cache() -> int:
+    db = SessionLocal()
+    try:
+        return item_lookup_cache.warm(db)
+    except Exception as e:
+        logger.warning(f"Could not warm the item lookup cache: {e}")
+        return 0
+    finally:
+        db.close()
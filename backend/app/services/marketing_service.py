@@ -1,6 +1,6 @@
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import desc
 from datetime import datetime, timedelta
 from app.models.marketing import Campaign
 from app.schemas.marketing import CampaignCreate, CampaignUpdate
@@ -325,20 +325,12 @@ class MarketingService:
         """Get sales data for marketing context"""
         
         try:
-            from app.models.sales import Sale, SaleItem
+            from app.services.product_rollup_service import ProductSalesRollupService
             
             # Get top products from last 30 days
             thirty_days_ago = datetime.now() - timedelta(days=30)
             
-            top_products = self.db.query(
-                SaleItem.product_name,
-                func.sum(SaleItem.quantity).label('total_quantity'),
-                func.sum(SaleItem.total_price).label('total_revenue')
-            ).join(Sale).filter(
-                Sale.created_at >= thirty_days_ago
-            ).group_by(SaleItem.product_name).order_by(
-                desc('total_revenue')
-            ).limit(5).all()
+            top_products = ProductSalesRollupService(self.db).top_products(thirty_days_ago, limit=5)
             
             return {
                 "top_products": [
@@ -0,0 +1,158 @@
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, Union, Iterable, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, delete, desc, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import date, datetime
+from app.core.config import settings
+from app.models.sales import DailyProductSales, Sale, SaleItem
+from app.services.financial_rollup_service import parse_day
+
+TOP_PRODUCT_ORDERS = ("revenue", "quantity")
+
+
+class ProductSalesRollupService:
+    """Maintains ``daily_product_sales``, the top-products index.
+
+    Like FinancialRollupService, writers call ``record_items`` /
+    ``record_sales`` inside their own transaction (``sign=-1`` retracts).
+    With TOP_PRODUCTS_SKETCH_CAPACITY set, a product that is new for a full
+    day replaces that day's lowest-revenue product and inherits its revenue
+    as ``error``, which bounds every bucket like a Space-Saving sketch.
+    """
+
+    def __init__(self, db: Session, sketch_capacity: Optional[int] = None):
+        self.db = db
+        self.sketch_capacity = settings.TOP_PRODUCTS_SKETCH_CAPACITY if sketch_capacity is None else sketch_capacity
+
+    def record_items(self, created_at: Union[date, datetime], items: Iterable[Any], sign: int = 1) -> None:
+        """Book the items (anything with product_name, quantity, total_price) of one sale."""
+        self.record_sales([(created_at, items)], sign)
+
+    def record_sales(self, sales: Iterable[Tuple[Union[date, datetime], Iterable[Any]]], sign: int = 1) -> None:
+        buckets: Dict[date, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(lambda: [0, 0.0, 0.0]))
+        for created_at, items in sales:
+            bucket = buckets[parse_day(created_at)]
+            for item in items:
+                totals = bucket[item.product_name]
+                totals[0] += sign * (item.quantity or 0)
+                totals[1] += sign * (item.total_price or 0.0)
+        for day, totals in buckets.items():
+            if totals:
+                self._apply(day, totals)
+
+    def _apply(self, day: date, totals: Dict[str, List[float]]) -> None:
+        if self.sketch_capacity > 0:
+            totals = self._make_room(day, totals)
+
+        rows = [
+            {"day": day, "product_name": name, "quantity": quantity, "revenue": revenue, "error": error}
+            for name, (quantity, revenue, error) in totals.items()
+        ]
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect in ("sqlite", "postgresql"):
+            insert_fn = sqlite_insert if dialect == "sqlite" else pg_insert
+            stmt = insert_fn(DailyProductSales)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["day", "product_name"],
+                set_={
+                    metric: getattr(DailyProductSales, metric) + getattr(stmt.excluded, metric)
+                    for metric in ("quantity", "revenue", "error")
+                }
+            )
+            self.db.execute(stmt, rows)
+            return
+
+        # Generic fallback for dialects without ON CONFLICT support
+        for row in rows:
+            existing = self.db.query(DailyProductSales).filter(
+                DailyProductSales.day == day,
+                DailyProductSales.product_name == row["product_name"]
+            ).with_for_update().first()
+            if existing is None:
+                self.db.add(DailyProductSales(**row))
+            else:
+                for metric in ("quantity", "revenue", "error"):
+                    setattr(existing, metric, getattr(existing, metric) + row[metric])
+        self.db.flush()
+
+    def _make_room(self, day: date, totals: Dict[str, List[float]]) -> Dict[str, List[float]]:
+        """Evict the smallest counters of a full day for products new to it."""
+        names = list(totals)
+        tracked = set(self.db.scalars(
+            select(DailyProductSales.product_name).where(
+                DailyProductSales.day == day,
+                DailyProductSales.product_name.in_(names)
+            )
+        ))
+        new = [name for name in names if name not in tracked and totals[name][1] > 0]
+        if not new:
+            return totals
+
+        size = self.db.scalar(select(func.count(DailyProductSales.id)).where(DailyProductSales.day == day))
+        overflow = size + len(new) - self.sketch_capacity
+        if overflow <= 0:
+            return totals
+
+        victims = self.db.execute(
+            select(DailyProductSales.id, DailyProductSales.revenue).where(
+                DailyProductSales.day == day,
+                DailyProductSales.product_name.notin_(names)
+            ).order_by(DailyProductSales.revenue).limit(overflow)
+        ).all()
+        if not victims:
+            return totals
+
+        self.db.execute(delete(DailyProductSales).where(DailyProductSales.id.in_([victim.id for victim in victims])))
+        totals = dict(totals)
+        # Largest newcomers take over the smallest counters
+        for name, victim in zip(sorted(new, key=lambda n: totals[n][1], reverse=True), victims):
+            quantity, revenue, _ = totals[name]
+            totals[name] = [quantity, revenue + victim.revenue, victim.revenue]
+        return totals
+
+    def top_products(self, start_date: Optional[Union[date, datetime]] = None,
+                     end_date: Optional[Union[date, datetime]] = None,
+                     limit: int = 10, order_by: str = "revenue") -> List[Any]:
+        """Rows of (product_name, total_quantity, total_revenue, error) for the window's days."""
+        if order_by not in TOP_PRODUCT_ORDERS:
+            raise ValueError(f"order_by must be one of {', '.join(TOP_PRODUCT_ORDERS)}")
+
+        query = self.db.query(
+            DailyProductSales.product_name,
+            func.sum(DailyProductSales.quantity).label('total_quantity'),
+            func.sum(DailyProductSales.revenue).label('total_revenue'),
+            func.sum(DailyProductSales.error).label('error')
+        )
+        if start_date:
+            query = query.filter(DailyProductSales.day >= parse_day(start_date))
+        if end_date:
+            query = query.filter(DailyProductSales.day <= parse_day(end_date))
+
+        return query.group_by(DailyProductSales.product_name).having(
+            func.sum(DailyProductSales.quantity) > 0
+        ).order_by(desc(f"total_{order_by}")).limit(limit).all()
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Recompute exact counters from the raw sale_items table."""
+        self.db.execute(delete(DailyProductSales))
+
+        results = self.db.query(
+            func.date(Sale.created_at).label('day'),
+            SaleItem.product_name,
+            func.sum(SaleItem.quantity).label('quantity'),
+            func.sum(SaleItem.total_price).label('revenue')
+        ).join(SaleItem.sale).group_by(func.date(Sale.created_at), SaleItem.product_name).all()
+
+        rows = [
+            {"day": parse_day(row.day), "product_name": row.product_name,
+             "quantity": row.quantity or 0, "revenue": row.revenue or 0.0, "error": 0.0}
+            for row in results
+        ]
+        if rows:
+            self.db.execute(insert(DailyProductSales), rows)
+        self.db.commit()
+
+        return {"days": len({row["day"] for row in rows}), "rows": len(rows)}
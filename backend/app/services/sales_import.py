@@ -0,0 +1,125 @@
+"""
+Sales Import for BusinessPilot AI
+Parsing of POS batch uploads (JSON Lines or CSV) into bulk sale rows
+"""
+
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from app.schemas.sales import SaleBulkCreate
+
+BULK_FORMATS = ("jsonl", "csv")
+BULK_CONTENT_TYPES = {
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/json-lines": "jsonl",
+    "text/csv": "csv",
+}
+CSV_ITEM_FIELDS = ("product_name", "product_id", "quantity", "unit_price", "total_price")
+
+# (line number, receipt id, parsed sale or error message)
+ParsedSale = Tuple[int, Optional[str], Union[SaleBulkCreate, str]]
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
+
+
+def _parse_sale(line_no: int, data: Dict[str, Any]) -> ParsedSale:
+    receipt_id = data.get("receipt_id")
+    receipt_id = str(receipt_id) if receipt_id not in (None, "") else None
+    try:
+        return line_no, receipt_id, SaleBulkCreate(**data)
+    except ValidationError as e:
+        return line_no, receipt_id, _validation_message(e)
+
+
+async def aiter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Numbered text lines of a UTF-8 byte stream, without line endings"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield line_no + 1, buffer.rstrip("\r")
+
+
+class JsonLinesSaleParser:
+    """One sale per line, items nested as a JSON array"""
+
+    def feed(self, line_no: int, line: str) -> List[ParsedSale]:
+        if not line.strip():
+            return []
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            return [(line_no, None, f"Invalid JSON: {e}")]
+        if not isinstance(data, dict):
+            return [(line_no, None, "Expected a JSON object")]
+        return [_parse_sale(line_no, data)]
+
+    def close(self) -> List[ParsedSale]:
+        return []
+
+
+class CsvSaleParser:
+    """One item per row, consecutive rows with the same receipt_id form a sale.
+
+    Sale columns are read from the first row of each receipt. Rows without a
+    product_name add no item, so a sale without items is a single such row.
+    Quoted fields cannot span lines.
+    """
+
+    def __init__(self):
+        self.header: Optional[List[str]] = None
+        self.current: Optional[Dict[str, Any]] = None
+        self.current_line = 0
+
+    def feed(self, line_no: int, line: str) -> List[ParsedSale]:
+        if not line.strip():
+            return []
+        values = next(csv.reader([line]))
+        if self.header is None:
+            self.header = [name.strip() for name in values]
+            if "receipt_id" not in self.header:
+                raise ValueError("CSV header must include a receipt_id column")
+            return []
+
+        row = {name: value for name, value in zip(self.header, values) if value != ""}
+        parsed = []
+        if self.current is not None and row.get("receipt_id") != self.current.get("receipt_id"):
+            parsed = self.close()
+
+        if self.current is None:
+            self.current = {key: value for key, value in row.items() if key not in CSV_ITEM_FIELDS}
+            self.current["items"] = []
+            self.current_line = line_no
+        if row.get("product_name"):
+            self.current["items"].append({key: row.get(key) for key in CSV_ITEM_FIELDS})
+        return parsed
+
+    def close(self) -> List[ParsedSale]:
+        if self.current is None:
+            return []
+        sale, self.current = self.current, None
+        return [_parse_sale(self.current_line, sale)]
+
+
+def get_sale_parser(format: str) -> Union[JsonLinesSaleParser, CsvSaleParser]:
+    if format == "jsonl":
+        return JsonLinesSaleParser()
+    if format == "csv":
+        return CsvSaleParser()
+    raise ValueError(f"Unsupported bulk format '{format}'. Use one of {', '.join(BULK_FORMATS)}")
@@ -1,11 +1,48 @@
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func, extract, desc
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator, Iterable
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, extract, select, insert, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, timedelta, timezone
+from app.core.database import SessionLocal, utcnow
+from app.core.pagination import keyset_paginate
+from app.models.finance import DailyFinancial
+from app.models.inventory import InventoryItem
 from app.models.sales import Sale, SaleItem
-from app.schemas.sales import SaleCreate, SaleUpdate
-import pandas as pd
-from prophet import Prophet
+from app.schemas.sales import SaleCreate, SaleUpdate, SaleBulkCreate, SaleItemCreate
+from app.services.financial_rollup_service import FinancialRollupService, SALES_CATEGORY, parse_day
+from app.services.product_rollup_service import ProductSalesRollupService
+from app.services.forecast_cache import ForecastCache, DEFAULT_TENANT
+from app.services.forecasting import ForecastEngine, get_forecast_engine
+from app.services.sales_import import aiter_lines, get_sale_parser
+
+BULK_CHUNK_SIZE = 1000
+SALE_PAGE_KEYS = (Sale.created_at, Sale.id)
+MAX_BULK_ERRORS = 1000
+
+# (line number, sale) of one bulk upload row
+BulkRow = Tuple[int, SaleBulkCreate]
+
+
+def _utc(value: datetime) -> datetime:
+    # Sales are stored in UTC like create_sale and CURRENT_TIMESTAMP; naive
+    # timestamps are taken to be UTC already
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _product_id_query(items: Iterable[SaleItemCreate]):
+    """Inventory item id per product name, for items sent without a product_id"""
+    names = {item.product_name for item in items if item.product_id is None}
+    if not names:
+        return None
+    # Duplicate names resolve to the oldest item
+    return select(InventoryItem.name, func.min(InventoryItem.id)).where(
+        InventoryItem.name.in_(names)
+    ).group_by(InventoryItem.name)
 
 
 class SalesService:
@@ -26,9 +63,11 @@ class SalesService:
         self.db.flush()
         
         # Add sale items
+        product_ids = self._resolve_product_ids(sale_create.items)
         for item_data in sale_create.items:
             db_item = SaleItem(
                 sale_id=db_sale.id,
+                product_id=item_data.product_id or product_ids.get(item_data.product_name),
                 product_name=item_data.product_name,
                 quantity=item_data.quantity,
                 unit_price=item_data.unit_price,
@@ -36,108 +75,219 @@ class SalesService:
             )
             self.db.add(db_item)
         
+        FinancialRollupService(self.db).record_sale(db_sale.created_at, db_sale.total_amount)
+        ProductSalesRollupService(self.db).record_items(db_sale.created_at, sale_create.items)
+        
         self.db.commit()
         self.db.refresh(db_sale)
         return db_sale
 
+    def bulk_insert_sales(self, rows: List[BulkRow]) -> Dict[str, Any]:
+        """Insert a chunk of uploaded receipts in one transaction.
+
+        Receipt ids already stored (or repeated within the chunk) are
+        reported as duplicates and skipped. If the chunk fails as a whole it
+        is retried row by row so that only the offending rows are rejected.
+        """
+        unique: Dict[str, BulkRow] = {}
+        duplicates: List[Tuple[int, str]] = []
+        for line_no, sale in rows:
+            if sale.receipt_id in unique:
+                duplicates.append((line_no, sale.receipt_id))
+            else:
+                unique[sale.receipt_id] = (line_no, sale)
+
+        for receipt_id in self.db.scalars(select(Sale.receipt_id).where(Sale.receipt_id.in_(list(unique)))):
+            duplicates.append((unique.pop(receipt_id)[0], receipt_id))
+
+        result = {"inserted": 0, "duplicates": duplicates, "errors": []}
+        if not unique:
+            return result
+
+        try:
+            inserted = self._insert_receipts(list(unique.values()))
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            inserted = set()
+            for line_no, sale in unique.values():
+                try:
+                    inserted |= self._insert_receipts([(line_no, sale)])
+                    self.db.commit()
+                except SQLAlchemyError as e:
+                    self.db.rollback()
+                    result["errors"].append((line_no, sale.receipt_id, str(e.orig if hasattr(e, "orig") else e)))
+
+        failed = {receipt_id for _, receipt_id, _ in result["errors"]}
+        result["inserted"] = len(inserted)
+        # Receipts a concurrent upload stored first
+        duplicates.extend(
+            (line_no, receipt_id) for receipt_id, (line_no, _) in unique.items()
+            if receipt_id not in inserted and receipt_id not in failed
+        )
+        return result
+
+    def _insert_receipts(self, rows: List[BulkRow]) -> set:
+        now = utcnow()
+        sale_rows = [
+            {
+                "receipt_id": sale.receipt_id,
+                "total_amount": sale.total_amount,
+                "tax_amount": sale.tax_amount,
+                "discount_amount": sale.discount_amount,
+                "payment_method": sale.payment_method,
+                "customer_name": sale.customer_name,
+                "customer_email": sale.customer_email,
+                "notes": sale.notes,
+                "created_at": _utc(sale.created_at) if sale.created_at else now
+            }
+            for _, sale in rows
+        ]
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("sqlite", "postgresql"):
+            insert_fn = sqlite_insert if dialect == "sqlite" else pg_insert
+            stmt = insert_fn(Sale).on_conflict_do_nothing(index_elements=["receipt_id"])
+            sale_ids = dict(
+                (receipt_id, sale_id)
+                for sale_id, receipt_id in self.db.execute(stmt.returning(Sale.id, Sale.receipt_id), sale_rows)
+            )
+        else:
+            self.db.execute(insert(Sale), sale_rows)
+            sale_ids = dict(
+                (receipt_id, sale_id)
+                for sale_id, receipt_id in self.db.execute(
+                    select(Sale.id, Sale.receipt_id).where(Sale.receipt_id.in_([row["receipt_id"] for row in sale_rows]))
+                )
+            )
+
+        product_ids = self._resolve_product_ids(
+            item for _, sale in rows if sale.receipt_id in sale_ids for item in sale.items
+        )
+        item_rows = [
+            {
+                "sale_id": sale_ids[sale.receipt_id],
+                "product_id": item.product_id or product_ids.get(item.product_name),
+                "product_name": item.product_name,
+                "quantity": item.quantity,
+                "unit_price": item.unit_price,
+                "total_price": item.total_price
+            }
+            for _, sale in rows if sale.receipt_id in sale_ids
+            for item in sale.items
+        ]
+        if item_rows:
+            self.db.execute(insert(SaleItem), item_rows)
+
+        FinancialRollupService(self.db).record_sales(
+            (row["created_at"], row["total_amount"]) for row in sale_rows if row["receipt_id"] in sale_ids
+        )
+        created_at = {row["receipt_id"]: row["created_at"] for row in sale_rows}
+        ProductSalesRollupService(self.db).record_sales(
+            (created_at[sale.receipt_id], sale.items) for _, sale in rows if sale.receipt_id in sale_ids
+        )
+        return set(sale_ids)
+
+    def _resolve_product_ids(self, items: Iterable[SaleItemCreate]) -> Dict[str, int]:
+        query = _product_id_query(items)
+        return dict(self.db.execute(query).all()) if query is not None else {}
+
     def get_sale(self, sale_id: int) -> Optional[Sale]:
-        return self.db.query(Sale).filter(Sale.id == sale_id).first()
+        return self.db.query(Sale).options(selectinload(Sale.items)).filter(Sale.id == sale_id).first()
 
     def get_sales(self, skip: int = 0, limit: int = 100, 
                   start_date: Optional[datetime] = None, 
-                  end_date: Optional[datetime] = None) -> List[Sale]:
-        query = self.db.query(Sale)
+                  end_date: Optional[datetime] = None,
+                  cursor: Optional[str] = None) -> List[Sale]:
+        # Items for the whole page in one extra SELECT ... WHERE sale_id IN (...)
+        query = self.db.query(Sale).options(selectinload(Sale.items))
         
         if start_date:
             query = query.filter(Sale.created_at >= start_date)
         if end_date:
             query = query.filter(Sale.created_at <= end_date)
         
-        return query.order_by(desc(Sale.created_at)).offset(skip).limit(limit).all()
+        query = keyset_paginate(query, SALE_PAGE_KEYS, cursor, descending=True)
+        return query.offset(skip).limit(limit).all()
 
     def get_sales_analytics(self, start_date: Optional[datetime] = None, 
                            end_date: Optional[datetime] = None) -> Dict[str, Any]:
-        query = self.db.query(Sale)
+        # Totals, the daily series and the previous period all come from one
+        # grouped query; rows are per day, so memory does not grow with sales
+        previous_start = None
+        if start_date and end_date:
+            previous_start = start_date - timedelta(days=(end_date - start_date).days)
         
-        if start_date:
-            query = query.filter(Sale.created_at >= start_date)
+        day = func.date(Sale.created_at)
+        is_current = Sale.created_at >= start_date if previous_start else true()
+        query = self.db.query(
+            is_current.label('is_current'),
+            day.label('date'),
+            func.count(Sale.id).label('count'),
+            func.sum(Sale.total_amount).label('revenue')
+        )
+        
+        if previous_start or start_date:
+            query = query.filter(Sale.created_at >= (previous_start or start_date))
         if end_date:
             query = query.filter(Sale.created_at <= end_date)
         
-        sales = query.all()
+        # Grouped by label so PostgreSQL matches the parameterized expression
+        group_by = ('is_current', 'date') if previous_start else ('date',)
+        rows = query.group_by(*group_by).order_by('date').all()
         
-        if not sales:
+        sales_by_day = []
+        previous_sales, previous_revenue = 0, 0.0
+        for row in rows:
+            if row.is_current:
+                sales_by_day.append({
+                    "date": parse_day(row.date).isoformat(),
+                    "count": row.count,
+                    "revenue": row.revenue or 0.0
+                })
+            else:
+                previous_sales += row.count
+                previous_revenue += row.revenue or 0.0
+        
+        total_sales = sum(day_row["count"] for day_row in sales_by_day)
+        total_revenue = sum(day_row["revenue"] for day_row in sales_by_day)
+        previous_period = {
+            "start_date": previous_start.isoformat() if previous_start else None,
+            "end_date": start_date.isoformat() if previous_start else None,
+            "total_sales": previous_sales,
+            "total_revenue": previous_revenue
+        }
+        
+        if not total_sales:
             return {
                 "total_sales": 0,
                 "total_revenue": 0.0,
                 "average_sale": 0.0,
                 "growth_rate": 0.0,
+                "previous_period": previous_period,
                 "top_products": [],
                 "sales_by_day": []
             }
         
-        total_sales = len(sales)
-        total_revenue = sum(sale.total_amount for sale in sales)
-        average_sale = total_revenue / total_sales if total_sales > 0 else 0.0
-        
         # Calculate growth rate (comparing to previous period)
-        growth_rate = self._calculate_growth_rate(start_date, end_date)
-        
-        # Get top products
-        top_products = self._get_top_products(start_date, end_date)
-        
-        # Get sales by day
-        sales_by_day = self._get_sales_by_day(start_date, end_date)
+        growth_rate = 0.0
+        if previous_revenue:
+            growth_rate = ((total_revenue - previous_revenue) / previous_revenue) * 100
         
         return {
             "total_sales": total_sales,
             "total_revenue": total_revenue,
-            "average_sale": average_sale,
+            "average_sale": total_revenue / total_sales,
             "growth_rate": growth_rate,
-            "top_products": top_products,
+            "previous_period": previous_period,
+            "top_products": self._get_top_products(start_date, end_date),
             "sales_by_day": sales_by_day
         }
 
-    def _calculate_growth_rate(self, start_date: Optional[datetime], 
-                              end_date: Optional[datetime]) -> float:
-        if not start_date or not end_date:
-            return 0.0
-        
-        period_length = (end_date - start_date).days
-        previous_start = start_date - timedelta(days=period_length)
-        previous_end = start_date
-        
-        current_revenue = self.db.query(func.sum(Sale.total_amount)).filter(
-            Sale.created_at >= start_date,
-            Sale.created_at <= end_date
-        ).scalar() or 0.0
-        
-        previous_revenue = self.db.query(func.sum(Sale.total_amount)).filter(
-            Sale.created_at >= previous_start,
-            Sale.created_at <= previous_end
-        ).scalar() or 0.0
-        
-        if previous_revenue == 0:
-            return 0.0
-        
-        return ((current_revenue - previous_revenue) / previous_revenue) * 100
-
     def _get_top_products(self, start_date: Optional[datetime], 
                          end_date: Optional[datetime]) -> List[Dict[str, Any]]:
-        query = self.db.query(
-            SaleItem.product_name,
-            func.sum(SaleItem.quantity).label('total_quantity'),
-            func.sum(SaleItem.total_price).label('total_revenue')
-        ).join(Sale)
-        
-        if start_date:
-            query = query.filter(Sale.created_at >= start_date)
-        if end_date:
-            query = query.filter(Sale.created_at <= end_date)
-        
-        results = query.group_by(SaleItem.product_name).order_by(
-            desc('total_revenue')
-        ).limit(10).all()
+        # Merges the window's daily buckets instead of scanning sale_items
+        results = ProductSalesRollupService(self.db).top_products(start_date, end_date, limit=10)
         
         return [
             {
@@ -148,75 +298,54 @@ class SalesService:
             for result in results
         ]
 
-    def _get_sales_by_day(self, start_date: Optional[datetime], 
-                         end_date: Optional[datetime]) -> List[Dict[str, Any]]:
-        query = self.db.query(
-            func.date(Sale.created_at).label('date'),
-            func.count(Sale.id).label('count'),
-            func.sum(Sale.total_amount).label('revenue')
-        )
-        
-        if start_date:
-            query = query.filter(Sale.created_at >= start_date)
-        if end_date:
-            query = query.filter(Sale.created_at <= end_date)
-        
-        results = query.group_by(func.date(Sale.created_at)).order_by('date').all()
-        
-        return [
-            {
-                "date": result.date.isoformat(),
-                "count": result.count,
-                "revenue": result.revenue
-            }
-            for result in results
-        ]
-
-    def forecast_sales(self, days: int = 30) -> List[Dict[str, Any]]:
+    def forecast_sales(self, days: int = 30, tenant: str = DEFAULT_TENANT,
+                       engine: Optional[str] = None) -> List[Dict[str, Any]]:
+        forecast_engine = get_forecast_engine(engine)
         try:
-            # Get historical sales data
-            sales_data = self.db.query(
-                func.date(Sale.created_at).label('ds'),
-                func.sum(Sale.total_amount).label('y')
-            ).group_by(func.date(Sale.created_at)).order_by('ds').all()
-            
-            if len(sales_data) < 10:
-                return []
-            
-            # Convert to DataFrame
-            df = pd.DataFrame([
-                {"ds": pd.to_datetime(row.ds), "y": float(row.y)}
-                for row in sales_data
-            ])
-            
-            # Create and fit Prophet model
-            model = Prophet(
-                daily_seasonality=True,
-                weekly_seasonality=True,
-                yearly_seasonality=True
+            return ForecastCache().get_or_fit(
+                tenant, f"sales:revenue:{forecast_engine.name}", days,
+                fingerprint=self._get_revenue_series_fingerprint(),
+                fit=lambda: self._fit_sales_forecast(days, forecast_engine),
+                background_fit=lambda: _refit_sales_forecast(days, forecast_engine)
             )
-            model.fit(df)
-            
-            # Make future predictions
-            future = model.make_future_dataframe(periods=days)
-            forecast = model.predict(future)
-            
-            # Return last 'days' predictions
-            forecast_data = forecast.tail(days)[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
-            
-            return [
-                {
-                    "date": row['ds'].strftime('%Y-%m-%d'),
-                    "predicted_revenue": max(0, row['yhat']),
-                    "lower_bound": max(0, row['yhat_lower']),
-                    "upper_bound": max(0, row['yhat_upper'])
-                }
-                for _, row in forecast_data.iterrows()
-            ]
         except Exception as e:
             print(f"Forecasting error: {e}")
             return []
 
+    def _get_revenue_series(self) -> List[Any]:
+        return self.db.query(
+            DailyFinancial.day.label('ds'),
+            DailyFinancial.revenue.label('y')
+        ).filter(
+            DailyFinancial.category == SALES_CATEGORY,
+            DailyFinancial.sales_count > 0
+        ).order_by(DailyFinancial.day).all()
+
+    def _get_revenue_series_fingerprint(self) -> Tuple[int, Optional[str]]:
+        data_points, last_day = self.db.query(
+            func.count(DailyFinancial.id),
+            func.max(DailyFinancial.day)
+        ).filter(
+            DailyFinancial.category == SALES_CATEGORY,
+            DailyFinancial.sales_count > 0
+        ).one()
+        return data_points, last_day.isoformat() if last_day else None
+
+    def _fit_sales_forecast(self, days: int,
+                            forecast_engine: ForecastEngine) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        # Daily revenue history comes from the rollup instead of scanning sales
+        sales_data = self._get_revenue_series()
+        
+        if len(sales_data) < 10:
+            return [], None
+        
+        result = forecast_engine.forecast(
+            [row.ds for row in sales_data],
+            [float(row.y) for row in sales_data],
+            days
+        )
+        return result.to_records("predicted_revenue"), result.model_json
+
     def get_sales_trends(self, period: str = "monthly") -> Dict[str, Any]:
         if period == "daily":
             date_part = func.date(Sale.created_at)
@@ -252,10 +381,16 @@ class SalesService:
         if not db_sale:
             return None
         
+        previous_amount = db_sale.total_amount
         update_data = sale_update.dict(exclude_unset=True, exclude={'items'})
         for field, value in update_data.items():
             setattr(db_sale, field, value)
         
+        if db_sale.total_amount != previous_amount:
+            rollup = FinancialRollupService(self.db)
+            rollup.record_sale(db_sale.created_at, previous_amount, sign=-1)
+            rollup.record_sale(db_sale.created_at, db_sale.total_amount)
+        
         self.db.commit()
         self.db.refresh(db_sale)
         return db_sale
@@ -265,6 +400,170 @@ class SalesService:
         if not db_sale:
             return False
         
+        FinancialRollupService(self.db).record_sale(db_sale.created_at, db_sale.total_amount, sign=-1)
+        ProductSalesRollupService(self.db).record_items(db_sale.created_at, db_sale.items, sign=-1)
         self.db.delete(db_sale)
         self.db.commit()
-        return True
\ No newline at end of file
+        return True
+
+def _refit_sales_forecast(days: int, forecast_engine: ForecastEngine) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    # Background refits run outside the request, so they need their own session
+    db = SessionLocal()
+    try:
+        return SalesService(db)._fit_sales_forecast(days, forecast_engine)
+    finally:
+        db.close()
+
+
+class AsyncSalesService:
+    """Non-blocking variant of SalesService for async endpoints.
+
+    CRUD paths are native AsyncSession queries; analytics reuse the
+    synchronous implementation through ``AsyncSession.run_sync``.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_sale(self, sale_create: SaleCreate) -> Sale:
+        db_sale = Sale(
+            total_amount=sale_create.total_amount,
+            tax_amount=sale_create.tax_amount,
+            discount_amount=sale_create.discount_amount,
+            payment_method=sale_create.payment_method,
+            customer_name=sale_create.customer_name,
+            customer_email=sale_create.customer_email,
+            notes=sale_create.notes
+        )
+        self.db.add(db_sale)
+        await self.db.flush()
+
+        query = _product_id_query(sale_create.items)
+        product_ids = dict((await self.db.execute(query)).all()) if query is not None else {}
+        self.db.add_all([
+            SaleItem(
+                sale_id=db_sale.id,
+                product_id=item_data.product_id or product_ids.get(item_data.product_name),
+                product_name=item_data.product_name,
+                quantity=item_data.quantity,
+                unit_price=item_data.unit_price,
+                total_price=item_data.total_price
+            )
+            for item_data in sale_create.items
+        ])
+
+        await self.db.refresh(db_sale, ['created_at'])
+        def record(session: Session) -> None:
+            FinancialRollupService(session).record_sale(db_sale.created_at, db_sale.total_amount)
+            ProductSalesRollupService(session).record_items(db_sale.created_at, sale_create.items)
+        await self.db.run_sync(record)
+
+        await self.db.commit()
+        return await self.get_sale(db_sale.id)
+
+    async def bulk_create_sales(self, chunks: AsyncIterator[bytes], format: str = "jsonl") -> Dict[str, Any]:
+        """Stream a JSON Lines or CSV upload into the database.
+
+        Rows are parsed as they arrive and inserted BULK_CHUNK_SIZE receipts
+        per transaction; invalid rows are reported with their line number.
+        """
+        parser = get_sale_parser(format)
+        summary = {"received": 0, "inserted": 0, "duplicates": 0, "failed": 0, "errors": []}
+        batch: List[BulkRow] = []
+
+        def report(line_no: int, receipt_id: Optional[str], error: str) -> None:
+            summary["failed"] += 1
+            if len(summary["errors"]) < MAX_BULK_ERRORS:
+                summary["errors"].append({"line": line_no, "receipt_id": receipt_id, "error": error})
+
+        async def flush() -> None:
+            rows = list(batch)
+            batch.clear()
+            result = await self.db.run_sync(lambda session: SalesService(session).bulk_insert_sales(rows))
+            summary["inserted"] += result["inserted"]
+            summary["duplicates"] += len(result["duplicates"])
+            for line_no, receipt_id, error in result["errors"]:
+                report(line_no, receipt_id, error)
+
+        async def handle(parsed) -> None:
+            for line_no, receipt_id, sale in parsed:
+                summary["received"] += 1
+                if isinstance(sale, str):
+                    report(line_no, receipt_id, sale)
+                    continue
+                batch.append((line_no, sale))
+                if len(batch) >= BULK_CHUNK_SIZE:
+                    await flush()
+
+        async for line_no, line in aiter_lines(chunks):
+            await handle(parser.feed(line_no, line))
+        await handle(parser.close())
+        if batch:
+            await flush()
+
+        return summary
+
+    async def get_sale(self, sale_id: int) -> Optional[Sale]:
+        result = await self.db.execute(
+            select(Sale).options(selectinload(Sale.items)).where(Sale.id == sale_id)
+        )
+        return result.scalars().first()
+
+    async def get_sales(self, skip: int = 0, limit: int = 100,
+                        start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None,
+                        cursor: Optional[str] = None) -> List[Sale]:
+        query = select(Sale).options(selectinload(Sale.items))
+
+        if start_date:
+            query = query.where(Sale.created_at >= start_date)
+        if end_date:
+            query = query.where(Sale.created_at <= end_date)
+
+        query = keyset_paginate(query, SALE_PAGE_KEYS, cursor, descending=True)
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_sales_analytics(self, start_date: Optional[datetime] = None,
+                                  end_date: Optional[datetime] = None) -> Dict[str, Any]:
+        return await self.db.run_sync(
+            lambda session: SalesService(session).get_sales_analytics(start_date, end_date)
+        )
+
+    async def get_sales_trends(self, period: str = "monthly") -> Dict[str, Any]:
+        return await self.db.run_sync(
+            lambda session: SalesService(session).get_sales_trends(period)
+        )
+
+    async def update_sale(self, sale_id: int, sale_update: SaleUpdate) -> Optional[Sale]:
+        db_sale = await self.get_sale(sale_id)
+        if not db_sale:
+            return None
+
+        previous_amount = db_sale.total_amount
+        update_data = sale_update.dict(exclude_unset=True, exclude={'items'})
+        for field, value in update_data.items():
+            setattr(db_sale, field, value)
+
+        if db_sale.total_amount != previous_amount:
+            def rebook(session: Session) -> None:
+                rollup = FinancialRollupService(session)
+                rollup.record_sale(db_sale.created_at, previous_amount, sign=-1)
+                rollup.record_sale(db_sale.created_at, db_sale.total_amount)
+            await self.db.run_sync(rebook)
+
+        await self.db.commit()
+        return await self.get_sale(sale_id)
+
+    async def delete_sale(self, sale_id: int) -> bool:
+        db_sale = await self.get_sale(sale_id)
+        if not db_sale:
+            return False
+
+        def retract(session: Session) -> None:
+            FinancialRollupService(session).record_sale(db_sale.created_at, db_sale.total_amount, sign=-1)
+            ProductSalesRollupService(session).record_items(db_sale.created_at, db_sale.items, sign=-1)
+        await self.db.run_sync(retract)
+        await self.db.delete(db_sale)
+        await self.db.commit()
+        return True
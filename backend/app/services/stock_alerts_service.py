@@ -4,8 +4,10 @@ Intelligent inventory monitoring with predictive analytics
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+import random
+import threading
+from typing import Dict, List, Optional, Any, Tuple, Callable, Iterable
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -13,6 +15,18 @@ import json
 from collections import defaultdict
 import statistics
 
+import numpy as np
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.stock_alerts import StockAlertRecord, StockAlertDailySummary, OPEN_ALERT_STATUSES
+from app.services.alert_broadcaster import AlertBroadcaster
+
 logger = logging.getLogger(__name__)
 
 class AlertUrgency(Enum):
@@ -34,6 +48,36 @@ class AlertStatus(Enum):
     DISMISSED = "dismissed"
     RESOLVED = "resolved"
 
+class StockBand(Enum):
+    OUT = "out"
+    LOW = "low"
+    REORDER = "reorder"
+    NORMAL = "normal"
+    OVER = "over"
+
+# In stock order, band i holds the levels up to and including edge i
+STOCK_BANDS = [StockBand.OUT, StockBand.LOW, StockBand.REORDER, StockBand.NORMAL, StockBand.OVER]
+PREDICTION_HORIZONS = (7, 14, 30)
+
+URGENCY_RANK = {
+    AlertUrgency.CRITICAL: 0,
+    AlertUrgency.HIGH: 1,
+    AlertUrgency.MEDIUM: 2,
+    AlertUrgency.LOW: 3
+}
+# Products per IN (...) when loading open alerts
+ALERT_LOOKUP_CHUNK_SIZE = 500
+
+# Statuses an alert may be in to be moved to each user-set status; closed
+# alerts stay closed, reopening one would clash with the product's new alert
+ALLOWED_STATUS_FROM = {
+    AlertStatus.ACKNOWLEDGED: (AlertStatus.ACTIVE.value,),
+    AlertStatus.DISMISSED: OPEN_ALERT_STATUSES,
+}
+
+class AlertNotOpenError(ValueError):
+    """The alert is not in a status the requested change applies to"""
+
 @dataclass
 class Product:
     """Product inventory data"""
@@ -63,8 +107,8 @@ class Product:
 
 @dataclass
 class StockAlert:
-    """Stock alert data"""
-    id: str
+    """Stock alert data, ``id`` is None until it is stored"""
+    id: Optional[str]
     product_id: str
     product_name: str
     alert_type: AlertType
@@ -78,6 +122,8 @@ class StockAlert:
     acknowledged_at: Optional[datetime] = None
     dismissed_by: Optional[str] = None
     dismissed_at: Optional[datetime] = None
+    resolved_at: Optional[datetime] = None
+    occurrences: int = 1
     
     # Additional context
     predicted_stockout_date: Optional[datetime] = None
@@ -97,15 +143,410 @@ class ReorderSuggestion:
     supplier: Optional[str] = None
     expected_delivery: Optional[datetime] = None
 
+def _low_stock_urgency(product: "Product") -> AlertUrgency:
+    return AlertUrgency.HIGH if product.current_stock < product.min_stock * 0.5 else AlertUrgency.MEDIUM
+
+class ProductSnapshot:
+    """
+    Columnar copy of the monitored products
+    Stock, thresholds, daily sales average and unit cost are kept as NumPy
+    arrays (one row per product, written through on every update), so alert
+    rules, predictions and analytics run over the whole catalog in one
+    vectorized pass. It also records each product's last evaluated stock
+    band (and urgency within the low band), so alerts are only re-evaluated
+    on transitions.
+    """
+    
+    COLUMNS = {
+        "current_stock": np.int64,
+        "min_stock": np.int64,
+        "reorder_point": np.int64,
+        "max_stock": np.int64,
+        "daily_sales_avg": np.float64,
+        "unit_cost": np.float64
+    }
+    # Recorded state of a row that was never evaluated
+    UNKNOWN_STATE = -1
+    
+    def __init__(self):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.current_stock = np.zeros(0, dtype=np.int64)
+        self.min_stock = np.zeros(0, dtype=np.int64)
+        self.reorder_point = np.zeros(0, dtype=np.int64)
+        self.max_stock = np.zeros(0, dtype=np.int64)
+        self.daily_sales_avg = np.zeros(0, dtype=np.float64)
+        self.unit_cost = np.zeros(0, dtype=np.float64)
+        self._states = np.zeros(0, dtype=np.int8)
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @staticmethod
+    def _values(product: "Product") -> Dict[str, float]:
+        # No maximum is stored as 0, like the falsy check of the alert rules
+        return {
+            "current_stock": product.current_stock,
+            "min_stock": product.min_stock,
+            "reorder_point": product.reorder_point,
+            "max_stock": product.max_stock or 0,
+            "daily_sales_avg": product.daily_sales_avg,
+            "unit_cost": product.unit_cost
+        }
+    
+    def update(self, products: Iterable["Product"]) -> np.ndarray:
+        """Write the products' current values, adding new ones, returns their rows"""
+        with self._lock:
+            rows, added = [], []
+            for product in products:
+                row = self.rows.get(product.id)
+                if row is None:
+                    row = self.rows[product.id] = len(self.ids) + len(added)
+                    added.append(product)
+                else:
+                    for name, value in self._values(product).items():
+                        getattr(self, name)[row] = value
+                rows.append(row)
+            
+            if added:
+                values = [self._values(product) for product in added]
+                for name, dtype in self.COLUMNS.items():
+                    new = np.fromiter((value[name] for value in values), dtype=dtype, count=len(values))
+                    setattr(self, name, np.concatenate([getattr(self, name), new]))
+                self._states = np.concatenate([self._states, np.full(len(added), self.UNKNOWN_STATE, dtype=np.int8)])
+                self.ids.extend(product.id for product in added)
+            return np.asarray(rows, dtype=np.intp)
+    
+    def rows_of(self, product_ids: Iterable[str]) -> np.ndarray:
+        """Rows of the known product ids, in catalog order"""
+        return np.sort(np.fromiter(
+            (self.rows[product_id] for product_id in set(product_ids) if product_id in self.rows), dtype=np.intp
+        ))
+    
+    def bands(self, rows=slice(None)) -> np.ndarray:
+        """Index into STOCK_BANDS of each row: how many band edges lie below the stock"""
+        stock = self.current_stock[rows]
+        min_stock = self.min_stock[rows]
+        reorder = np.maximum(min_stock, self.reorder_point[rows])
+        max_stock = self.max_stock[rows]
+        over = np.where(max_stock > 0, np.maximum(reorder, max_stock), np.iinfo(np.int64).max)
+        return (
+            (stock > 0).astype(np.int8) + (stock > min_stock) + (stock > reorder) + (stock > over)
+        ).astype(np.int8)
+    
+    def _state_codes(self, rows) -> np.ndarray:
+        bands = self.bands(rows)
+        low = STOCK_BANDS.index(StockBand.LOW)
+        high = (bands == low) & (self.current_stock[rows] < self.min_stock[rows] * 0.5)
+        return (bands * 2 + high).astype(np.int8)
+    
+    def transitions(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Record the current states of the rows (default all), returns those that changed"""
+        with self._lock:
+            rows = np.arange(len(self.ids), dtype=np.intp) if rows is None else rows
+            states = self._state_codes(rows)
+            changed = states != self._states[rows]
+            self._states[rows[changed]] = states[changed]
+            return np.unique(rows[changed])
+    
+    def predict(self, rows, horizons: Iterable[int] = PREDICTION_HORIZONS) -> Dict[str, np.ndarray]:
+        """Stock left after each horizon (days) and days until the reorder point"""
+        stock = self.current_stock[rows]
+        daily = self.daily_sales_avg[rows]
+        reorder = self.reorder_point[rows]
+        selling = daily > 0
+        safe_daily = np.where(selling, daily, 1.0)
+        return {
+            "selling": selling,
+            **{f"{days}_days": np.maximum(0, stock - (daily * days).astype(np.int64)) for days in horizons},
+            # Reorder now once the reorder point is reached
+            "days_until_reorder": np.where(stock > reorder, (stock - reorder) / safe_daily, 0.0)
+        }
+    
+    def forget(self, rows: np.ndarray):
+        """Drop the recorded states, so the next check re-evaluates these rows"""
+        with self._lock:
+            self._states[rows] = self.UNKNOWN_STATE
+
+class StockAlertStore:
+    """
+    Persistent alert store
+    Keeps one open (active or acknowledged) alert per product and type
+    """
+    
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+    
+    @staticmethod
+    def _to_alert(record: StockAlertRecord) -> StockAlert:
+        return StockAlert(
+            id=str(record.id),
+            product_id=record.product_id,
+            product_name=record.product_name,
+            alert_type=AlertType(record.alert_type),
+            urgency=AlertUrgency(record.urgency),
+            current_stock=record.current_stock,
+            threshold=record.threshold,
+            message=record.message,
+            created_at=record.created_at,
+            status=AlertStatus(record.status),
+            acknowledged_by=record.acknowledged_by,
+            acknowledged_at=record.acknowledged_at,
+            dismissed_by=record.dismissed_by,
+            dismissed_at=record.dismissed_at,
+            resolved_at=record.resolved_at,
+            occurrences=record.occurrences,
+            predicted_stockout_date=record.predicted_stockout_date,
+            recommended_order_quantity=record.recommended_order_quantity,
+            cost_impact=record.cost_impact
+        )
+    
+    @staticmethod
+    def _apply(record: StockAlertRecord, alert: StockAlert):
+        record.product_name = alert.product_name
+        record.urgency = alert.urgency.value
+        record.current_stock = alert.current_stock
+        record.threshold = alert.threshold
+        record.message = alert.message
+        record.predicted_stockout_date = alert.predicted_stockout_date
+        record.recommended_order_quantity = alert.recommended_order_quantity
+        record.cost_impact = alert.cost_impact
+    
+    def _open_alerts(self, db: Session, product_ids: List[str]) -> Dict[Tuple[str, str], StockAlertRecord]:
+        open_alerts = {}
+        for start in range(0, len(product_ids), ALERT_LOOKUP_CHUNK_SIZE):
+            records = db.scalars(select(StockAlertRecord).where(
+                StockAlertRecord.product_id.in_(product_ids[start:start + ALERT_LOOKUP_CHUNK_SIZE]),
+                StockAlertRecord.status.in_(OPEN_ALERT_STATUSES)
+            )).all()
+            open_alerts.update({(record.product_id, record.alert_type): record for record in records})
+        return open_alerts
+    
+    def record_checks(self, checks: Dict[str, List[StockAlert]]) -> List[StockAlert]:
+        """Store the result of checking products, keyed by product id.
+        
+        Detected conditions update the product's open alert of that type or
+        open one; open alerts of the checked products whose condition was not
+        detected again are resolved. Returns the alerts that were opened or
+        escalated to a higher urgency.
+        """
+        if not checks:
+            return []
+        
+        # A concurrent check may open the same alert first, then ours updates it
+        for attempt in range(2):
+            with self.session_factory() as db:
+                try:
+                    changed = [self._to_alert(record) for record in self._record_checks(db, checks)]
+                    db.commit()
+                    return changed
+                except IntegrityError:
+                    db.rollback()
+                    if attempt:
+                        raise
+    
+    def _record_checks(self, db: Session, checks: Dict[str, List[StockAlert]]) -> List[StockAlertRecord]:
+        open_alerts = self._open_alerts(db, list(checks))
+        detected = set()
+        changed = []
+        now = datetime.now()
+        
+        for product_id, alerts in checks.items():
+            for alert in alerts:
+                key = (product_id, alert.alert_type.value)
+                detected.add(key)
+                record = open_alerts.get(key)
+                if record is None:
+                    record = StockAlertRecord(
+                        product_id=product_id,
+                        alert_type=alert.alert_type.value,
+                        status=AlertStatus.ACTIVE.value,
+                        occurrences=1,
+                        day=alert.created_at.date(),
+                        created_at=alert.created_at
+                    )
+                    db.add(record)
+                    changed.append(record)
+                else:
+                    record.occurrences += 1
+                    if URGENCY_RANK[alert.urgency] < URGENCY_RANK[AlertUrgency(record.urgency)]:
+                        # Escalations need attention again even if acknowledged
+                        record.status = AlertStatus.ACTIVE.value
+                        changed.append(record)
+                self._apply(record, alert)
+        
+        for key, record in open_alerts.items():
+            if key not in detected:
+                record.status = AlertStatus.RESOLVED.value
+                record.resolved_at = now
+        
+        db.flush()
+        return changed
+    
+    def get_active(self, urgency: Optional[AlertUrgency] = None,
+                   alert_type: Optional[AlertType] = None, limit: int = 50) -> List[StockAlert]:
+        query = select(StockAlertRecord).where(StockAlertRecord.status == AlertStatus.ACTIVE.value)
+        if urgency:
+            query = query.where(StockAlertRecord.urgency == urgency.value)
+        if alert_type:
+            query = query.where(StockAlertRecord.alert_type == alert_type.value)
+        
+        # Most urgent first, then newest
+        rank = case({u.value: r for u, r in URGENCY_RANK.items()}, value=StockAlertRecord.urgency)
+        query = query.order_by(rank, StockAlertRecord.created_at.desc(), StockAlertRecord.id.desc()).limit(limit)
+        with self.session_factory() as db:
+            return [self._to_alert(record) for record in db.scalars(query).all()]
+    
+    def count_active(self, urgency: Optional[AlertUrgency] = None) -> int:
+        query = select(func.count(StockAlertRecord.id)).where(StockAlertRecord.status == AlertStatus.ACTIVE.value)
+        if urgency:
+            query = query.where(StockAlertRecord.urgency == urgency.value)
+        with self.session_factory() as db:
+            return db.scalar(query)
+    
+    def set_status(self, alert_id: str, status: AlertStatus, by: str) -> Optional[StockAlert]:
+        """Acknowledge an active alert or dismiss an open one.
+        
+        Returns None if there is no such alert and raises AlertNotOpenError
+        if it is not in a status the change applies to.
+        """
+        if not str(alert_id).isdigit():
+            return None
+        with self.session_factory() as db:
+            record = db.get(StockAlertRecord, int(alert_id))
+            if record is None:
+                return None
+            if record.status not in ALLOWED_STATUS_FROM[status]:
+                raise AlertNotOpenError(f"Alert {alert_id} is {record.status} and cannot be {status.value}")
+            record.status = status.value
+            if status == AlertStatus.ACKNOWLEDGED:
+                record.acknowledged_by = by
+                record.acknowledged_at = datetime.now()
+            elif status == AlertStatus.DISMISSED:
+                record.dismissed_by = by
+                record.dismissed_at = datetime.now()
+            db.flush()
+            alert = self._to_alert(record)
+            db.commit()
+            return alert
+    
+    def get_history(self, since: date, limit: int = 100) -> List[StockAlert]:
+        """Newest alerts raised on ``since`` or later, from the day partitions in the window"""
+        query = select(StockAlertRecord).where(StockAlertRecord.day >= since).order_by(
+            StockAlertRecord.day.desc(), StockAlertRecord.created_at.desc(), StockAlertRecord.id.desc()
+        ).limit(limit)
+        with self.session_factory() as db:
+            return [self._to_alert(record) for record in db.scalars(query).all()]
+    
+    def count_compacted(self, since: date) -> int:
+        """Alerts raised on ``since`` or later that only survive as daily counts"""
+        query = select(func.coalesce(func.sum(StockAlertDailySummary.alert_count), 0)).where(
+            StockAlertDailySummary.day >= since
+        )
+        with self.session_factory() as db:
+            return db.scalar(query)
+    
+    def compact_history(self, before: date) -> int:
+        """Fold closed alerts raised before ``before`` into daily counts.
+        
+        Open alerts are kept whatever their age; they are compacted once
+        closed. Only the rows this call deleted are counted, and counts are
+        added in the database, so workers compacting at the same time never
+        count an alert twice. Returns how many alerts were compacted.
+        """
+        closed = delete(StockAlertRecord).where(
+            StockAlertRecord.day < before, StockAlertRecord.status.notin_(OPEN_ALERT_STATUSES)
+        ).execution_options(synchronize_session=False)
+        with self.session_factory() as db:
+            dialect = db.get_bind().dialect.name
+            counts = defaultdict(int)
+            if dialect in ("sqlite", "postgresql"):
+                deleted = db.execute(closed.returning(
+                    StockAlertRecord.day, StockAlertRecord.alert_type, StockAlertRecord.urgency
+                ))
+                for key in deleted:
+                    counts[tuple(key)] += 1
+            else:
+                # Generic fallback for dialects without DELETE ... RETURNING
+                for key in db.execute(select(StockAlertRecord.day, StockAlertRecord.alert_type,
+                                             StockAlertRecord.urgency).where(closed.whereclause)):
+                    counts[tuple(key)] += 1
+                db.execute(closed)
+            if not counts:
+                return 0
+            
+            rows = [
+                {"day": day, "alert_type": alert_type, "urgency": urgency, "alert_count": count}
+                for (day, alert_type, urgency), count in counts.items()
+            ]
+            if dialect in ("sqlite", "postgresql"):
+                insert_fn = sqlite_insert if dialect == "sqlite" else pg_insert
+                stmt = insert_fn(StockAlertDailySummary)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["day", "alert_type", "urgency"],
+                    set_={"alert_count": StockAlertDailySummary.alert_count + stmt.excluded.alert_count}
+                )
+                db.execute(stmt, rows)
+            else:
+                for row in rows:
+                    summary = db.scalar(select(StockAlertDailySummary).where(
+                        StockAlertDailySummary.day == row["day"],
+                        StockAlertDailySummary.alert_type == row["alert_type"],
+                        StockAlertDailySummary.urgency == row["urgency"]
+                    ))
+                    if summary is None:
+                        db.add(StockAlertDailySummary(**row))
+                    else:
+                        summary.alert_count += row["alert_count"]
+            db.commit()
+            return sum(counts.values())
+    
+    def get_trend(self, since: date) -> List[Dict[str, Any]]:
+        """Alerts raised per day from ``since`` through today, compacted days included"""
+        detailed = select(StockAlertRecord.day, StockAlertRecord.alert_type, StockAlertRecord.urgency,
+                          func.count(StockAlertRecord.id)).where(StockAlertRecord.day >= since).group_by(
+            StockAlertRecord.day, StockAlertRecord.alert_type, StockAlertRecord.urgency
+        )
+        compacted = select(StockAlertDailySummary.day, StockAlertDailySummary.alert_type,
+                           StockAlertDailySummary.urgency, StockAlertDailySummary.alert_count).where(
+            StockAlertDailySummary.day >= since
+        )
+        
+        days = {
+            since + timedelta(days=offset): {"total": 0, "by_type": defaultdict(int), "by_urgency": defaultdict(int)}
+            for offset in range((date.today() - since).days + 1)
+        }
+        with self.session_factory() as db:
+            for query in (detailed, compacted):
+                for day, alert_type, urgency, count in db.execute(query):
+                    bucket = days.get(day)
+                    if bucket is None:
+                        continue
+                    bucket["total"] += count
+                    bucket["by_type"][alert_type] += count
+                    bucket["by_urgency"][urgency] += count
+        
+        return [
+            {"date": day.isoformat(), "total": bucket["total"],
+             "by_type": dict(bucket["by_type"]), "by_urgency": dict(bucket["by_urgency"])}
+            for day, bucket in days.items()
+        ]
+
 class StockAlertsService:
     """
     Stock Alerts Service
     Provides intelligent inventory monitoring and predictive analytics
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[StockAlertStore] = None):
         self.products: Dict[str, Product] = {}
-        self.alerts: Dict[str, StockAlert] = {}
+        self.store = store or StockAlertStore()
+        self.snapshot = ProductSnapshot()
+        # Pushes opened and escalated alerts to subscribed dashboards
+        self.broadcaster = AlertBroadcaster()
+        self.last_bulk_check_at: Optional[datetime] = None
+        self.history_compacted_on: Optional[date] = None
         self.alert_settings = {
             "enable_low_stock": True,
             "enable_overstock": True,
@@ -200,45 +641,73 @@ class StockAlertsService:
         
         for product in mock_products:
             self.products[product.id] = product
-            # Calculate predictions
-            self._calculate_predictions(product)
-        
-        # Generate initial alerts
-        self._generate_initial_alerts()
+        self.snapshot.update(mock_products)
+    
+    def _synced_snapshot(self) -> ProductSnapshot:
+        """The snapshot, after adding products put in ``self.products`` directly"""
+        if len(self.snapshot) != len(self.products):
+            self.snapshot.update(
+                product for product_id, product in self.products.items() if product_id not in self.snapshot.rows
+            )
+        return self.snapshot
     
-    def _calculate_predictions(self, product: Product):
-        """Calculate stock predictions for a product"""
+    def _check_product_alerts(self, product: Product) -> List[StockAlert]:
+        """Check a product and store its alerts, returns the opened or escalated ones"""
+        return self._check_products([product])
+    
+    def _check_products(self, products: Optional[Iterable[Product]] = None) -> List[StockAlert]:
+        """Store the alerts of the products (default all) whose stock band changed.
+        
+        Passed products are written to the snapshot first; without them the
+        whole snapshot is evaluated in one vectorized pass.
+        """
+        snapshot = self._synced_snapshot()
+        rows = snapshot.update(products) if products is not None else None
+        changed = snapshot.transitions(rows)
         try:
-            # Simple prediction based on daily sales average
-            daily_usage = product.daily_sales_avg
-            
-            if daily_usage > 0:
-                # Predict stock levels
-                product.predicted_stock_7d = max(0, product.current_stock - int(daily_usage * 7))
-                product.predicted_stock_14d = max(0, product.current_stock - int(daily_usage * 14))
-                product.predicted_stock_30d = max(0, product.current_stock - int(daily_usage * 30))
-                
-                # Predict next reorder date
-                if product.current_stock > product.reorder_point:
-                    days_until_reorder = (product.current_stock - product.reorder_point) / daily_usage
-                    product.next_reorder_date = datetime.now() + timedelta(days=days_until_reorder)
-                else:
-                    product.next_reorder_date = datetime.now()  # Reorder now
-            
-        except Exception as e:
-            logger.error(f"Error calculating predictions for {product.id}: {str(e)}")
+            alerts = self.store.record_checks({
+                product.id: self._detect_alerts(product)
+                for product in (self.products[snapshot.ids[row]] for row in changed)
+            })
+        except Exception:
+            # Not stored, so evaluate them again next time
+            snapshot.forget(changed)
+            raise
+        
+        self.broadcaster.publish([
+            {"event": "opened" if alert.occurrences == 1 else "escalated", "alert": self._alert_to_dict(alert)}
+            for alert in alerts
+        ])
+        return alerts
     
-    def _generate_initial_alerts(self):
-        """Generate initial alerts based on current stock levels"""
-        for product in self.products.values():
-            self._check_product_alerts(product)
+    @staticmethod
+    def _alert_to_dict(alert: StockAlert) -> Dict[str, Any]:
+        return {
+            "id": alert.id,
+            "product_id": alert.product_id,
+            "product_name": alert.product_name,
+            "alert_type": alert.alert_type.value,
+            "urgency": alert.urgency.value,
+            "current_stock": alert.current_stock,
+            "threshold": alert.threshold,
+            "message": alert.message,
+            "created_at": alert.created_at.isoformat(),
+            "occurrences": alert.occurrences,
+            "predicted_stockout_date": alert.predicted_stockout_date.isoformat() if alert.predicted_stockout_date else None,
+            "recommended_order_quantity": alert.recommended_order_quantity,
+            "cost_impact": alert.cost_impact
+        }
+    
+    def is_business_hours(self, now: Optional[datetime] = None) -> bool:
+        hour = (now or datetime.now()).hour
+        return settings.STOCK_ALERT_BUSINESS_HOURS_START <= hour < settings.STOCK_ALERT_BUSINESS_HOURS_END
     
-    def _check_product_alerts(self, product: Product):
-        """Check and generate alerts for a specific product"""
+    def _detect_alerts(self, product: Product) -> List[StockAlert]:
+        """Alerts for the product's current stock level"""
         alerts_generated = []
         
         # Check for out of stock
-        if product.current_stock == 0:
+        if product.current_stock <= 0:
             alert = self._create_alert(
                 product=product,
                 alert_type=AlertType.OUT_OF_STOCK,
@@ -250,7 +719,7 @@ class StockAlertsService:
         
         # Check for low stock
         elif product.current_stock <= product.min_stock:
-            urgency = AlertUrgency.HIGH if product.current_stock < product.min_stock * 0.5 else AlertUrgency.MEDIUM
+            urgency = _low_stock_urgency(product)
             alert = self._create_alert(
                 product=product,
                 alert_type=AlertType.LOW_STOCK,
@@ -286,11 +755,9 @@ class StockAlertsService:
     
     def _create_alert(self, product: Product, alert_type: AlertType, urgency: AlertUrgency, 
                      threshold: int, message: str) -> StockAlert:
-        """Create a new stock alert"""
-        alert_id = f"alert_{product.id}_{alert_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
+        """Build a stock alert, stored by StockAlertStore.record_checks"""
         alert = StockAlert(
-            id=alert_id,
+            id=None,
             product_id=product.id,
             product_name=product.name,
             alert_type=alert_type,
@@ -317,7 +784,6 @@ class StockAlertsService:
             # Calculate cost impact
             alert.cost_impact = alert.recommended_order_quantity * product.unit_cost
         
-        self.alerts[alert_id] = alert
         return alert
     
     def get_active_alerts(self, urgency: Optional[AlertUrgency] = None, 
@@ -325,49 +791,13 @@ class StockAlertsService:
                          limit: int = 50) -> Dict[str, Any]:
         """Get active stock alerts with filtering"""
         try:
-            alerts = [
-                alert for alert in self.alerts.values()
-                if alert.status == AlertStatus.ACTIVE
-            ]
-            
-            # Apply filters
-            if urgency:
-                alerts = [alert for alert in alerts if alert.urgency == urgency]
-            
-            if alert_type:
-                alerts = [alert for alert in alerts if alert.alert_type == alert_type]
-            
-            # Sort by urgency and creation date
-            urgency_order = {
-                AlertUrgency.CRITICAL: 0,
-                AlertUrgency.HIGH: 1,
-                AlertUrgency.MEDIUM: 2,
-                AlertUrgency.LOW: 3
-            }
-            
-            alerts.sort(key=lambda x: (urgency_order[x.urgency], x.created_at), reverse=True)
-            alerts = alerts[:limit]
+            # Most urgent first, then newest
+            alerts = self.store.get_active(urgency=urgency, alert_type=alert_type, limit=limit)
             
             return {
                 "success": True,
                 "total": len(alerts),
-                "alerts": [
-                    {
-                        "id": alert.id,
-                        "product_id": alert.product_id,
-                        "product_name": alert.product_name,
-                        "alert_type": alert.alert_type.value,
-                        "urgency": alert.urgency.value,
-                        "current_stock": alert.current_stock,
-                        "threshold": alert.threshold,
-                        "message": alert.message,
-                        "created_at": alert.created_at.isoformat(),
-                        "predicted_stockout_date": alert.predicted_stockout_date.isoformat() if alert.predicted_stockout_date else None,
-                        "recommended_order_quantity": alert.recommended_order_quantity,
-                        "cost_impact": alert.cost_impact
-                    }
-                    for alert in alerts
-                ]
+                "alerts": [self._alert_to_dict(alert) for alert in alerts]
             }
             
         except Exception as e:
@@ -382,28 +812,40 @@ class StockAlertsService:
                             product_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get stock level predictions"""
         try:
-            products = self.products.values()
-            if product_ids:
-                products = [p for p in products if p.id in product_ids]
+            snapshot = self._synced_snapshot()
+            rows = snapshot.rows_of(product_ids) if product_ids else np.arange(len(snapshot), dtype=np.intp)
             
-            predictions = []
-            for product in products:
-                self._calculate_predictions(product)
-                
-                prediction = {
-                    "product_id": product.id,
-                    "product_name": product.name,
-                    "current_stock": product.current_stock,
-                    "daily_sales_avg": product.daily_sales_avg,
-                    "predictions": {
-                        "7_days": product.predicted_stock_7d,
-                        "14_days": product.predicted_stock_14d,
-                        "30_days": product.predicted_stock_30d
-                    },
-                    "next_reorder_date": product.next_reorder_date.isoformat() if product.next_reorder_date else None,
-                    "reorder_recommended": product.current_stock <= product.reorder_point
+            # Vectorized over all rows, then converted to plain lists once
+            forecast = snapshot.predict(rows)
+            selling = forecast["selling"]
+            horizon_keys = [f"{days}_days" for days in PREDICTION_HORIZONS]
+            # Without sales there is nothing to predict
+            horizons = zip(*(np.where(selling, forecast[key], None).tolist() for key in horizon_keys))
+            reorder_dates = np.datetime64(datetime.now(), "us") + np.round(
+                forecast["days_until_reorder"] * 86_400_000_000
+            ).astype("timedelta64[us]")
+            reorder_dates = np.where(selling, np.datetime_as_string(reorder_dates), None).tolist()
+            reorder_recommended = (snapshot.current_stock[rows] <= snapshot.reorder_point[rows]).tolist()
+            
+            predictions = [
+                {
+                    "product_id": product_id,
+                    "product_name": self.products[product_id].name,
+                    "current_stock": current_stock,
+                    "daily_sales_avg": daily_sales_avg,
+                    "predictions": dict(zip(horizon_keys, horizon)),
+                    "next_reorder_date": reorder_date,
+                    "reorder_recommended": recommended
                 }
-                predictions.append(prediction)
+                for product_id, current_stock, daily_sales_avg, horizon, reorder_date, recommended in zip(
+                    (snapshot.ids[row] for row in rows.tolist()),
+                    snapshot.current_stock[rows].tolist(),
+                    snapshot.daily_sales_avg[rows].tolist(),
+                    horizons,
+                    reorder_dates,
+                    reorder_recommended
+                )
+            ]
             
             return {
                 "success": True,
@@ -428,9 +870,6 @@ class StockAlertsService:
             product.reorder_point = reorder_point
             product.max_stock = max_stock
             
-            # Recalculate predictions
-            self._calculate_predictions(product)
-            
             # Check for new alerts
             self._check_product_alerts(product)
             
@@ -463,10 +902,8 @@ class StockAlertsService:
             if location:
                 product.location = location
             
-            # Recalculate predictions
-            self._calculate_predictions(product)
-            
-            # Check for new alerts
+            # Only a change of stock band re-evaluates the alerts, predictions
+            # are computed when they are requested
             new_alerts = self._check_product_alerts(product)
             
             return {
@@ -482,6 +919,36 @@ class StockAlertsService:
             logger.error(f"Error updating stock level: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    def update_stock_levels(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply many stock updates and check the alerts of those that changed band"""
+        try:
+            updated_at = datetime.now()
+            updated, not_found = [], []
+            for update in updates:
+                product = self.products.get(update["product_id"])
+                if product is None:
+                    not_found.append(update["product_id"])
+                    continue
+                product.current_stock = update["current_stock"]
+                product.last_updated = updated_at
+                if update.get("location"):
+                    product.location = update["location"]
+                updated.append(product)
+            
+            new_alerts = self._check_products(updated)
+            
+            return {
+                "success": True,
+                "updated": len(updated),
+                "not_found": not_found,
+                "alerts_triggered": len(new_alerts),
+                "updated_at": updated_at.isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Error updating stock levels: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
     def get_reorder_suggestions(self, urgency: Optional[AlertUrgency] = None,
                                limit: int = 20) -> Dict[str, Any]:
         """Get intelligent reorder suggestions"""
@@ -528,14 +995,7 @@ class StockAlertsService:
                     suggestions.append(suggestion)
             
             # Sort by urgency
-            urgency_order = {
-                AlertUrgency.CRITICAL: 0,
-                AlertUrgency.HIGH: 1,
-                AlertUrgency.MEDIUM: 2,
-                AlertUrgency.LOW: 3
-            }
-            
-            suggestions.sort(key=lambda x: urgency_order[x.urgency])
+            suggestions.sort(key=lambda x: URGENCY_RANK[x.urgency])
             suggestions = suggestions[:limit]
             
             return {
@@ -583,14 +1043,10 @@ class StockAlertsService:
     def acknowledge_alert(self, alert_id: str, acknowledged_by: str) -> Dict[str, Any]:
         """Acknowledge an alert"""
         try:
-            if alert_id not in self.alerts:
+            alert = self.store.set_status(alert_id, AlertStatus.ACKNOWLEDGED, acknowledged_by)
+            if alert is None:
                 return {"success": False, "error": "Alert not found"}
             
-            alert = self.alerts[alert_id]
-            alert.status = AlertStatus.ACKNOWLEDGED
-            alert.acknowledged_by = acknowledged_by
-            alert.acknowledged_at = datetime.now()
-            
             return {
                 "success": True,
                 "alert_id": alert_id,
@@ -598,6 +1054,8 @@ class StockAlertsService:
                 "acknowledged_at": alert.acknowledged_at.isoformat()
             }
             
+        except AlertNotOpenError as e:
+            return {"success": False, "error": str(e), "conflict": True}
         except Exception as e:
             logger.error(f"Error acknowledging alert: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -605,14 +1063,10 @@ class StockAlertsService:
     def dismiss_alert(self, alert_id: str, dismissed_by: str) -> Dict[str, Any]:
         """Dismiss an alert"""
         try:
-            if alert_id not in self.alerts:
+            alert = self.store.set_status(alert_id, AlertStatus.DISMISSED, dismissed_by)
+            if alert is None:
                 return {"success": False, "error": "Alert not found"}
             
-            alert = self.alerts[alert_id]
-            alert.status = AlertStatus.DISMISSED
-            alert.dismissed_by = dismissed_by
-            alert.dismissed_at = datetime.now()
-            
             return {
                 "success": True,
                 "alert_id": alert_id,
@@ -620,6 +1074,8 @@ class StockAlertsService:
                 "dismissed_at": alert.dismissed_at.isoformat()
             }
             
+        except AlertNotOpenError as e:
+            return {"success": False, "error": str(e), "conflict": True}
         except Exception as e:
             logger.error(f"Error dismissing alert: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -650,16 +1106,24 @@ class StockAlertsService:
     def get_stock_analytics(self, days_back: int = 30) -> Dict[str, Any]:
         """Get stock analytics and alert statistics"""
         try:
-            # Calculate analytics
-            total_products = len(self.products)
-            low_stock_products = sum(1 for p in self.products.values() if p.current_stock <= p.min_stock)
-            out_of_stock_products = sum(1 for p in self.products.values() if p.current_stock == 0)
+            # Calculate analytics over the snapshot columns
+            snapshot = self._synced_snapshot()
+            stock = snapshot.current_stock
+            total_products = len(snapshot)
+            low_stock_products = int(np.count_nonzero(stock <= snapshot.min_stock))
+            out_of_stock_products = int(np.count_nonzero(stock <= 0))
             
-            active_alerts = len([a for a in self.alerts.values() if a.status == AlertStatus.ACTIVE])
-            critical_alerts = len([a for a in self.alerts.values() if a.status == AlertStatus.ACTIVE and a.urgency == AlertUrgency.CRITICAL])
+            active_alerts = self.store.count_active()
+            critical_alerts = self.store.count_active(AlertUrgency.CRITICAL)
             
             # Calculate total inventory value
-            total_value = sum(p.current_stock * p.unit_cost for p in self.products.values())
+            total_value = float(np.dot(stock, snapshot.unit_cost))
+            
+            selling = snapshot.daily_sales_avg > 0
+            days_of_supply = stock[selling] / snapshot.daily_sales_avg[selling]
+            average_days_of_supply = round(float(days_of_supply.mean()), 1) if days_of_supply.size else None
+            
+            alert_trend = self.store.get_trend(date.today() - timedelta(days=days_back))
             
             return {
                 "success": True,
@@ -671,7 +1135,8 @@ class StockAlertsService:
                     "critical_alerts": critical_alerts,
                     "total_inventory_value": total_value,
                     "stock_turnover_rate": 0.15,  # Mock data
-                    "average_days_of_supply": 21.5,  # Mock data
+                    "average_days_of_supply": average_days_of_supply,
+                    "alert_trend": alert_trend,
                     "generated_at": datetime.now().isoformat()
                 }
             }
@@ -683,19 +1148,15 @@ class StockAlertsService:
     def get_alert_history(self, days_back: int = 30, limit: int = 100) -> Dict[str, Any]:
         """Get historical alerts"""
         try:
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            
-            historical_alerts = [
-                alert for alert in self.alerts.values()
-                if alert.created_at >= cutoff_date
-            ]
+            # Whole days, so only the day partitions in the window are read
+            since = date.today() - timedelta(days=days_back)
             
-            historical_alerts.sort(key=lambda x: x.created_at, reverse=True)
-            historical_alerts = historical_alerts[:limit]
+            historical_alerts = self.store.get_history(since, limit)
             
             return {
                 "success": True,
                 "total": len(historical_alerts),
+                "compacted_alerts": self.store.count_compacted(since),
                 "alerts": [
                     {
                         "id": alert.id,
@@ -724,14 +1185,16 @@ class StockAlertsService:
                 "system_health": {
                     "status": "healthy",
                     "total_products_monitored": len(self.products),
-                    "active_alerts": len([a for a in self.alerts.values() if a.status == AlertStatus.ACTIVE]),
+                    "active_alerts": self.store.count_active(),
                     "last_update": datetime.now().isoformat(),
+                    "last_bulk_check": self.last_bulk_check_at.isoformat() if self.last_bulk_check_at else None,
                     "monitoring_enabled": True,
                     "notification_services": {
                         "email": "active",
                         "dashboard": "active",
                         "sms": "inactive"
-                    }
+                    },
+                    "push_subscribers": self.broadcaster.subscriber_count
                 }
             }
             
@@ -744,7 +1207,7 @@ class StockAlertsService:
         try:
             if product_id in self.products:
                 product = self.products[product_id]
-                alerts = self._check_product_alerts(product)
+                alerts = await asyncio.to_thread(self._check_product_alerts, product)
                 
                 # In a real implementation, send notifications here
                 logger.info(f"Generated {len(alerts)} alerts for product {product_id}")
@@ -753,17 +1216,44 @@ class StockAlertsService:
             logger.error(f"Error checking alerts for product {product_id}: {str(e)}")
     
     async def bulk_check_alerts(self):
-        """Perform bulk alert checking for all products"""
+        """Check all products, re-evaluating the alerts of those that changed band"""
         try:
-            total_alerts = 0
-            for product in self.products.values():
-                alerts = self._check_product_alerts(product)
-                total_alerts += len(alerts)
+            alerts = await asyncio.to_thread(self._check_products)
+            self.last_bulk_check_at = datetime.now()
+            
+            logger.info(f"Bulk check completed. Opened or escalated {len(alerts)} alerts")
             
-            logger.info(f"Bulk check completed. Generated {total_alerts} alerts")
+            if self.history_compacted_on != date.today():
+                await asyncio.to_thread(self.compact_alert_history)
             
         except Exception as e:
             logger.error(f"Error during bulk alert check: {str(e)}")
+    
+    def compact_alert_history(self) -> int:
+        """Compact closed alerts older than the history retention into daily counts"""
+        retention_days = settings.STOCK_ALERT_HISTORY_RETENTION_DAYS
+        compacted = 0
+        if retention_days > 0:
+            compacted = self.store.compact_history(date.today() - timedelta(days=retention_days))
+            if compacted:
+                logger.info(f"Compacted {compacted} alerts older than {retention_days} days")
+        self.history_compacted_on = date.today()
+        return compacted
+
+async def run_alert_scheduler(service: StockAlertsService, interval_seconds: float,
+                              jitter_seconds: float = 0) -> None:
+    """Periodically bulk check the stock alerts.
+    
+    Each wait is jittered by up to ``jitter_seconds`` either way, so workers
+    started together do not check in lockstep. With the
+    ``business_hours_only`` alert setting, checks outside business hours
+    are skipped.
+    """
+    while True:
+        await asyncio.sleep(max(1.0, interval_seconds + random.uniform(-jitter_seconds, jitter_seconds)))
+        if service.alert_settings.get("business_hours_only") and not service.is_business_hours():
+            continue
+        await service.bulk_check_alerts()
 
 # Singleton instance
 stock_alerts_service = StockAlertsService()
\ No newline at end of file
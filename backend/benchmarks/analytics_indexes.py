@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark the analytics hot paths with and without the 002 indexes.
+
+Builds a throwaway SQLite database from the ORM metadata, loads a synthetic
+dataset, then prints the query plan and timing of each hot query before and
+after creating the indexes added in alembic revision 002.
+
+    python benchmarks/analytics_indexes.py --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, desc, func, select, text
+
+from app.core.database import Base
+from app.models import Sale, SaleItem, Expense, Schedule, Employee
+
+PRODUCTS = [f"Product {i}" for i in range(500)]
+CATEGORIES = ["RENT", "UTILITIES", "INVENTORY", "MARKETING", "PAYROLL", "OTHER"]
+INDEX_NAMES = [
+    "idx_sales_created_at",
+    "idx_sale_items_sale_product",
+    "idx_expenses_date_category",
+    "idx_schedules_date_employee",
+]
+CHUNK = 50_000
+
+
+def load_data(engine, rows: int, span_days: int) -> None:
+    now = datetime.now()
+    rng = random.Random(42)
+    raw = engine.raw_connection()
+    cursor = raw.cursor()
+
+    def when():
+        return (now - timedelta(seconds=rng.randint(0, span_days * 86400))).strftime("%Y-%m-%d %H:%M:%S")
+
+    cursor.executemany(
+        "INSERT INTO employees (id, full_name, email, position, hourly_rate, hire_date, is_active) "
+        "VALUES (?, ?, ?, ?, ?, ?, 1)",
+        [(i, f"Employee {i}", f"e{i}@example.com", "Clerk", 15.0, "2020-01-01") for i in range(1, 51)]
+    )
+
+    for start in range(0, rows, CHUNK):
+        ids = range(start + 1, min(start + CHUNK, rows) + 1)
+        cursor.executemany(
+            "INSERT INTO sales (id, total_amount, payment_method, created_at) VALUES (?, ?, 'cash', ?)",
+            [(i, round(rng.uniform(5, 300), 2), when()) for i in ids]
+        )
+        cursor.executemany(
+            "INSERT INTO sale_items (sale_id, product_name, quantity, unit_price, total_price) "
+            "VALUES (?, ?, ?, 10.0, ?)",
+            [(i, rng.choice(PRODUCTS), q, q * 10.0) for i in ids for q in (rng.randint(1, 5), rng.randint(1, 5))]
+        )
+        cursor.executemany(
+            "INSERT INTO expenses (description, amount, category, date) VALUES ('bench', ?, ?, ?)",
+            [(round(rng.uniform(10, 500), 2), rng.choice(CATEGORIES), when()) for _ in range(len(ids) // 10)]
+        )
+        cursor.executemany(
+            "INSERT INTO schedules (employee_id, date, start_time, end_time, hours) "
+            "VALUES (?, ?, '09:00', '17:00', 8.0)",
+            [(rng.randint(1, 50), when()[:10]) for _ in range(len(ids) // 10)]
+        )
+        raw.commit()
+    raw.close()
+
+
+def hot_queries(start: datetime, end: datetime):
+    day = func.date(Sale.created_at)
+    return {
+        "sales_by_day": select(day, func.count(Sale.id), func.sum(Sale.total_amount))
+            .where(Sale.created_at >= start, Sale.created_at <= end)
+            .group_by(day),
+        "top_products": select(
+                SaleItem.product_name,
+                func.sum(SaleItem.quantity),
+                func.sum(SaleItem.total_price).label("total_revenue")
+            ).join(Sale)
+            .where(Sale.created_at >= start, Sale.created_at <= end)
+            .group_by(SaleItem.product_name)
+            .order_by(desc("total_revenue")).limit(10),
+        "expense_breakdown": select(Expense.category, func.sum(Expense.amount), func.count(Expense.id))
+            .where(Expense.date >= start, Expense.date <= end)
+            .group_by(Expense.category),
+        "schedule_hours": select(Schedule.employee_id, func.sum(Schedule.hours))
+            .where(Schedule.date >= start.date(), Schedule.date <= end.date())
+            .group_by(Schedule.employee_id),
+    }
+
+
+def measure(engine, queries, repeat: int):
+    results = {}
+    with engine.connect() as conn:
+        for name, query in queries.items():
+            compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+            plan = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                conn.execute(query).all()
+                timings.append(time.perf_counter() - started)
+            results[name] = (" | ".join(row[-1] for row in plan), min(timings) * 1000)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of sales to generate")
+    parser.add_argument("--days", type=int, default=30, help="analytics window in days")
+    parser.add_argument("--span", type=int, default=3 * 365, help="history span in days")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(
+        engine, tables=[Sale.__table__, SaleItem.__table__, Expense.__table__, Employee.__table__, Schedule.__table__]
+    )
+    indexes = [index for table in Base.metadata.sorted_tables for index in table.indexes if index.name in INDEX_NAMES]
+    for index in indexes:
+        index.drop(engine)
+
+    print(f"Loading {args.rows:,} sales into {path} ...")
+    started = time.perf_counter()
+    load_data(engine, args.rows, args.span)
+    print(f"Loaded in {time.perf_counter() - started:.1f}s")
+
+    end = datetime.now()
+    queries = hot_queries(end - timedelta(days=args.days), end)
+
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    before = measure(engine, queries, args.repeat)
+
+    for index in indexes:
+        index.create(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    after = measure(engine, queries, args.repeat)
+
+    for name in queries:
+        print(f"\n{name}")
+        print(f"  before: {before[name][1]:9.1f} ms  {before[name][0]}")
+        print(f"  after:  {after[name][1]:9.1f} ms  {after[name][0]}")
+
+    engine.dispose()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
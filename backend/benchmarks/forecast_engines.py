@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Compare the forecasting engines on accuracy and latency.
+
+Generates daily revenue series shaped like the sample data (tickets between
+45 and 235, a weekly cycle, slow trend and noise), holds out the last
+``--horizon`` days and reports MAPE / sMAPE / interval coverage and fit
+latency per engine, then the batch throughput of the NumPy engines.
+
+    python benchmarks/forecast_engines.py --series 20 --history 180
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services.forecasting import FORECAST_ENGINES, get_forecast_engine
+
+WEEKLY_PROFILE = np.array([0.8, 0.9, 0.95, 1.0, 1.2, 1.4, 0.75])
+
+
+def make_series(rng: np.random.Generator, history: int, horizon: int):
+    length = history + horizon
+    start = date.today() - timedelta(days=length)
+    t = np.arange(length)
+    base = rng.uniform(500, 1500)
+    trend = 1 + rng.uniform(-0.001, 0.003) * t
+    weekday = np.array([(start + timedelta(days=int(i))).weekday() for i in t])
+    noise = rng.normal(1, 0.12, length)
+    y = np.maximum(base * trend * WEEKLY_PROFILE[weekday] * noise, 0)
+    ds = [start + timedelta(days=int(i)) for i in t]
+    return ds, y
+
+
+def score(actual: np.ndarray, result) -> dict:
+    yhat = np.maximum(result.yhat, 0)
+    mape = np.mean(np.abs(actual - yhat) / np.maximum(actual, 1e-9)) * 100
+    smape = np.mean(2 * np.abs(actual - yhat) / np.maximum(np.abs(actual) + np.abs(yhat), 1e-9)) * 100
+    coverage = np.mean((actual >= result.lower) & (actual <= result.upper)) * 100
+    return {"mape": mape, "smape": smape, "coverage": coverage}
+
+
+def run(engines, series, history: int, horizon: int) -> None:
+    print(f"{'engine':<16}{'MAPE %':>9}{'sMAPE %':>9}{'cover %':>9}{'ms/series':>12}")
+    for name in engines:
+        engine = get_forecast_engine(name)
+        scores, elapsed = [], 0.0
+        for ds, y in series:
+            started = time.perf_counter()
+            result = engine.forecast(ds[:history], y[:history], horizon)
+            elapsed += time.perf_counter() - started
+            scores.append(score(y[history:], result))
+        mean = {key: np.mean([s[key] for s in scores]) for key in scores[0]}
+        print(f"{name:<16}{mean['mape']:>9.2f}{mean['smape']:>9.2f}{mean['coverage']:>9.1f}"
+              f"{elapsed / len(series) * 1000:>12.1f}")
+
+
+def run_batch(engines, rng: np.random.Generator, count: int, history: int, horizon: int) -> None:
+    batch = [make_series(rng, history, 0) for _ in range(count)]
+    print(f"\nbatch of {count} series")
+    for name in engines:
+        engine = get_forecast_engine(name)
+        started = time.perf_counter()
+        engine.forecast_batch(batch, horizon)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<16}{elapsed:>9.3f}s{count / elapsed:>12.0f} series/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--series", type=int, default=20, help="series scored per engine")
+    parser.add_argument("--history", type=int, default=180, help="days of history per series")
+    parser.add_argument("--horizon", type=int, default=30, help="held-out days to forecast")
+    parser.add_argument("--batch", type=int, default=2000, help="series in the batch throughput run")
+    parser.add_argument("--engines", nargs="+", default=list(FORECAST_ENGINES), choices=list(FORECAST_ENGINES))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    series = [make_series(rng, args.history, args.horizon) for _ in range(args.series)]
+
+    run(args.engines, series, args.history, args.horizon)
+    run_batch([name for name in args.engines if name != "prophet"], rng, args.batch, args.history, args.horizon)
+
+
+if __name__ == "__main__":
+    main()
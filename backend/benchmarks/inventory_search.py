@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Search-as-you-type latency of InventoryService.get_items(search=...).
+
+Builds a throwaway SQLite catalog of ``--items`` products with Greek and
+Latin names, then replays typing a few queries one keystroke at a time and
+reports the per-keystroke latency of a 20-row ranked search. ``--legacy``
+also times the old lower(name)/lower(description) LIKE scan on the same data.
+
+    python benchmarks/inventory_search.py --items 500000 --legacy
+
+Exits non-zero if the p95 keystroke latency exceeds ``--max-ms``.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.inventory import InventoryItem, build_search_text
+from app.services.inventory_service import InventoryService
+
+WORDS = [
+    "Καφές", "Ελληνικός", "Φρέντο", "Εσπρέσο", "Τσάι", "Χυμός", "Πορτοκάλι", "Μέλι", "Ψωμί", "Τυρί",
+    "Φέτα", "Ελαιόλαδο", "Γάλα", "Σοκολάτα", "Κουλούρι", "Café", "Crème", "Latte", "Organic", "Premium",
+    "Classic", "Light", "Bio", "Extra", "Family", "Mini", "Maxi", "Special", "Fresh", "Frozen",
+]
+SUPPLIERS = ["Λουμίδης", "Μεβγάλ", "Δέλτα", "Παπαδοπούλου", "Nestlé", "Barilla", "Μινέρβα", "Κρι Κρι"]
+QUERIES = ["καφες φρεντο", "ελαιολαδο", "fresh latte", "SKU-0012", "παπαδοπουλου"]
+CHUNK = 50_000
+
+
+def load_data(engine, items: int) -> None:
+    rng = random.Random(42)
+    raw = engine.raw_connection()
+    cursor = raw.cursor()
+    for start in range(0, items, CHUNK):
+        rows = []
+        for i in range(start + 1, min(start + CHUNK, items) + 1):
+            values = {
+                "name": " ".join(rng.sample(WORDS, 3)) + f" {rng.choice([250, 500, 1000])}g",
+                "sku": f"SKU-{i:07d}",
+                "barcode": f"520{i:010d}",
+                "supplier": rng.choice(SUPPLIERS),
+                "description": " ".join(rng.sample(WORDS, 6)),
+            }
+            rows.append((i, values["name"], values["sku"], values["barcode"], values["supplier"],
+                         values["description"], build_search_text(values)))
+        cursor.executemany(
+            "INSERT INTO inventory_items (id, name, sku, barcode, supplier, description, search_text, "
+            "current_stock, is_active) VALUES (?, ?, ?, ?, ?, ?, ?, 10, 1)",
+            rows
+        )
+    raw.commit()
+    raw.close()
+
+
+def legacy_search(db, search: str):
+    return db.query(InventoryItem).filter(
+        func.lower(InventoryItem.name).contains(search.lower()) |
+        func.lower(InventoryItem.description).contains(search.lower())
+    ).order_by(InventoryItem.name, InventoryItem.id).limit(20).all()
+
+
+def keystrokes(query: str):
+    return [query[:length] for length in range(1, len(query) + 1) if not query[length - 1].isspace()]
+
+
+def replay(fn) -> list:
+    timings = []
+    for query in QUERIES:
+        for prefix in keystrokes(query):
+            started = time.perf_counter()
+            fn(prefix)
+            timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(label: str, timings: list) -> float:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<10}{statistics.median(timings):>10.1f}{p95:>10.1f}{timings[-1]:>10.1f}")
+    return p95
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500_000)
+    parser.add_argument("--legacy", action="store_true", help="also time the LIKE scan")
+    parser.add_argument("--max-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        started = time.perf_counter()
+        load_data(engine, args.items)
+        print(f"loaded {args.items} items in {time.perf_counter() - started:.1f}s\n")
+
+        db = sessionmaker(bind=engine)()
+        service = InventoryService(db)
+        # Warm up the page cache and statement compilation
+        replay(lambda prefix: service.get_items(limit=20, search=prefix))
+
+        print(f"{'ms':<10}{'p50':>10}{'p95':>10}{'max':>10}")
+        p95 = report("search", replay(lambda prefix: service.get_items(limit=20, search=prefix)))
+        if args.legacy:
+            report("legacy", replay(lambda prefix: legacy_search(db, prefix)))
+
+        db.close()
+        engine.dispose()
+
+    print(f"\np95 {p95:.1f} ms (limit {args.max_ms:.1f} ms)")
+    if p95 > args.max_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Memory regression benchmark for SalesService.get_sales_analytics.
+
+For each dataset size, builds a throwaway SQLite database with that many
+sales in a 30 day window (plus the previous window for the growth rate),
+then measures the Python heap peak (tracemalloc) and latency of the
+analytics call. The grouped-SQL implementation should stay flat as the
+number of sales grows; ``--legacy`` also measures the old approach of
+hydrating every Sale to count and sum it in Python.
+
+    python benchmarks/sales_analytics.py --rows 10000 100000 1000000 --legacy
+
+Exits non-zero if the peak of the largest dataset exceeds the smallest one
+by more than ``--max-growth`` times.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import Sale
+from app.services.sales_service import SalesService
+
+PRODUCTS = [f"Product {i}" for i in range(200)]
+WINDOW_DAYS = 30
+CHUNK = 50_000
+
+
+def load_data(engine, rows: int, end: datetime) -> None:
+    rng = random.Random(42)
+    raw = engine.raw_connection()
+    cursor = raw.cursor()
+    span = 2 * WINDOW_DAYS * 86400
+
+    for start in range(0, rows, CHUNK):
+        ids = range(start + 1, min(start + CHUNK, rows) + 1)
+        cursor.executemany(
+            "INSERT INTO sales (id, total_amount, payment_method, created_at) VALUES (?, ?, 'cash', ?)",
+            [(i, round(rng.uniform(5, 300), 2),
+              (end - timedelta(seconds=rng.randint(0, span))).strftime("%Y-%m-%d %H:%M:%S")) for i in ids]
+        )
+        cursor.executemany(
+            "INSERT INTO sale_items (sale_id, product_name, quantity, unit_price, total_price) "
+            "VALUES (?, ?, 1, 10, 10)",
+            [(i, rng.choice(PRODUCTS)) for i in ids]
+        )
+    raw.commit()
+    raw.close()
+
+
+def legacy_analytics(db, start_date: datetime, end_date: datetime) -> dict:
+    sales = db.query(Sale).filter(Sale.created_at >= start_date, Sale.created_at <= end_date).all()
+    total_revenue = sum(sale.total_amount for sale in sales)
+    return {"total_sales": len(sales), "total_revenue": total_revenue}
+
+
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--legacy", action="store_true", help="also measure ORM hydration")
+    parser.add_argument("--max-growth", type=float, default=2.0)
+    args = parser.parse_args()
+
+    end_date = datetime.now().replace(microsecond=0)
+    start_date = end_date - timedelta(days=WINDOW_DAYS)
+    peaks = []
+
+    print(f"{'sales':>10}{'analytics ms':>14}{'peak KiB':>10}" + (f"{'legacy ms':>12}{'legacy KiB':>12}" if args.legacy else ""))
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            Base.metadata.create_all(engine)
+            load_data(engine, rows, end_date)
+            db = sessionmaker(bind=engine)()
+
+            # Warm up once so imports and statement compilation are not counted
+            SalesService(db).get_sales_analytics(start_date, end_date)
+            result, elapsed, peak = measure(lambda: SalesService(db).get_sales_analytics(start_date, end_date))
+            peaks.append(peak)
+            line = f"{result['total_sales']:>10}{elapsed * 1000:>14.1f}{peak / 1024:>10.0f}"
+
+            if args.legacy:
+                db.expunge_all()
+                _, legacy_elapsed, legacy_peak = measure(lambda: legacy_analytics(db, start_date, end_date))
+                line += f"{legacy_elapsed * 1000:>12.1f}{legacy_peak / 1024:>12.0f}"
+            print(line)
+
+            db.close()
+            engine.dispose()
+
+    growth = peaks[-1] / peaks[0]
+    print(f"\npeak memory growth {growth:.2f}x (limit {args.max_growth:.1f}x)")
+    if growth > args.max_growth:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
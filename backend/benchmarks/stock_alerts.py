@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Bulk stock alert evaluation over a large catalog.
+
+Loads ``--products`` synthetic products into a StockAlertsService backed by
+a throwaway SQLite alert store, then times a bulk check with every product
+changing stock, a steady-state bulk check after a batch of stock updates,
+stock predictions and analytics.
+
+    python benchmarks/stock_alerts.py --products 100000
+
+Exits non-zero if the steady-state bulk check exceeds ``--max-ms``.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.services.stock_alerts_service import Product, StockAlertStore, StockAlertsService
+
+UPDATES = 1000
+
+
+def make_products(count: int, rng: random.Random) -> list:
+    products = []
+    for i in range(count):
+        min_stock = rng.randint(5, 30)
+        products.append(Product(
+            id=f"prod_{i}",
+            name=f"Product {i}",
+            current_stock=rng.randint(0, 120),
+            min_stock=min_stock,
+            reorder_point=min_stock + rng.randint(0, 20),
+            max_stock=rng.choice([None, 100, 150]),
+            unit_cost=round(rng.uniform(0.5, 50), 2),
+            daily_sales_avg=round(rng.uniform(0, 5), 2)
+        ))
+    return products
+
+
+def timed(label: str, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{label:<28}{elapsed:>10.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--max-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'alerts.db')}")
+        Base.metadata.create_all(engine)
+        service = StockAlertsService(store=StockAlertStore(sessionmaker(bind=engine)))
+        products = make_products(args.products, rng)
+        service.products.update((product.id, product) for product in products)
+
+        timed("snapshot load", lambda: service.snapshot.update(products))
+        timed("first bulk check", lambda: asyncio.run(service.bulk_check_alerts()))
+        timed("idle bulk check", lambda: asyncio.run(service.bulk_check_alerts()))
+        timed(f"{UPDATES} stock updates", lambda: service.update_stock_levels([
+            {"product_id": f"prod_{rng.randrange(args.products)}", "current_stock": rng.randint(0, 120)}
+            for _ in range(UPDATES)
+        ]))
+        steady = timed("idle bulk check", lambda: asyncio.run(service.bulk_check_alerts()))
+        timed("stock predictions", lambda: service.get_stock_predictions())
+        timed("stock analytics", lambda: service.get_stock_analytics())
+
+        engine.dispose()
+
+    print(f"\nsteady-state bulk check {steady:.1f} ms (limit {args.max_ms:.1f} ms)")
+    if steady > args.max_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import uvicorn
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.core.database import create_tables
+from app.core.database import create_tables, engine, async_engine
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.services.forecasting import shutdown_forecast_pool
+from app.services.inventory_valuation_service import run_valuation_reconciler
+from app.services.item_lookup_cache import warm_item_lookup_cache
+from app.services.stock_alerts_service import stock_alerts_service, run_alert_scheduler
 
 app = FastAPI(
     title="BusinessPilot AI",
@@ -18,11 +24,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 @app.on_event("startup")
 async def startup_event():
     create_tables()
+    await asyncio.to_thread(warm_item_lookup_cache)
+    # Updates the stored alerts rather than duplicating them
+    await stock_alerts_service.bulk_check_alerts()
+    if settings.STOCK_ALERT_CHECK_INTERVAL_SECONDS > 0:
+        app.state.alert_scheduler = asyncio.create_task(run_alert_scheduler(
+            stock_alerts_service,
+            settings.STOCK_ALERT_CHECK_INTERVAL_SECONDS,
+            settings.STOCK_ALERT_CHECK_JITTER_SECONDS
+        ))
+    if settings.INVENTORY_VALUATION_RECONCILE_INTERVAL_SECONDS > 0:
+        app.state.valuation_reconciler = asyncio.create_task(
+            run_valuation_reconciler(settings.INVENTORY_VALUATION_RECONCILE_INTERVAL_SECONDS)
+        )
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    for task_name in ("valuation_reconciler", "alert_scheduler"):
+        task = getattr(app.state, task_name, None)
+        if task:
+            task.cancel()
+    shutdown_forecast_pool()
+    await async_engine.dispose()
+    engine.dispose()
 
 @app.get("/")
 async def root():
@@ -0,0 +1,72 @@
+"""Query counts of listings that used to load relationships row by row."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.core.query_counter import QueryCounter, assert_max_queries
+from app.models.employee import Employee, Schedule
+from app.models.sales import Sale, SaleItem
+from app.schemas.sales import SaleResponse
+from app.services.employee_service import EmployeeService
+from app.services.sales_service import SalesService
+
+SALES = 100
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'eager.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_sales_page_loads_items_in_one_query(engine, db):
+    for i in range(SALES):
+        db.add(Sale(total_amount=20.0, payment_method="cash", items=[
+            SaleItem(product_name="Coffee", quantity=1, unit_price=10.0, total_price=10.0),
+            SaleItem(product_name="Sugar", quantity=2, unit_price=5.0, total_price=10.0),
+        ]))
+    db.commit()
+    db.expunge_all()
+
+    # The sales, then all of their items
+    with assert_max_queries(engine, 2):
+        page = [SaleResponse.model_validate(sale) for sale in SalesService(db).get_sales(limit=SALES)]
+
+    assert len(page) == SALES
+    assert all(len(sale.items) == 2 for sale in page)
+
+
+def test_payroll_summary_query_count_is_fixed(engine, db):
+    start = date(2026, 10, 5)
+    for i in range(3):
+        employee = Employee(full_name=f"Employee {i}", email=f"employee{i}@example.com",
+                            position="Cashier", hourly_rate=15.0 + i, hire_date=date(2026, 1, 1))
+        db.add(employee)
+        for day in range(5):
+            db.add(Schedule(employee=employee, date=start + timedelta(days=day),
+                            start_time="09:00", end_time="17:00", hours=8.0))
+    db.commit()
+    db.expunge_all()
+
+    with QueryCounter(engine) as counter:
+        summary = EmployeeService(db).get_payroll_summary(datetime(2026, 10, 5), datetime(2026, 10, 11))
+
+    # Schedules with their employees joined in
+    assert counter.count == 1
+    assert summary["summary"]["total_hours"] == 3 * 5 * 8.0
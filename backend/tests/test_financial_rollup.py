@@ -0,0 +1,75 @@
+"""daily_financials kept in step with sale and expense writes."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.models.finance import DailyFinancial, ExpenseCategory
+from app.schemas.finance import ExpenseCreate, ExpenseUpdate
+from app.schemas.sales import SaleCreate, SaleItemCreate, SaleUpdate
+from app.services.finance_service import FinanceService
+from app.services.financial_rollup_service import FinancialRollupService
+from app.services.sales_service import SalesService
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollup.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def rollup_rows(db) -> list:
+    rows = db.execute(select(
+        DailyFinancial.day, DailyFinancial.category, DailyFinancial.revenue, DailyFinancial.expenses,
+        DailyFinancial.sales_count, DailyFinancial.expense_count
+    ).order_by(DailyFinancial.day, DailyFinancial.category)).all()
+    # Rows whose bookings were all retracted count as absent
+    return [
+        (day, category, round(revenue, 2), round(expenses, 2), sales_count, expense_count)
+        for day, category, revenue, expenses, sales_count, expense_count in rows
+        if sales_count or expense_count
+    ]
+
+
+def sale(amount: float) -> SaleCreate:
+    return SaleCreate(total_amount=amount, payment_method="cash", items=[
+        SaleItemCreate(product_name="Coffee", quantity=1, unit_price=amount, total_price=amount)
+    ])
+
+
+def expense(amount: float, day: int, category=ExpenseCategory.RENT) -> ExpenseCreate:
+    return ExpenseCreate(description="Expense", amount=amount, category=category, date=datetime(2026, 10, day, 12))
+
+
+def test_writes_match_a_rebuild(db):
+    sales = SalesService(db)
+    kept = [sales.create_sale(sale(amount)) for amount in (12.5, 30.0, 7.25)]
+    sales.update_sale(kept[0].id, SaleUpdate(total_amount=15.0))
+    sales.delete_sale(kept[1].id)
+
+    finance = FinanceService(db)
+    rent = finance.create_expense(expense(800.0, 1))
+    utilities = finance.create_expense(expense(120.0, 2, ExpenseCategory.UTILITIES))
+    finance.create_expense(expense(60.0, 2, ExpenseCategory.UTILITIES))
+    # Moves the booking to another day and category
+    finance.update_expense(rent.id, ExpenseUpdate(amount=850.0, category=ExpenseCategory.MARKETING,
+                                                  date=datetime(2026, 10, 3, 9)))
+    finance.delete_expense(utilities.id)
+
+    booked = rollup_rows(db)
+    FinancialRollupService(db).rebuild()
+
+    assert booked == rollup_rows(db)
+    assert {category: (revenue, expenses) for _, category, revenue, expenses, _, _ in booked} == {
+        "sales": (22.25, 0.0), "marketing": (0.0, 850.0), "utilities": (0.0, 60.0)
+    }
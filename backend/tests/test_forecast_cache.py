@@ -0,0 +1,53 @@
+"""Forecast cache misses and staleness."""
+
+import threading
+import time
+
+import pytest
+
+from app.services.forecast_cache import ForecastCache
+
+REQUESTS = 8
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ForecastCache(cache_dir=str(tmp_path), max_age_seconds=3600, refit_min_new_points=2)
+
+
+def test_concurrent_misses_fit_once(cache):
+    fits = []
+    results = []
+    start = threading.Barrier(REQUESTS)
+
+    def fit():
+        fits.append(1)
+        time.sleep(0.2)
+        return [{"ds": "2026-10-18", "yhat": 1.0}], None
+
+    def request():
+        start.wait()
+        results.append(cache.get_or_fit("tenant", "sales", 7, (10, "2026-10-17"), fit))
+
+    threads = [threading.Thread(target=request) for _ in range(REQUESTS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(fits) == 1
+    assert results == [[{"ds": "2026-10-18", "yhat": 1.0}]] * REQUESTS
+    assert ForecastCache._fit_locks == {}
+
+
+def test_staleness_follows_the_last_observation(cache):
+    cache.store("tenant", "sales", 7, (10, "2026-10-10"), [], None)
+    entry = cache.get("tenant", "sales", 7)
+
+    assert not cache.is_stale(entry, 10, "2026-10-10")
+    assert not cache.is_stale(entry, 11, "2026-10-11")
+    # Same number of observations, but the series moved on two days
+    assert cache.is_stale(entry, 10, "2026-10-12")
+    # History was removed
+    assert cache.is_stale(entry, 10, "2026-10-09")
+    assert cache.is_stale(entry, 0, None)
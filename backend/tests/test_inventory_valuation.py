@@ -0,0 +1,62 @@
+"""Trigger-maintained inventory_valuation counters against a recount."""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.models.inventory import InventoryItem
+from app.services.inventory_service import InventoryService
+from app.services.inventory_valuation_service import InventoryValuationService
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'valuation.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        InventoryItem(name="Coffee", sku="COF", category="Beverages", current_stock=10, unit_cost=4.0, selling_price=7.5),
+        InventoryItem(name="Tea", sku="TEA", category="Beverages", current_stock=4, unit_cost=2.0, selling_price=3.0),
+        InventoryItem(name="Sugar", sku="SUG", category="Pantry", current_stock=20, unit_cost=0.5, selling_price=1.2),
+        InventoryItem(name="Napkins", sku="NAP", category=None, current_stock=None, unit_cost=1.0, selling_price=2.0),
+    ])
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def test_writes_leave_no_drift(db):
+    service = InventoryService(db)
+    service.update_stock_batch([("COF", -3), ("SUG", -25), ("NAP", 8), ("TEA", 2)])
+    service.update_stock(db.query(InventoryItem).filter_by(sku="TEA").one().id, 1, "set")
+
+    sugar = db.query(InventoryItem).filter_by(sku="SUG").one()
+    sugar.category = "Beverages"
+    sugar.unit_cost = 0.75
+    db.add(InventoryItem(name="Flour", sku="FLO", category="Pantry", current_stock=6, unit_cost=1.1, selling_price=2.0))
+    db.delete(db.query(InventoryItem).filter_by(sku="TEA").one())
+    db.commit()
+
+    result = InventoryValuationService(db).reconcile(fix=False)
+
+    assert result["drift"] == []
+    totals = InventoryValuationService(db).get_category_totals()
+    assert totals["Beverages"]["total_quantity"] == 7
+    assert totals["Pantry"]["cost_value"] == pytest.approx(6.6)
+    assert totals[""]["cost_value"] == pytest.approx(8.0)
+
+
+def test_reconcile_repairs_drift(db):
+    db.execute(text("UPDATE inventory_valuation SET cost_value = cost_value + 100 WHERE category = 'Pantry'"))
+    db.commit()
+    valuation = InventoryValuationService(db)
+
+    drift = valuation.reconcile(fix=True)["drift"]
+
+    assert [(row["category"], row["field"], row["difference"]) for row in drift] == [("Pantry", "cost_value", 100.0)]
+    assert valuation.reconcile(fix=False)["drift"] == []
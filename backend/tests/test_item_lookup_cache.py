@@ -0,0 +1,100 @@
+"""SKU and barcode lookup cache."""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.models.inventory import InventoryItem
+from app.services.inventory_service import InventoryService
+from app.services.item_lookup_cache import ItemLookupCache, item_lookup_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_item(item_id: int, sku: str, barcode: str = None, stock: int = 5) -> InventoryItem:
+    return InventoryItem(id=item_id, name=f"Item {item_id}", sku=sku, barcode=barcode, current_stock=stock,
+                         minimum_stock=0, maximum_stock=100, unit_cost=1.0, selling_price=2.0,
+                         is_active=True, created_at=datetime(2026, 10, 1))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ItemLookupCache(max_size=4, ttl_seconds=60, clock=clock)
+
+
+def test_put_after_an_invalidation_is_not_cached(cache):
+    # A lookup read the generation, then a write invalidated before it cached what it loaded
+    generation = cache.generation
+    cache.invalidate_items([1])
+
+    snapshot = cache.put(make_item(1, "COF"), generation)
+
+    assert snapshot.sku == "COF"
+    assert cache.get("sku", "COF") is None
+
+
+def test_invalidation_drops_sku_and_barcode(cache):
+    cache.put(make_item(1, "COF", "4001"), cache.generation)
+    assert cache.get("barcode", "4001").id == 1
+
+    cache.invalidate_items([1])
+
+    assert cache.get("sku", "COF") is None
+    assert cache.get("barcode", "4001") is None
+
+
+def test_entries_expire_and_least_recently_used_are_evicted(cache, clock):
+    for item_id in range(1, 5):
+        cache.put(make_item(item_id, f"SKU{item_id}"), cache.generation)
+    cache.get("sku", "SKU1")
+    cache.put(make_item(5, "SKU5"), cache.generation)
+
+    assert cache.get("sku", "SKU2") is None
+    assert cache.get("sku", "SKU1") is not None
+
+    clock.now += 61
+    assert cache.get("sku", "SKU1") is None
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'lookup.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(InventoryItem(name="Coffee", sku="COF", barcode="4001", current_stock=5))
+    session.commit()
+    item_lookup_cache.clear()
+    try:
+        yield session
+    finally:
+        item_lookup_cache.clear()
+        session.close()
+        engine.dispose()
+
+
+def test_stock_updates_invalidate_cached_lookups(db):
+    service = InventoryService(db)
+    assert service.get_item_by_sku("COF").current_stock == 5
+    assert service.get_item_by_barcode("4001") is item_lookup_cache.get("barcode", "4001")
+
+    service.update_stock_batch([("COF", 3)])
+    assert service.get_item_by_sku("COF").current_stock == 8
+
+    service.update_stock(service.get_item_by_sku("COF").id, 1, "set")
+    assert service.get_item_by_barcode("4001").current_stock == 1
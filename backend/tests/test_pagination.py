@@ -0,0 +1,73 @@
+"""Keyset pagination over rows that share a created_at timestamp."""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.core.pagination import next_cursor
+from app.models.assistant import ChatHistory
+from app.schemas.sales import SaleCreate, SaleItemCreate
+from app.services.assistant_service import AssistantService, CHAT_PAGE_KEYS
+from app.services.sales_service import SalesService, SALE_PAGE_KEYS
+
+PAGE_SIZE = 2
+ROWS = 5
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pagination.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def share_timestamp(db, table: str) -> None:
+    # Every row gets the first row's stored value, in whatever format it was written
+    db.execute(text(f"UPDATE {table} SET created_at = (SELECT MIN(created_at) FROM {table})"))
+    db.commit()
+
+
+def follow_cursors(fetch, keys) -> list:
+    ids, cursor = [], None
+    # More pages than needed, so a cursor that does not advance fails instead of looping
+    for _ in range(ROWS + 1):
+        rows = fetch(cursor)
+        ids.extend(row.id for row in rows)
+        cursor = next_cursor(rows, PAGE_SIZE, keys)
+        if cursor is None:
+            return ids
+    pytest.fail(f"cursor did not advance, pages so far: {ids}")
+
+
+def test_sales_pages_past_rows_sharing_a_timestamp(db):
+    service = SalesService(db)
+    for _ in range(ROWS):
+        service.create_sale(SaleCreate(
+            total_amount=10.0,
+            payment_method="cash",
+            items=[SaleItemCreate(product_name="Coffee", quantity=1, unit_price=10.0, total_price=10.0)]
+        ))
+    share_timestamp(db, "sales")
+
+    ids = follow_cursors(lambda cursor: service.get_sales(limit=PAGE_SIZE, cursor=cursor), SALE_PAGE_KEYS)
+
+    assert ids == [5, 4, 3, 2, 1]
+
+
+def test_chat_history_pages_past_rows_sharing_a_timestamp(db):
+    for i in range(ROWS):
+        db.add(ChatHistory(message=f"question {i}", response=f"answer {i}"))
+        db.commit()
+    share_timestamp(db, "chat_messages")
+    service = AssistantService(db)
+
+    ids = follow_cursors(lambda cursor: service.get_chat_history(limit=PAGE_SIZE, cursor=cursor), CHAT_PAGE_KEYS)
+
+    assert ids == [5, 4, 3, 2, 1]
@@ -0,0 +1,77 @@
+"""daily_product_sales counters, exact and as a Space-Saving sketch."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.models.sales import DailyProductSales
+from app.schemas.sales import SaleCreate, SaleItemCreate
+from app.services.product_rollup_service import ProductSalesRollupService
+from app.services.sales_service import SalesService
+
+DAY = date(2026, 10, 1)
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'products.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def counters(db) -> list:
+    rows = db.execute(select(
+        DailyProductSales.day, DailyProductSales.product_name, DailyProductSales.quantity, DailyProductSales.revenue
+    ).order_by(DailyProductSales.day, DailyProductSales.product_name)).all()
+    return [(day, name, quantity, round(revenue, 2)) for day, name, quantity, revenue in rows if quantity]
+
+
+def item(name: str, quantity: int, price: float):
+    return SimpleNamespace(product_name=name, quantity=quantity, total_price=quantity * price)
+
+
+def test_sale_writes_match_a_rebuild(db):
+    service = SalesService(db)
+    sales = [
+        service.create_sale(SaleCreate(total_amount=25.0, payment_method="cash", items=[
+            SaleItemCreate(product_name=name, quantity=quantity, unit_price=5.0, total_price=quantity * 5.0)
+            for name, quantity in items
+        ]))
+        for items in ([("Coffee", 3), ("Sugar", 2)], [("Coffee", 1)], [("Milk", 4), ("Sugar", 1)])
+    ]
+    service.delete_sale(sales[0].id)
+
+    booked = counters(db)
+    ProductSalesRollupService(db).rebuild()
+
+    assert booked == counters(db)
+    assert {name: quantity for _, name, quantity, _ in booked} == {"Coffee": 1, "Milk": 4, "Sugar": 1}
+
+
+def test_full_day_evicts_the_smallest_counter(db):
+    rollup = ProductSalesRollupService(db, sketch_capacity=2)
+    sold = {"Coffee": 100.0, "Sugar": 10.0, "Milk": 30.0}
+    rollup.record_items(DAY, [item("Coffee", 10, 10.0), item("Sugar", 2, 5.0)])
+    rollup.record_items(DAY, [item("Milk", 3, 10.0)])
+    db.commit()
+
+    rows = {row.product_name: row for row in db.scalars(select(DailyProductSales))}
+    assert set(rows) == {"Coffee", "Milk"}
+    # Milk took over Sugar's counter and inherited its revenue as error
+    assert (rows["Milk"].revenue, rows["Milk"].error) == (40.0, 10.0)
+
+    top = ProductSalesRollupService(db).top_products(DAY, DAY, limit=10)
+    assert [row.product_name for row in top] == ["Coffee", "Milk"]
+    for row in top:
+        # Space-Saving bounds: never under, and over by at most the error
+        assert row.total_revenue - row.error <= sold[row.product_name] <= row.total_revenue
@@ -0,0 +1,66 @@
+"""Timestamps of bulk-inserted sales."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.models.finance import DailyFinancial
+from app.schemas.sales import SaleBulkCreate, SaleCreate, SaleItemCreate
+from app.services.financial_rollup_service import SALES_CATEGORY
+from app.services.sales_service import SalesService
+
+ITEMS = [SaleItemCreate(product_name="Coffee", quantity=1, unit_price=10.0, total_price=10.0)]
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'sales.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def bulk_sale(receipt_id: str, created_at=None) -> SaleBulkCreate:
+    return SaleBulkCreate(receipt_id=receipt_id, total_amount=10.0, payment_method="cash",
+                          items=ITEMS, created_at=created_at)
+
+
+def stored_created_at(db, receipt_id: str) -> str:
+    return db.execute(text("SELECT created_at FROM sales WHERE receipt_id = :r"), {"r": receipt_id}).scalar_one()
+
+
+def test_bulk_sales_are_stored_in_utc(db):
+    athens = timezone(timedelta(hours=3))
+    SalesService(db).bulk_insert_sales([
+        (1, bulk_sale("aware", datetime(2026, 3, 1, 1, 30, tzinfo=athens))),
+        (2, bulk_sale("naive", datetime(2026, 3, 1, 1, 30))),
+    ])
+
+    assert stored_created_at(db, "aware") == "2026-02-28 22:30:00.000000"
+    assert stored_created_at(db, "naive") == "2026-03-01 01:30:00.000000"
+    # The aware sale is booked on its UTC day
+    days = dict(db.execute(select(DailyFinancial.day, DailyFinancial.sales_count).where(
+        DailyFinancial.category == SALES_CATEGORY
+    )).all())
+    assert {day.isoformat(): count for day, count in days.items()} == {"2026-02-28": 1, "2026-03-01": 1}
+
+
+def test_bulk_and_single_sales_share_a_clock(db):
+    service = SalesService(db)
+    service.bulk_insert_sales([(1, bulk_sale("bulk"))])
+    single = service.create_sale(SaleCreate(total_amount=10.0, payment_method="cash", items=ITEMS))
+
+    bulk_at = datetime.fromisoformat(stored_created_at(db, "bulk"))
+    single_at = datetime.fromisoformat(db.execute(
+        text("SELECT created_at FROM sales WHERE id = :id"), {"id": single.id}
+    ).scalar_one())
+    assert timedelta(0) <= single_at - bulk_at < timedelta(minutes=1)
+    assert abs(bulk_at - datetime.now(timezone.utc).replace(tzinfo=None)) < timedelta(minutes=1)
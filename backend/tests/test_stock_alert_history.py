@@ -0,0 +1,69 @@
+"""Compaction of old stock alert history into daily counts."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.models.stock_alerts import StockAlertDailySummary, StockAlertRecord
+from app.services.stock_alerts_service import StockAlertStore, StockAlertsService
+
+RAISED_DAYS_AGO = 200
+
+
+@pytest.fixture
+def service(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'alerts.db'}")
+    Base.metadata.create_all(engine)
+    yield StockAlertsService(store=StockAlertStore(sessionmaker(bind=engine)))
+    engine.dispose()
+
+
+def age_and_close_alerts(service) -> int:
+    raised_at = datetime.now() - timedelta(days=RAISED_DAYS_AGO)
+    with service.store.session_factory() as db:
+        db.execute(update(StockAlertRecord).values(
+            created_at=raised_at, day=raised_at.date(), status="resolved"
+        ))
+        db.commit()
+        return db.scalar(select(func.count(StockAlertRecord.id)))
+
+
+def trend_totals(service) -> dict:
+    trend = service.store.get_trend(date.today() - timedelta(days=RAISED_DAYS_AGO + 1))
+    return {point["date"]: point for point in trend if point["total"]}
+
+
+def test_compacting_keeps_trend_totals(service):
+    service.update_stock_levels([{"product_id": product_id, "current_stock": 0} for product_id in service.products])
+    alerts = age_and_close_alerts(service)
+    assert alerts > 0
+    before = trend_totals(service)
+    cutoff = date.today() - timedelta(days=90)
+
+    assert service.store.compact_history(cutoff) == alerts
+    # A second worker compacting the same window finds nothing left to count
+    assert service.store.compact_history(cutoff) == 0
+
+    assert trend_totals(service) == before
+    assert service.store.count_compacted(cutoff - timedelta(days=RAISED_DAYS_AGO)) == alerts
+
+
+def test_compacting_adds_to_existing_counts(service):
+    service.update_stock_levels([{"product_id": product_id, "current_stock": 0} for product_id in service.products])
+    first = age_and_close_alerts(service)
+    cutoff = date.today() - timedelta(days=90)
+    service.store.compact_history(cutoff)
+
+    # New alerts on the same, already compacted day
+    service.update_stock_levels([{"product_id": product_id, "current_stock": 50} for product_id in service.products])
+    service.update_stock_levels([{"product_id": product_id, "current_stock": 0} for product_id in service.products])
+    second = age_and_close_alerts(service)
+    assert second > 0
+    service.store.compact_history(cutoff)
+
+    with service.store.session_factory() as db:
+        assert db.scalar(select(func.sum(StockAlertDailySummary.alert_count))) == first + second
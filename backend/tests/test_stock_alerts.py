@@ -0,0 +1,47 @@
+"""Acknowledging and dismissing persisted stock alerts."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.services.stock_alerts_service import AlertType, StockAlertStore, StockAlertsService
+
+
+@pytest.fixture
+def service(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'alerts.db'}")
+    Base.metadata.create_all(engine)
+    yield StockAlertsService(store=StockAlertStore(sessionmaker(bind=engine)))
+    engine.dispose()
+
+
+def open_low_stock_alert_id(service, product_id: str) -> str:
+    alerts = service.store.get_active(alert_type=AlertType.LOW_STOCK, limit=100)
+    return next(alert.id for alert in alerts if alert.product_id == product_id)
+
+
+def test_closed_alert_cannot_be_reopened(service):
+    service.update_stock_level("prod_milk", 8)
+    old_id = open_low_stock_alert_id(service, "prod_milk")
+    # Back above the minimum resolves it, then going low again opens a new one
+    service.update_stock_level("prod_milk", 18)
+    service.update_stock_level("prod_milk", 8)
+    new_id = open_low_stock_alert_id(service, "prod_milk")
+    assert new_id != old_id
+
+    for result in (service.acknowledge_alert(old_id, "manager"), service.dismiss_alert(old_id, "manager")):
+        assert result["success"] is False
+        assert result["conflict"] is True
+
+    assert service.acknowledge_alert(new_id, "manager")["success"] is True
+    assert service.acknowledge_alert(new_id, "manager")["conflict"] is True
+    assert service.dismiss_alert(new_id, "manager")["success"] is True
+    assert service.dismiss_alert(new_id, "manager")["conflict"] is True
+
+
+def test_unknown_alert_is_not_found(service):
+    result = service.acknowledge_alert("999999", "manager")
+
+    assert result == {"success": False, "error": "Alert not found"}
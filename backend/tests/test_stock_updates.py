@@ -0,0 +1,70 @@
+"""Atomic single and batch stock adjustments."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  registers every table on Base
+from app.core.database import Base
+from app.core.query_counter import QueryCounter
+from app.models.inventory import InventoryItem
+from app.services.inventory_service import InventoryService
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stock.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        InventoryItem(name="Coffee", sku="COF", current_stock=5),
+        InventoryItem(name="Sugar", sku="SUG", current_stock=3),
+        InventoryItem(name="Milk", sku="MLK", current_stock=None),
+    ])
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def stock(db) -> dict:
+    return {item.sku: item.current_stock for item in db.query(InventoryItem).populate_existing()}
+
+
+def test_batch_sums_deltas_per_sku_and_clamps_at_zero(engine, db):
+    with QueryCounter(engine) as counter:
+        result = InventoryService(db).update_stock_batch([
+            ("COF", 4), ("SUG", -10), ("COF", -2), ("MLK", 6), ("NOPE", 1)
+        ])
+
+    assert sum(statement.lstrip().upper().startswith("UPDATE") for statement in counter.statements) == 1
+    assert stock(db) == {"COF": 7, "SUG": 0, "MLK": 6}
+    assert {item.sku: item.current_stock for item in result["updated"]} == {"COF": 7, "SUG": 0, "MLK": 6}
+    assert result["not_found"] == ["NOPE"]
+
+
+@pytest.mark.parametrize("operation, quantity, expected", [
+    ("add", 4, 9),
+    ("subtract", 2, 3),
+    ("subtract", 8, 0),
+    ("set", 12, 12),
+])
+def test_single_update_applies_the_operation(db, operation, quantity, expected):
+    coffee = db.query(InventoryItem).filter_by(sku="COF").one()
+
+    updated = InventoryService(db).update_stock(coffee.id, quantity, operation)
+
+    assert updated.current_stock == expected
+    assert stock(db)["COF"] == expected
+
+
+def test_unknown_operation_is_rejected(db):
+    with pytest.raises(ValueError):
+        InventoryService(db).update_stock(1, 1, "multiply")